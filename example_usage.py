@@ -24,6 +24,9 @@ async def main() -> None:
         timeout_s=config.provider_timeout_s,
         retries=config.provider_retries,
         host="http://localhost:11434",
+        keep_alive=config.ollama_keep_alive,
+        num_ctx=config.ollama_num_ctx,
+        max_concurrency=config.ollama_max_concurrency,
     )
 
     agent = Agent(
@@ -36,7 +39,11 @@ async def main() -> None:
     )
 
     engine = Engine(max_iterations=config.max_iterations, max_retries=config.max_retries, logger=logger)
-    result = await engine.run(agent, initial_input="Create the app code and explain it briefly.")
+    result = await engine.run(
+        agent,
+        initial_input="Create the app code and explain it briefly.",
+        deadline=config.run_deadline_s,
+    )
     print(result)
 
 
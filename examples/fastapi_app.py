@@ -2,18 +2,55 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
-from pydantic import BaseModel, Field
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, Query, Response
+from pydantic import AnyHttpUrl, BaseModel, Field
 
 from forgeai.agent.base import Agent
+from forgeai.config import ForgeAIConfig
 from forgeai.engine.engine import Engine
+from forgeai.engine.jobs import JobManager
+from forgeai.engine.scheduler import QueueFull
 from forgeai.memory.short_term import ShortTermMemory
 from forgeai.observability.logger import get_logger
+from forgeai.observability.registry import CONTENT_TYPE, REGISTRY
 from forgeai.providers.factory import create_provider
+from forgeai.providers.ollama_provider import OllamaProvider
 from forgeai.tools.python_tool import PythonTool
 
-app = FastAPI(title="forgeai API", version="0.1.0")
 logger = get_logger("forgeai-api")
+config = ForgeAIConfig.from_env()
+# Applied to Ollama providers only; the factory drops options other providers do not take.
+provider_options: dict[str, Any] = {
+    "keep_alive": config.ollama_keep_alive,
+    "num_ctx": config.ollama_num_ctx,
+    "max_concurrency": config.ollama_max_concurrency,
+}
+jobs = JobManager(
+    max_concurrency=int(os.getenv("FORGEAI_JOB_CONCURRENCY", "32")),
+    max_pending=int(os.getenv("FORGEAI_JOB_QUEUE", "256")),
+    callback_allowed_hosts=[
+        host for host in os.getenv("FORGEAI_CALLBACK_ALLOWED_HOSTS", "").split(",") if host
+    ],
+    logger=logger,
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if config.default_provider == "ollama":
+        # Load the default model before serving so the first request skips the cold load.
+        warmup = await default_provider().warmup()
+        logger.info("ollama_warmup", extra={"extra_data": warmup})
+    yield
+    await jobs.close()
+
+
+app = FastAPI(title="forgeai API", version="0.1.0", lifespan=lifespan)
 
 
 class RunRequest(BaseModel):
@@ -26,14 +63,24 @@ class RunResponse(BaseModel):
     result: str
 
 
-@app.get("/health")
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+class JobRequest(RunRequest):
+    callback_url: AnyHttpUrl | None = Field(
+        default=None, description="http(s) URL that receives the final job status as a JSON POST."
+    )
 
 
-@app.post("/run", response_model=RunResponse)
-async def run_agent(payload: RunRequest) -> RunResponse:
-    provider = create_provider(payload.provider, model=payload.model)
+class JobAccepted(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+
+
+def default_provider() -> OllamaProvider:
+    return OllamaProvider(model=config.default_model, **provider_options)
+
+
+def build_run(provider_name: str, model: str) -> tuple[Engine, Agent]:
+    provider = create_provider(provider_name, model=model, **provider_options)
     agent = Agent(
         name="APIAgent",
         role="Production assistant",
@@ -42,6 +89,74 @@ async def run_agent(payload: RunRequest) -> RunResponse:
         memory=ShortTermMemory(max_entries=20),
         provider=provider,
     )
-    engine = Engine(max_iterations=2, max_retries=1, logger=logger)
-    result = await engine.run(agent, initial_input=payload.prompt)
+    return Engine(max_iterations=2, max_retries=1, logger=logger), agent
+
+
+@app.get("/health")
+async def health() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready(response: Response) -> dict[str, Any]:
+    """Readiness probe: 503 until the default Ollama model is loaded."""
+    if config.default_provider != "ollama":
+        return {"ready": True}
+    status = await default_provider().health()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus scrape endpoint for process-wide forgeai metrics."""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@app.post("/run", response_model=RunResponse)
+async def run_agent(payload: RunRequest) -> RunResponse:
+    engine, agent = build_run(payload.provider, payload.model)
+    result = await engine.run(agent, initial_input=payload.prompt, deadline=config.run_deadline_s)
     return RunResponse(result=result)
+
+
+@app.post("/jobs", response_model=JobAccepted, status_code=202)
+async def submit_job(payload: JobRequest) -> JobAccepted:
+    """Queue a run and return immediately; poll `status_url` or wait for the callback."""
+    engine, agent = build_run(payload.provider, payload.model)
+    try:
+        record = jobs.submit(
+            engine,
+            agent,
+            initial_input=payload.prompt,
+            deadline=config.run_deadline_s,
+            callback_url=str(payload.callback_url) if payload.callback_url else None,
+            metadata={"provider": payload.provider, "model": payload.model},
+        )
+    except QueueFull as exc:
+        raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "1"}) from exc
+    return JobAccepted(job_id=record.id, status=record.status, status_url=f"/jobs/{record.id}")
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(
+    job_id: str,
+    wait: float = Query(default=0.0, ge=0.0, le=30.0, description="Long-poll seconds."),
+) -> dict[str, Any]:
+    record = await jobs.wait(job_id, timeout_s=wait) if wait else jobs.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="unknown job")
+    return record.to_dict()
+
+
+@app.delete("/jobs/{job_id}", status_code=202)
+async def cancel_job(job_id: str) -> dict[str, Any]:
+    if not jobs.cancel(job_id):
+        raise HTTPException(status_code=409, detail="job is unknown or already finished")
+    return {"job_id": job_id, "cancelled": True}
+
+
+@app.get("/jobs")
+async def job_overview() -> dict[str, Any]:
+    return jobs.snapshot()
@@ -2,6 +2,7 @@
 
 from forgeai.agent.base import Agent
 from forgeai.config import ForgeAIConfig
+from forgeai.deadline import Deadline, DeadlineExceeded
 from forgeai.engine.engine import Engine
 from forgeai.memory.short_term import ShortTermMemory
 from forgeai.observability.logger import bind_logger, get_logger
@@ -12,14 +13,16 @@ from forgeai.providers.deepseek_provider import DeepSeekProvider
 from forgeai.providers.factory import create_provider
 from forgeai.providers.gemini_provider import GeminiProvider
 from forgeai.providers.grok_provider import GrokProvider
-from forgeai.providers.openai_provider import OpenAIProvider
 from forgeai.providers.ollama_provider import OllamaProvider
+from forgeai.providers.openai_provider import OpenAIProvider
 from forgeai.tools.python_tool import PythonTool
 
 __all__ = [
     "Agent",
     "AgentTeam",
     "AnthropicProvider",
+    "Deadline",
+    "DeadlineExceeded",
     "DeepSeekProvider",
     "Engine",
     "ForgeAIConfig",
@@ -3,18 +3,31 @@
 from __future__ import annotations
 
 import ast
-import json
 import re
-from typing import Sequence
+import time
+from collections.abc import Sequence
 
+from pydantic import ValidationError
+
+from forgeai.deadline import Deadline, check_deadline, deadline_scope, resolve_deadline
 from forgeai.memory.base import BaseMemory
-from forgeai.providers.base import BaseProvider
+from forgeai.observability.registry import PROVIDER_LATENCY, PROVIDER_REQUESTS
+from forgeai.observability.tracing import span
+from forgeai.providers.base import FALLBACK_MARKER, BaseProvider
 from forgeai.schemas.agent_schema import AgentResponse, ToolCall
 from forgeai.tools.base import BaseTool
+from forgeai.tools.output import truncate_middle
+
+_JSON_OBJECT = re.compile(r"\{.*\}", flags=re.DOTALL)
 
 
 class Agent:
-    """Autonomous agent with tools, memory, and provider-backed reasoning."""
+    """
+    Autonomous agent with tools, memory, and provider-backed reasoning.
+
+    Tool results longer than `max_tool_result_chars` keep only their beginning and end
+    before they are stored in memory and spliced into the follow-up prompt.
+    """
 
     def __init__(
         self,
@@ -24,6 +37,7 @@ class Agent:
         tools: Sequence[BaseTool],
         memory: BaseMemory,
         provider: BaseProvider,
+        max_tool_result_chars: int = 8000,
     ) -> None:
         self.name = name
         self.role = role
@@ -31,12 +45,18 @@ class Agent:
         self.tools: list[BaseTool] = list(tools)
         self.memory = memory
         self.provider = provider
+        self.max_tool_result_chars = max_tool_result_chars
         self.last_provider_calls = 0
         self.last_tool_calls = 0
+        self.last_prompts: list[str] = []
+        self.last_raw_outputs: list[str] = []
+        self.last_tool_results: list[str] = []
+        self.last_memory_entries: list[str] = []
 
     async def think(self, user_input: str = "") -> str:
         """Build a provider prompt from role, goal, memory, and optional user input."""
-        context = await self.memory.get_context(user_input)
+        with span("memory.get_context", memory=type(self.memory).__name__):
+            context = await self.memory.get_context(user_input)
         tool_list = ", ".join(tool.name for tool in self.tools) or "none"
         return (
             f"Agent: {self.name}\n"
@@ -46,25 +66,16 @@ class Agent:
             f"Available Tools: {tool_list}\n"
             f"Memory:\n{context}\n\n"
             "Respond as JSON with keys: thought (str), "
-            "tool_call ({tool, input}) optional, final (str) optional."
+            "tool_call ({tool, input}) optional, final (str) optional, "
+            "confidence (0-1) optional."
         )
 
     async def act(self, provider_output: str) -> AgentResponse:
         """Parse provider output into a structured response."""
-        candidate = self._extract_json(provider_output)
-        if candidate:
-            validated = self._validate_payload(candidate)
-            if validated:
-                return validated
+        parsed = self._parse_response(provider_output)
+        return parsed if parsed is not None else AgentResponse(final=provider_output)
 
-        try:
-            payload = json.loads(provider_output)
-            parsed = AgentResponse.model_validate(payload)
-            return parsed
-        except Exception:  # noqa: BLE001
-            return AgentResponse(final=provider_output)
-
-    async def run(self, user_input: str = "") -> str:
+    async def run(self, user_input: str = "", deadline: Deadline | float | None = None) -> str:
         """
         Execute one full agent cycle:
         1) Build prompt
@@ -72,79 +83,116 @@ class Agent:
         3) Detect and execute tool call
         4) Persist results in memory
         5) Return final output
+
+        `deadline` (a `Deadline` or a budget in seconds) is visible to providers and tools,
+        which size their timeouts and retries to the time that is left.
         """
+        with deadline_scope(resolve_deadline(deadline)), span("agent.run", agent=self.name):
+            return await self._run(user_input)
+
+    async def _run(self, user_input: str) -> str:
         self.last_provider_calls = 0
         self.last_tool_calls = 0
+        self.last_prompts = []
+        self.last_raw_outputs = []
+        self.last_tool_results = []
+        self.last_memory_entries = []
         if user_input.strip():
-            await self.memory.add(f"UserInput => {user_input}")
+            await self._remember(f"UserInput => {user_input}")
 
-        prompt = await self.think(user_input)
-        raw = await self.provider.generate(prompt)
-        self.last_provider_calls += 1
-        parsed = await self.act(raw)
+        with span("agent.think", agent=self.name):
+            prompt = await self.think(user_input)
+        raw = await self._generate(prompt)
+        parsed = await self._parse(raw)
 
         if parsed.tool_call:
-            tool_result = await self._run_tool(parsed.tool_call)
+            tool_result = truncate_middle(
+                await self._run_tool(parsed.tool_call), self.max_tool_result_chars
+            )
             self.last_tool_calls += 1
-            await self.memory.add(f"Tool[{parsed.tool_call.tool}] => {tool_result}")
+            self.last_tool_results.append(tool_result)
+            await self._remember(f"Tool[{parsed.tool_call.tool}] => {tool_result}")
 
             follow_up_prompt = (
                 f"{prompt}\n\nTool result:\n{tool_result}\n"
                 "Provide final answer as JSON with 'final' key."
             )
-            raw_follow_up = await self.provider.generate(follow_up_prompt)
-            self.last_provider_calls += 1
-            parsed_follow_up = await self.act(raw_follow_up)
+            raw_follow_up = await self._generate(follow_up_prompt)
+            parsed_follow_up = await self._parse(raw_follow_up)
             final = parsed_follow_up.final or raw_follow_up
-            await self.memory.add(final)
+            await self._remember(final)
             return final
 
         final = parsed.final or raw
-        await self.memory.add(final)
+        await self._remember(final)
         return final
 
+    async def _generate(self, prompt: str) -> str:
+        check_deadline()
+        self.last_prompts.append(prompt)
+        provider = type(self.provider).__name__
+        model = str(getattr(self.provider, "model", ""))
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span("provider.generate", provider=provider, prompt_chars=len(prompt)) as active:
+                raw = await self.provider.generate(prompt)
+                active.set_attribute("output_chars", len(raw))
+            outcome = "fallback" if FALLBACK_MARKER in raw else "ok"
+        finally:
+            PROVIDER_LATENCY.observe(time.perf_counter() - started, provider=provider, model=model)
+            PROVIDER_REQUESTS.inc(provider=provider, model=model, agent=self.name, outcome=outcome)
+        self.last_provider_calls += 1
+        self.last_raw_outputs.append(raw)
+        return raw
+
+    async def _parse(self, raw: str) -> AgentResponse:
+        with span("agent.parse", agent=self.name) as active:
+            parsed = await self.act(raw)
+            active.set_attribute("tool_call", parsed.tool_call is not None)
+        return parsed
+
+    async def _remember(self, entry: str) -> None:
+        with span("memory.add", memory=type(self.memory).__name__, chars=len(entry)):
+            await self.memory.add(entry)
+        self.last_memory_entries.append(entry)
+
     async def _run_tool(self, call: ToolCall) -> str:
         for tool in self.tools:
             if tool.name == call.tool:
-                return await tool.run(call.input)
+                check_deadline()
+                with span("tool.run", tool=tool.name, input_chars=len(call.input)) as active:
+                    result = await tool.invoke(call.input)
+                    active.set_attribute("output_chars", len(result))
+                return result
         return f"Tool '{call.tool}' not found."
 
     @staticmethod
-    def _extract_json(content: str) -> dict[str, object] | None:
-        if not content.strip():
-            return None
+    def _parse_response(content: str) -> AgentResponse | None:
+        """
+        Validate provider output as an `AgentResponse`, parsing it only once when possible.
 
-        match = re.search(r"\{.*\}", content, flags=re.DOTALL)
-        if not match:
+        The outermost `{...}` span is validated straight from the string by pydantic's JSON
+        parser; a separate parse only happens for Python-literal dicts.
+        """
+        match = _JSON_OBJECT.search(content)
+        if match is None:
             return None
-
         candidate = match.group(0)
         try:
-            loaded = json.loads(candidate)
-            if isinstance(loaded, dict):
-                return loaded
-            return None
-        except Exception:
-            pass
-
+            return AgentResponse.model_validate_json(candidate)
+        except ValidationError as exc:
+            if exc.errors()[0]["type"] != "json_invalid":
+                return None
         try:
-            loaded_literal = ast.literal_eval(candidate)
-            if isinstance(loaded_literal, dict):
-                return loaded_literal
+            loaded = ast.literal_eval(candidate)
         except Exception:
             return None
-        return None
+        return Agent._validate_payload(loaded) if isinstance(loaded, dict) else None
 
     @staticmethod
     def _validate_payload(payload: dict[str, object]) -> AgentResponse | None:
-        tool_name = payload.get("tool")
-        tool_input = payload.get("tool_input")
-        if tool_name and tool_input and "tool_call" not in payload:
-            payload = {
-                **payload,
-                "tool_call": {"tool": str(tool_name), "input": str(tool_input)},
-            }
         try:
             return AgentResponse.model_validate(payload)
-        except Exception:
+        except ValidationError:
             return None
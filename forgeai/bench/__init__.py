@@ -0,0 +1,6 @@
+"""Benchmark harness for forgeai hot paths (`python -m forgeai.bench`)."""
+
+from forgeai.bench.runner import BenchConfig, BenchResult, percentile
+from forgeai.bench.suites import PARSE_SAMPLES, SUITES, run_benchmarks
+
+__all__ = ["BenchConfig", "BenchResult", "PARSE_SAMPLES", "SUITES", "percentile", "run_benchmarks"]
@@ -0,0 +1,60 @@
+"""Command-line entry point: `python -m forgeai.bench [--suite NAME ...] [--output FILE]`."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from forgeai.bench.runner import BenchConfig
+from forgeai.bench.suites import SUITES, run_benchmarks
+
+
+def _ints(value: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in value.split(",") if part.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m forgeai.bench",
+        description="Benchmark forgeai hot paths and print the results as JSON.",
+    )
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=sorted(SUITES),
+        help="Suite to run (repeatable; default: all).",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file.")
+    parser.add_argument("--quick", action="store_true", help="Run ~10x fewer iterations.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated LLM latency.")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Extra random latency.")
+    parser.add_argument("--concurrency", type=_ints, default=(1, 8, 32), help="e.g. 1,8,32")
+    parser.add_argument("--runs", type=int, default=64, help="Runs per concurrency level.")
+    parser.add_argument("--iterations", type=int, default=2000, help="Microbenchmark loops.")
+    parser.add_argument("--memory-sizes", type=_ints, default=(20, 200, 2000))
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    config = BenchConfig(
+        latency_s=args.latency_ms / 1000,
+        jitter_s=args.jitter_ms / 1000,
+        concurrency=args.concurrency,
+        runs=args.runs,
+        iterations=args.iterations,
+        memory_sizes=args.memory_sizes,
+        seed=args.seed,
+        quick=args.quick,
+    )
+    report = asyncio.run(run_benchmarks(config, args.suite))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    sys.stdout.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
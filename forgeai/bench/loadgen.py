@@ -0,0 +1,321 @@
+"""
+Open-loop load generator for the async job API.
+
+Drives `POST /jobs` of the FastAPI example (or an in-process `JobManager`) at a series of
+request rates, waits for every accepted job, and reports submit and end-to-end latency
+percentiles per rate plus the first rate at which the service saturates:
+
+    python -m forgeai.bench.loadgen --url http://127.0.0.1:8000 --rates 5,10,20,50
+    python -m forgeai.bench.loadgen --in-process --latency-ms 50 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from forgeai.agent.base import Agent
+from forgeai.bench.runner import percentile
+from forgeai.engine.engine import Engine
+from forgeai.engine.jobs import FINISHED_STATES, JobManager
+from forgeai.engine.scheduler import QueueFull
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.simulated import SimulatedProvider
+
+
+class JobTarget(ABC):
+    """Something that accepts jobs: the HTTP API or a `JobManager` in this process."""
+
+    @abstractmethod
+    async def submit(self, prompt: str) -> str | None:
+        """Submit a job and return its id, or None if the service rejected it (429)."""
+
+    @abstractmethod
+    async def wait(self, job_id: str, timeout_s: float) -> dict[str, Any]:
+        """Wait until the job finishes (or `timeout_s` passes) and return its status."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release resources held by the target."""
+
+
+class HttpJobTarget(JobTarget):
+    """Talks to `examples/fastapi_app.py` over HTTP using blocking urllib calls in threads."""
+
+    def __init__(
+        self,
+        url: str,
+        provider: str = "simulated",
+        model: str = "simulated",
+        max_connections: int = 256,
+        request_timeout_s: float = 30.0,
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.provider = provider
+        self.model = model
+        self.request_timeout_s = request_timeout_s
+        self._executor = ThreadPoolExecutor(max_connections, thread_name_prefix="loadgen")
+
+    async def submit(self, prompt: str) -> str | None:
+        body = {"prompt": prompt, "provider": self.provider, "model": self.model}
+        status, payload = await self._call("POST", "/jobs", body)
+        if status == 429:
+            return None
+        if status >= 400:
+            raise RuntimeError(f"submit failed with HTTP {status}: {payload}")
+        return str(payload["job_id"])
+
+    async def wait(self, job_id: str, timeout_s: float) -> dict[str, Any]:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            remaining = deadline - time.monotonic()
+            poll = max(0.0, min(10.0, remaining))
+            status, payload = await self._call("GET", f"/jobs/{job_id}?wait={poll:.2f}")
+            if status >= 400:
+                raise RuntimeError(f"status poll failed with HTTP {status}: {payload}")
+            if payload.get("status") in FINISHED_STATES or remaining <= 0:
+                return payload
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _call(
+        self, method: str, path: str, body: dict[str, Any] | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._request, method, path, body)
+
+    def _request(
+        self, method: str, path: str, body: dict[str, Any] | None
+    ) -> tuple[int, dict[str, Any]]:
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        request = urllib.request.Request(
+            self.url + path,
+            data=data,
+            headers={"Content-Type": "application/json"},
+            method=method,
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.request_timeout_s) as response:
+                return response.status, json.loads(response.read() or b"{}")
+        except urllib.error.HTTPError as exc:
+            try:
+                payload = json.loads(exc.read() or b"{}")
+            except ValueError:
+                payload = {}
+            return exc.code, payload
+
+
+class InProcessJobTarget(JobTarget):
+    """Runs jobs on a local `JobManager` with a `SimulatedProvider`; no server needed."""
+
+    def __init__(
+        self,
+        manager: JobManager | None = None,
+        latency_s: float = 0.05,
+        jitter_s: float = 0.0,
+    ) -> None:
+        self.manager = manager or JobManager()
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self._engine = Engine(max_iterations=2, max_retries=0)
+
+    async def submit(self, prompt: str) -> str | None:
+        agent = Agent(
+            name="loadgen",
+            role="load test",
+            goal="answer",
+            tools=[],
+            memory=ShortTermMemory(max_entries=20),
+            provider=SimulatedProvider(latency_s=self.latency_s, jitter_s=self.jitter_s),
+        )
+        try:
+            return self.manager.submit(self._engine, agent, initial_input=prompt).id
+        except QueueFull:
+            return None
+
+    async def wait(self, job_id: str, timeout_s: float) -> dict[str, Any]:
+        record = await self.manager.wait(job_id, timeout_s=timeout_s)
+        return {"status": "unknown"} if record is None else record.to_dict()
+
+    async def close(self) -> None:
+        await self.manager.close()
+
+
+@dataclass(slots=True)
+class LoadStep:
+    """Outcome of driving one request rate for `duration_s`."""
+
+    offered_rps: float
+    duration_s: float
+    sent: int
+    accepted: int
+    rejected: int
+    completed: int
+    failed: int
+    timed_out: int
+    throughput_rps: float
+    submit_p50_ms: float
+    submit_p95_ms: float
+    submit_p99_ms: float
+    e2e_p50_ms: float
+    e2e_p95_ms: float
+    e2e_p99_ms: float
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.sent if self.sent else 0.0
+
+
+async def run_step(
+    target: JobTarget, rate: float, duration_s: float, timeout_s: float = 60.0
+) -> LoadStep:
+    """Submit jobs at a fixed `rate` (open loop) and wait for all accepted jobs."""
+    submit_ms: list[float] = []
+    e2e_ms: list[float] = []
+    outcomes: dict[str, int] = {"rejected": 0, "done": 0, "failed": 0, "timed_out": 0}
+    finished_at: list[float] = []
+
+    async def one(index: int) -> None:
+        started = time.perf_counter()
+        job_id = await target.submit(f"load test request {index}")
+        submit_ms.append((time.perf_counter() - started) * 1000)
+        if job_id is None:
+            outcomes["rejected"] += 1
+            return
+        status = await target.wait(job_id, timeout_s)
+        state = status.get("status")
+        if state == "done":
+            outcomes["done"] += 1
+            e2e_ms.append((time.perf_counter() - started) * 1000)
+            finished_at.append(time.perf_counter())
+        elif state in FINISHED_STATES:
+            outcomes["failed"] += 1
+        else:
+            outcomes["timed_out"] += 1
+
+    total = max(1, round(rate * duration_s))
+    begin = time.perf_counter()
+    tasks: list[asyncio.Task[None]] = []
+    for index in range(total):
+        # Sleep until the scheduled send time so slow responses never delay arrivals.
+        delay = begin + index / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(index)))
+    await asyncio.gather(*tasks)
+
+    # Completion rate between the first and last completions, so the fixed per-job
+    # latency at the start and end of the step does not dilute steady-state throughput.
+    window = (max(finished_at) - min(finished_at)) if len(finished_at) > 1 else 0.0
+    return LoadStep(
+        offered_rps=rate,
+        duration_s=duration_s,
+        sent=total,
+        accepted=total - outcomes["rejected"],
+        rejected=outcomes["rejected"],
+        completed=outcomes["done"],
+        failed=outcomes["failed"],
+        timed_out=outcomes["timed_out"],
+        throughput_rps=round((len(finished_at) - 1) / window, 3) if window > 0 else 0.0,
+        submit_p50_ms=round(percentile(submit_ms, 50), 3),
+        submit_p95_ms=round(percentile(submit_ms, 95), 3),
+        submit_p99_ms=round(percentile(submit_ms, 99), 3),
+        e2e_p50_ms=round(percentile(e2e_ms, 50), 3),
+        e2e_p95_ms=round(percentile(e2e_ms, 95), 3),
+        e2e_p99_ms=round(percentile(e2e_ms, 99), 3),
+    )
+
+
+def saturation_point(
+    steps: list[LoadStep],
+    max_rejection_rate: float = 0.01,
+    min_throughput_ratio: float = 0.9,
+    max_latency_growth: float = 2.0,
+) -> float | None:
+    """
+    First offered rate at which the service is saturated, or None.
+
+    A step is saturated when it rejects more than `max_rejection_rate` of requests, keeps
+    up with less than `min_throughput_ratio` of the offered rate, or its p95 end-to-end
+    latency grows beyond `max_latency_growth` times the first step's.
+    """
+    baseline = steps[0].e2e_p95_ms if steps else 0.0
+    for step in steps:
+        if (
+            step.rejection_rate > max_rejection_rate
+            or step.throughput_rps < min_throughput_ratio * step.offered_rps
+            or (baseline > 0 and step.e2e_p95_ms > max_latency_growth * baseline)
+        ):
+            return step.offered_rps
+    return None
+
+
+async def run_load(
+    target: JobTarget,
+    rates: list[float],
+    duration_s: float = 10.0,
+    timeout_s: float = 60.0,
+) -> dict[str, Any]:
+    """Run every rate in order and return a JSON-ready report."""
+    steps = []
+    try:
+        for rate in rates:
+            steps.append(await run_step(target, rate, duration_s, timeout_s))
+    finally:
+        await target.close()
+    return {
+        "meta": {"target": type(target).__name__, "rates": rates, "duration_s": duration_s},
+        "steps": [asdict(step) | {"rejection_rate": step.rejection_rate} for step in steps],
+        "saturation_rps": saturation_point(steps),
+    }
+
+
+def _floats(value: str) -> list[float]:
+    return [float(part) for part in value.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m forgeai.bench.loadgen",
+        description="Load-test the async job API and report latency percentiles per rate.",
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of the API.")
+    parser.add_argument("--in-process", action="store_true", help="Skip HTTP; use a JobManager.")
+    parser.add_argument("--rates", type=_floats, default=[5.0, 10.0, 20.0, 50.0, 100.0])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per rate.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Max wait per job.")
+    parser.add_argument("--provider", default="simulated")
+    parser.add_argument("--model", default="simulated")
+    parser.add_argument("--connections", type=int, default=256, help="HTTP client threads.")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="In-process only.")
+    parser.add_argument("--concurrency", type=int, default=32, help="In-process only.")
+    parser.add_argument("--queue", type=int, default=256, help="In-process only.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file.")
+    args = parser.parse_args(argv)
+
+    target: JobTarget
+    if args.in_process:
+        manager = JobManager(max_concurrency=args.concurrency, max_pending=args.queue)
+        target = InProcessJobTarget(manager, latency_s=args.latency_ms / 1000)
+    else:
+        target = HttpJobTarget(args.url, args.provider, args.model, args.connections)
+    report = asyncio.run(run_load(target, args.rates, args.duration, args.timeout))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    sys.stdout.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
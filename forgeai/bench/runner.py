@@ -0,0 +1,129 @@
+"""Measurement helpers and result records for the benchmark suite."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class BenchConfig:
+    """Knobs shared by all benchmarks; `quick` shrinks iteration counts for smoke runs."""
+
+    latency_s: float = 0.02
+    jitter_s: float = 0.005
+    concurrency: tuple[int, ...] = (1, 8, 32)
+    runs: int = 64
+    iterations: int = 2000
+    memory_sizes: tuple[int, ...] = (20, 200, 2000)
+    seed: int = 7
+    quick: bool = False
+
+    def scaled(self, count: int) -> int:
+        return max(1, count // 10) if self.quick else count
+
+
+@dataclass(slots=True)
+class BenchResult:
+    """One measured configuration; latencies are per operation in milliseconds."""
+
+    name: str
+    params: dict[str, Any]
+    ops: int
+    seconds: float
+    ops_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (0 for an empty list)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(
+    name: str,
+    params: dict[str, Any],
+    latencies_ms: list[float],
+    seconds: float,
+    **extra: Any,
+) -> BenchResult:
+    ops = len(latencies_ms)
+    return BenchResult(
+        name=name,
+        params=params,
+        ops=ops,
+        seconds=round(seconds, 6),
+        ops_per_s=round(ops / seconds, 3) if seconds > 0 else 0.0,
+        p50_ms=round(percentile(latencies_ms, 50), 4),
+        p95_ms=round(percentile(latencies_ms, 95), 4),
+        p99_ms=round(percentile(latencies_ms, 99), 4),
+        mean_ms=round(sum(latencies_ms) / ops, 4) if ops else 0.0,
+        extra=extra,
+    )
+
+
+def measure_sync(
+    name: str, params: dict[str, Any], fn: Callable[[], object], iterations: int
+) -> BenchResult:
+    """Call `fn` `iterations` times, timing each call."""
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    return summarize(name, params, latencies, time.perf_counter() - started)
+
+
+async def measure_sequential(
+    name: str,
+    params: dict[str, Any],
+    fn: Callable[[], Awaitable[object]],
+    iterations: int,
+) -> BenchResult:
+    """Await `fn()` `iterations` times back to back, timing each call."""
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await fn()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    return summarize(name, params, latencies, time.perf_counter() - started)
+
+
+async def measure_async(
+    name: str,
+    params: dict[str, Any],
+    fn: Callable[[int], Awaitable[object]],
+    total: int,
+    concurrency: int = 1,
+    **extra: Any,
+) -> BenchResult:
+    """Run `fn(i)` for `total` operations with at most `concurrency` in flight."""
+    latencies: list[float] = []
+    limit = asyncio.Semaphore(concurrency)
+
+    async def timed(index: int) -> None:
+        async with limit:
+            call_started = time.perf_counter()
+            await fn(index)
+            latencies.append((time.perf_counter() - call_started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(index) for index in range(total)))
+    return summarize(name, params, latencies, time.perf_counter() - started, **extra)
@@ -0,0 +1,324 @@
+"""Benchmarks for engine, orchestration, memory, parsing and tool hot paths."""
+
+from __future__ import annotations
+
+import ast
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+from forgeai.agent.base import Agent
+from forgeai.bench.runner import (
+    BenchConfig,
+    BenchResult,
+    measure_async,
+    measure_sequential,
+)
+from forgeai.engine.engine import Engine
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.orchestration.team import AgentTeam
+from forgeai.providers.simulated import SimulatedProvider
+from forgeai.schemas.agent_schema import AgentResponse
+from forgeai.tools.compiler import CodeCache
+from forgeai.tools.python_tool import PythonTool
+
+Suite = Callable[[BenchConfig], Awaitable[list[BenchResult]]]
+
+_WORDS = (
+    "invoice revenue forecast latency cache agent memory python table region quarter "
+    "growth churn margin pipeline customer retry provider budget summary report"
+).split()
+
+# Shapes seen from real providers: bare JSON, fenced JSON with prose, Python-literal
+# dicts, the legacy tool/tool_input form, and plain text without any JSON.
+PARSE_SAMPLES: dict[str, str] = {
+    "json": json.dumps(
+        {
+            "thought": "The user wants the quarterly total; summing the table is enough.",
+            "final": "Q3 revenue was 1.24M, up 8% quarter over quarter.",
+            "confidence": 0.82,
+        }
+    ),
+    "fenced": (
+        "Sure! Here is my answer:\n```json\n"
+        + json.dumps(
+            {
+                "thought": "Need to compute the average first.",
+                "tool_call": {"tool": "python", "input": "print(sum([3, 5, 8]) / 3)"},
+            },
+            indent=2,
+        )
+        + "\n```\nLet me know if you need anything else."
+    ),
+    "literal": (
+        "{'thought': 'Answer directly', 'final': 'Paris is the capital of France.', "
+        "'status': 'completed'}"
+    ),
+    "legacy_tool": json.dumps(
+        {"thought": "Run code", "tool": "python", "tool_input": "print(len('forgeai'))"}
+    ),
+    "plain_text": "The report is ready. Revenue grew 8% and churn fell to 2.1%.",
+}
+
+
+def _sentence(rng: random.Random, words: int = 24) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _agent(name: str, config: BenchConfig, index: int = 0) -> Agent:
+    provider = SimulatedProvider(
+        latency_s=config.latency_s,
+        jitter_s=config.jitter_s,
+        seed=config.seed + index,
+    )
+    return Agent(
+        name=name,
+        role="benchmark",
+        goal="answer quickly",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=provider,
+    )
+
+
+async def bench_engine(config: BenchConfig) -> list[BenchResult]:
+    """`Engine.run` latency and throughput with a simulated provider under concurrency."""
+    results = []
+    total = config.scaled(config.runs)
+    for concurrency in config.concurrency:
+        engine = Engine(max_iterations=1, max_retries=0)
+
+        async def run(index: int, engine: Engine = engine) -> str:
+            return await engine.run(_agent("bench-engine", config, index), f"task {index}")
+
+        results.append(
+            await measure_async(
+                "engine.run",
+                {"concurrency": concurrency, "latency_s": config.latency_s},
+                run,
+                total,
+                concurrency,
+                provider_floor_ms=config.latency_s * 1000,
+            )
+        )
+    return results
+
+
+async def bench_team(config: BenchConfig) -> list[BenchResult]:
+    """`AgentTeam.run` in sequential and graph (fan-out/fan-in) modes."""
+    results = []
+    total = config.scaled(config.runs)
+    layouts: dict[str, dict[str, list[str]] | None] = {
+        "sequential": None,
+        "graph": {
+            "plan": [],
+            "research": ["plan"],
+            "draft": ["plan"],
+            "edit": ["research", "draft"],
+        },
+    }
+    for layout, inputs in layouts.items():
+        for concurrency in config.concurrency:
+
+            async def run(index: int, inputs: dict[str, list[str]] | None = inputs) -> str:
+                names = ("plan", "research", "draft", "edit")
+                agents = [_agent(name, config, index) for name in names]
+                return await AgentTeam(agents, inputs=inputs).run(f"task {index}")
+
+            results.append(
+                await measure_async(
+                    "team.run",
+                    {"layout": layout, "agents": 4, "concurrency": concurrency},
+                    run,
+                    total,
+                    concurrency,
+                )
+            )
+    return results
+
+
+async def bench_memory(config: BenchConfig) -> list[BenchResult]:
+    """`ShortTermMemory.get_context` cost as the number of entries grows."""
+    rng = random.Random(config.seed)
+    results = []
+    for size in config.memory_sizes:
+        memory = ShortTermMemory(max_entries=size)
+        for _ in range(size):
+            await memory.add(_sentence(rng))
+        query = _sentence(rng, 8)
+        iterations = config.scaled(max(20, config.iterations // max(1, size // 20)))
+        results.append(
+            await measure_sequential(
+                "memory.get_context",
+                {"entries": size, "query_words": 8},
+                partial(memory.get_context, query),
+                iterations,
+            )
+        )
+    return results
+
+
+def _legacy_extract_json(content: str) -> dict[str, object] | None:
+    if not content.strip():
+        return None
+    match = re.search(r"\{.*\}", content, flags=re.DOTALL)
+    if not match:
+        return None
+    candidate = match.group(0)
+    try:
+        loaded = json.loads(candidate)
+        return loaded if isinstance(loaded, dict) else None
+    except Exception:  # noqa: BLE001
+        pass
+    try:
+        loaded_literal = ast.literal_eval(candidate)
+        if isinstance(loaded_literal, dict):
+            return loaded_literal
+    except Exception:  # noqa: BLE001
+        return None
+    return None
+
+
+def _legacy_validate_payload(payload: dict[str, object]) -> AgentResponse | None:
+    tool_name = payload.get("tool")
+    tool_input = payload.get("tool_input")
+    if tool_name and tool_input and "tool_call" not in payload:
+        payload = {**payload, "tool_call": {"tool": str(tool_name), "input": str(tool_input)}}
+    try:
+        return AgentResponse.model_validate(payload)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+async def _legacy_act(provider_output: str) -> AgentResponse:
+    """Reference for the speedup: `Agent.act` as it was before the single-parse path."""
+    candidate = _legacy_extract_json(provider_output)
+    if candidate:
+        validated = _legacy_validate_payload(candidate)
+        if validated:
+            return validated
+    try:
+        return AgentResponse.model_validate(json.loads(provider_output))
+    except Exception:  # noqa: BLE001
+        return AgentResponse(final=provider_output)
+
+
+async def bench_parse(config: BenchConfig) -> list[BenchResult]:
+    """
+    `Agent.act` throughput on realistic provider outputs.
+
+    `agent.act_legacy` replays the previous sequence (stdlib `json.loads`, an
+    `ast.literal_eval` fallback, separate validation, then a whole-output `json.loads`
+    retry); both return the same `AgentResponse` for every shape.
+    """
+    agent = _agent("bench-parse", config)
+    iterations = config.scaled(config.iterations)
+    results = []
+    for shape, sample in PARSE_SAMPLES.items():
+        params = {"shape": shape, "chars": len(sample)}
+        for name, act in (("agent.act_legacy", _legacy_act), ("agent.act", agent.act)):
+            results.append(
+                await measure_sequential(name, params, partial(act, sample), iterations)
+            )
+    return results
+
+
+async def bench_python_tool(config: BenchConfig) -> list[BenchResult]:
+    """`PythonTool` per-call overhead on a trivial snippet (thread backend)."""
+    iterations = config.scaled(config.iterations // 4)
+    results = []
+
+    tool = PythonTool()
+    results.append(
+        await measure_sequential(
+            "python_tool.run",
+            {"backend": "thread", "compile": "cached"},
+            lambda: tool.run("x = 1"),
+            iterations,
+        )
+    )
+
+    uncached = PythonTool(code_cache=CodeCache(max_entries=1))
+    counter = iter(range(1_000_000_000))
+    results.append(
+        await measure_sequential(
+            "python_tool.run",
+            {"backend": "thread", "compile": "uncached"},
+            lambda: uncached.run(f"x = {next(counter)}"),
+            iterations,
+        )
+    )
+
+    invoked = PythonTool(timeout_s=5.0)
+    results.append(
+        await measure_sequential(
+            "python_tool.invoke",
+            {"backend": "thread", "timeout_s": 5.0},
+            lambda: invoked.invoke("x = 1"),
+            iterations,
+        )
+    )
+    return results
+
+
+SUITES: dict[str, Suite] = {
+    "engine": bench_engine,
+    "team": bench_team,
+    "memory": bench_memory,
+    "parse": bench_parse,
+    "python_tool": bench_python_tool,
+}
+
+
+async def run_benchmarks(
+    config: BenchConfig | None = None, only: list[str] | None = None
+) -> dict[str, Any]:
+    """Run the selected suites and return a JSON-ready report with environment metadata."""
+    config = config or BenchConfig()
+    names = only or list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark suite(s): {', '.join(unknown)}")
+    results: list[BenchResult] = []
+    for name in names:
+        results.extend(await SUITES[name](config))
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "config": {
+                "latency_s": config.latency_s,
+                "jitter_s": config.jitter_s,
+                "concurrency": list(config.concurrency),
+                "runs": config.runs,
+                "iterations": config.iterations,
+                "memory_sizes": list(config.memory_sizes),
+                "quick": config.quick,
+            },
+            "suites": names,
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
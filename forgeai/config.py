@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 import os
+from dataclasses import dataclass
 
 
 @dataclass(slots=True)
@@ -18,9 +18,13 @@ class ForgeAIConfig:
     openai_model: str = "gpt-4o-mini"
     max_iterations: int = 5
     max_retries: int = 2
+    run_deadline_s: float | None = None
+    ollama_keep_alive: str | None = None
+    ollama_num_ctx: int | None = None
+    ollama_max_concurrency: int | None = None
 
     @classmethod
-    def from_env(cls) -> "ForgeAIConfig":
+    def from_env(cls) -> ForgeAIConfig:
         """Load configuration values from environment variables."""
         return cls(
             default_provider=os.getenv("FORGEAI_DEFAULT_PROVIDER", "ollama"),
@@ -31,4 +35,20 @@ class ForgeAIConfig:
             openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
             max_iterations=int(os.getenv("FORGEAI_MAX_ITERATIONS", "5")),
             max_retries=int(os.getenv("FORGEAI_MAX_RETRIES", "2")),
+            run_deadline_s=_optional_float(os.getenv("FORGEAI_RUN_DEADLINE_S")),
+            ollama_keep_alive=os.getenv("FORGEAI_OLLAMA_KEEP_ALIVE") or None,
+            ollama_num_ctx=_optional_int(os.getenv("FORGEAI_OLLAMA_NUM_CTX")),
+            ollama_max_concurrency=_optional_int(os.getenv("FORGEAI_OLLAMA_MAX_CONCURRENCY")),
         )
+
+
+def _optional_float(value: str | None) -> float | None:
+    if value is None or not value.strip():
+        return None
+    return float(value)
+
+
+def _optional_int(value: str | None) -> int | None:
+    if value is None or not value.strip():
+        return None
+    return int(value)
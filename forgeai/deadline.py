@@ -0,0 +1,103 @@
+"""Run deadlines shared across engine, agent, provider, and tool layers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a run has no time budget left for the requested work."""
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """Absolute point in monotonic time by which a run must finish."""
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """Create a deadline `seconds` from now."""
+        return cls(expires_at=time.monotonic() + max(seconds, 0.0))
+
+    def remaining(self) -> float:
+        """Seconds left before expiry (never negative)."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def can_fit(self, seconds: float) -> bool:
+        """Return whether `seconds` of work can still finish before expiry."""
+        return self.remaining() > seconds
+
+    def timeout(self, default: float) -> float:
+        """Clamp a per-call timeout to the remaining budget."""
+        self.check()
+        return min(default, self.remaining())
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceeded("run deadline exceeded")
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("forgeai_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline bound to the current task, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[Deadline | None]:
+    """
+    Bind a deadline to the current context.
+
+    An inner scope can only tighten the budget: if an outer deadline expires sooner, it wins.
+    """
+    outer = _current_deadline.get()
+    effective = deadline
+    if outer is not None and (effective is None or outer.expires_at < effective.expires_at):
+        effective = outer
+    token = _current_deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _current_deadline.reset(token)
+
+
+def resolve_deadline(deadline: Deadline | float | None) -> Deadline | None:
+    """Accept a `Deadline` or a relative budget in seconds."""
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline.after(float(deadline))
+
+
+def call_timeout(default: float) -> float:
+    """Per-call timeout sized to the current deadline (or `default` without one)."""
+    deadline = current_deadline()
+    if deadline is None:
+        return default
+    return deadline.timeout(default)
+
+
+def check_deadline() -> None:
+    """Raise `DeadlineExceeded` if the current deadline has passed."""
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check()
+
+
+async def sleep_within_deadline(delay: float) -> None:
+    """Back off before a retry, refusing retries that cannot finish in time."""
+    deadline = current_deadline()
+    if deadline is not None and not deadline.can_fit(delay):
+        raise DeadlineExceeded("not enough time left to retry")
+    await asyncio.sleep(delay)
@@ -1,5 +1,31 @@
 """Engine module exports."""
 
 from forgeai.engine.engine import Engine
+from forgeai.engine.job_queue import BaseJobQueue, Job, SQLiteJobQueue
+from forgeai.engine.jobs import JobManager, JobRecord
+from forgeai.engine.journal import (
+    BaseRunJournal,
+    FileRunJournal,
+    JournalEntry,
+    SQLiteRunJournal,
+)
+from forgeai.engine.scheduler import Priority, QueueFull, RunScheduler
+from forgeai.engine.workers import JobFailed, WorkerPool
 
-__all__ = ["Engine"]
+__all__ = [
+    "BaseJobQueue",
+    "BaseRunJournal",
+    "Engine",
+    "FileRunJournal",
+    "Job",
+    "JobFailed",
+    "JobManager",
+    "JobRecord",
+    "JournalEntry",
+    "Priority",
+    "QueueFull",
+    "RunScheduler",
+    "SQLiteJobQueue",
+    "SQLiteRunJournal",
+    "WorkerPool",
+]
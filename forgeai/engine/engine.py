@@ -5,9 +5,22 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from contextlib import AbstractContextManager, nullcontext
 
 from forgeai.agent.base import Agent
+from forgeai.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    deadline_scope,
+    resolve_deadline,
+    sleep_within_deadline,
+)
+from forgeai.engine.journal import BaseRunJournal, JournalEntry
+from forgeai.observability.logger import LogData, log_event
 from forgeai.observability.metrics import Metrics
+from forgeai.observability.profiling import RunProfiler
+from forgeai.observability.registry import ENGINE_IN_FLIGHT, ENGINE_RETRIES, ENGINE_RUNS
+from forgeai.observability.tracing import span
 
 
 class Engine:
@@ -18,19 +31,129 @@ class Engine:
         max_iterations: int = 5,
         max_retries: int = 2,
         logger: logging.Logger | None = None,
+        journal: BaseRunJournal | None = None,
+        profiler: RunProfiler | None = None,
     ) -> None:
         self.max_iterations = max_iterations
         self.max_retries = max_retries
         self.logger = logger
+        self.journal = journal
+        self.profiler = profiler
         self.metrics = Metrics()
 
-    async def run(self, agent: Agent, initial_input: str = "") -> str:
-        """Run an agent with retry and max-iteration controls."""
-        run_id = str(uuid.uuid4())
-        current_input = initial_input
+    async def run(
+        self,
+        agent: Agent,
+        initial_input: str = "",
+        deadline: Deadline | float | None = None,
+        run_id: str | None = None,
+    ) -> str:
+        """
+        Run an agent with retry and max-iteration controls.
+
+        `deadline` bounds the whole run (a `Deadline` or a budget in seconds). Providers and
+        tools size their timeouts to the remaining budget, retries that cannot finish in time
+        are skipped, and in-flight work is cancelled once it expires (`DeadlineExceeded`).
+
+        With a journal configured, every completed iteration is checkpointed under `run_id`
+        so the run can be continued with `resume`.
+        """
+        run_id = run_id or str(uuid.uuid4())
+        await self._journal(run_id, "start", {"agent": agent.name, "input": initial_input})
+        with (
+            deadline_scope(resolve_deadline(deadline)) as effective,
+            span("engine.run", run_id=run_id, agent=agent.name),
+            self._profile(run_id),
+        ):
+            return await self._run(agent, run_id, effective, initial_input, "", 1)
+
+    async def resume(
+        self,
+        agent: Agent,
+        run_id: str,
+        deadline: Deadline | float | None = None,
+        replay_memory: bool = True,
+    ) -> str:
+        """
+        Continue a journaled run without calling the provider for completed iterations.
+
+        Memory writes recorded for completed iterations are re-applied to `agent.memory`
+        unless `replay_memory` is False (e.g. when resuming in-process with the same agent).
+        """
+        if self.journal is None:
+            raise RuntimeError("Engine.resume requires a journal")
+        entries = await self.journal.load(run_id)
+        if not entries:
+            raise KeyError(f"Unknown run_id: {run_id}")
+
+        current_input = ""
         last_output = ""
+        completed = 0
+        for entry in entries:
+            if entry.kind == "start":
+                current_input = str(entry.data.get("input", ""))
+            elif entry.kind == "complete":
+                return str(entry.data.get("output", ""))
+            elif entry.kind == "iteration":
+                if replay_memory:
+                    for memory_entry in entry.data.get("memory", []):
+                        await agent.memory.add(str(memory_entry))
+                output = str(entry.data.get("output", ""))
+                if self._should_stop(output=output, previous_output=last_output):
+                    await self._journal(run_id, "complete", {"output": output})
+                    return output
+                completed = int(entry.data.get("iteration", completed + 1))
+                last_output = output
+                current_input = output
+
+        self._log(
+            "info",
+            "engine_resume",
+            {"run_id": run_id, "agent": agent.name, "replayed_iterations": completed},
+        )
+        with (
+            deadline_scope(resolve_deadline(deadline)) as effective,
+            span("engine.run", run_id=run_id, agent=agent.name, resumed=True),
+            self._profile(run_id),
+        ):
+            return await self._run(
+                agent, run_id, effective, current_input, last_output, completed + 1
+            )
 
-        for iteration in range(1, self.max_iterations + 1):
+    async def _run(
+        self,
+        agent: Agent,
+        run_id: str,
+        deadline: Deadline | None,
+        current_input: str,
+        last_output: str,
+        first_iteration: int,
+    ) -> str:
+        ENGINE_IN_FLIGHT.inc(agent=agent.name)
+        outcome = "error"
+        try:
+            output = await self._iterate(
+                agent, run_id, deadline, current_input, last_output, first_iteration
+            )
+            outcome = "ok"
+            return output
+        except DeadlineExceeded:
+            outcome = "deadline"
+            raise
+        finally:
+            ENGINE_IN_FLIGHT.dec(agent=agent.name)
+            ENGINE_RUNS.inc(agent=agent.name, outcome=outcome)
+
+    async def _iterate(
+        self,
+        agent: Agent,
+        run_id: str,
+        deadline: Deadline | None,
+        current_input: str,
+        last_output: str,
+        first_iteration: int,
+    ) -> str:
+        for iteration in range(first_iteration, self.max_iterations + 1):
             attempt = 0
             while attempt <= self.max_retries:
                 try:
@@ -45,23 +168,39 @@ class Engine:
                             "attempt": attempt + 1,
                         },
                     )
-                    output = await agent.run(current_input)
+                    with span("engine.iteration", iteration=iteration, attempt=attempt + 1):
+                        output = await self._run_agent(agent, current_input, deadline)
                     self.metrics.end_step()
                     self.metrics.track_tokens(len(output.split()))
                     self.metrics.track_provider_calls(agent.last_provider_calls)
                     self.metrics.track_tool_calls(agent.last_tool_calls)
+                    # Lazy payloads are resolved before this call returns.
                     self._log(
                         "info",
                         "engine_step_complete",
-                        {
+                        lambda: {
                             "run_id": run_id,
                             "agent": agent.name,
-                            "iteration": iteration,
+                            "iteration": iteration,  # noqa: B023
                             **self.metrics.snapshot(),
                         },
                     )
+                    await self._journal(
+                        run_id,
+                        "iteration",
+                        {
+                            "iteration": iteration,
+                            "input": current_input,
+                            "prompts": agent.last_prompts,
+                            "raw_outputs": agent.last_raw_outputs,
+                            "tool_results": agent.last_tool_results,
+                            "memory": agent.last_memory_entries,
+                            "output": output,
+                        },
+                    )
                     if self._should_stop(output=output, previous_output=last_output):
                         last_output = output
+                        await self._journal(run_id, "complete", {"output": last_output})
                         self._log(
                             "info",
                             "engine_early_stop",
@@ -76,6 +215,19 @@ class Engine:
                     last_output = output
                     current_input = output
                     break
+                except DeadlineExceeded as exc:
+                    self._log(
+                        "error",
+                        "engine_deadline_exceeded",
+                        {
+                            "run_id": run_id,
+                            "agent": agent.name,
+                            "iteration": iteration,
+                            "attempt": attempt + 1,
+                            "error": str(exc),
+                        },
+                    )
+                    raise
                 except Exception as exc:  # noqa: BLE001
                     attempt += 1
                     self._log(
@@ -91,15 +243,37 @@ class Engine:
                     )
                     if attempt > self.max_retries:
                         raise
-                    await asyncio.sleep(0.25 * attempt)
+                    ENGINE_RETRIES.inc(agent=agent.name)
+                    await sleep_within_deadline(0.25 * attempt)
 
+        await self._journal(run_id, "complete", {"output": last_output})
         return last_output
 
-    def _log(self, level: str, message: str, data: dict[str, object]) -> None:
-        if not self.logger:
-            return
-        log_fn = getattr(self.logger, level, self.logger.info)
-        log_fn(message, extra={"extra_data": data})
+    def _profile(self, run_id: str) -> AbstractContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.profile(run_id)
+
+    async def _journal(self, run_id: str, kind: str, data: dict[str, object]) -> None:
+        if self.journal is not None:
+            await self.journal.append(JournalEntry(run_id=run_id, kind=kind, data=data))
+
+    @staticmethod
+    async def _run_agent(agent: Agent, current_input: str, deadline: Deadline | None) -> str:
+        if deadline is None:
+            return await agent.run(current_input)
+        deadline.check()
+        try:
+            async with asyncio.timeout(deadline.remaining()):
+                return await agent.run(current_input)
+        except TimeoutError as exc:
+            if isinstance(exc, DeadlineExceeded) or not deadline.expired:
+                raise
+            raise DeadlineExceeded("run deadline exceeded") from exc
+
+    def _log(self, level: str, message: str, data: LogData) -> None:
+        levelno = logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+        log_event(self.logger, levelno, message, data)
 
     @staticmethod
     def _should_stop(output: str, previous_output: str) -> bool:
@@ -0,0 +1,225 @@
+"""Job queues shared between the worker pool and its worker processes."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+JobStatus = Literal["queued", "running", "done", "failed"]
+
+
+@dataclass(slots=True)
+class Job:
+    """An engine run to execute in a worker process."""
+
+    factory: str
+    input: str = ""
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    deadline_s: float | None = None
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: JobStatus = "queued"
+    result: str | None = None
+    error: str | None = None
+    worker_id: str | None = None
+    attempts: int = 0
+    lease_until: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+
+class BaseJobQueue(ABC):
+    """
+    Abstract queue contract used by `WorkerPool`.
+
+    Implementations must be picklable and safe to use from several processes at once,
+    since every worker process receives its own copy.
+    """
+
+    @abstractmethod
+    def put(self, job: Job) -> str:
+        """Enqueue a job and return its id."""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_s: float) -> Job | None:
+        """Atomically take the oldest queued job, leasing it to `worker_id`."""
+
+    @abstractmethod
+    def renew(self, job_id: str, worker_id: str, lease_s: float) -> None:
+        """Extend the lease on a running job."""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: str) -> bool:
+        """Store a job result if `worker_id` still holds its lease; False if it was lost."""
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Mark a job as failed if `worker_id` still holds its lease; False if it was lost."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None:
+        """Return the current state of a job."""
+
+    @abstractmethod
+    def requeue_expired(self, max_attempts: int) -> int:
+        """Return running jobs with expired leases to the queue; fail those out of attempts."""
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs per status."""
+
+
+class SQLiteJobQueue(BaseJobQueue):
+    """Durable local job queue backed by SQLite, usable across processes."""
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        if path is None:
+            path = Path(tempfile.gettempdir()) / f"forgeai-jobs-{uuid.uuid4().hex}.db"
+        self.path = str(path)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, factory TEXT NOT NULL, input TEXT NOT NULL, "
+                "kwargs TEXT NOT NULL, deadline_s REAL, status TEXT NOT NULL, "
+                "result TEXT, error TEXT, worker_id TEXT, attempts INTEGER NOT NULL, "
+                "lease_until REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state["path"]
+        self._local = threading.local()
+
+    def put(self, job: Job) -> str:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.factory,
+                    job.input,
+                    json.dumps(job.kwargs),
+                    job.deadline_s,
+                    job.status,
+                    job.result,
+                    job.error,
+                    job.worker_id,
+                    job.attempts,
+                    job.lease_until,
+                    job.created_at,
+                ),
+            )
+        return job.id
+
+    def claim(self, worker_id: str, lease_s: float) -> Job | None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker_id = ?, attempts = attempts + 1, "
+                "lease_until = ? WHERE id = ?",
+                (worker_id, time.time() + lease_s, row["id"]),
+            )
+        job = self._to_job(row)
+        job.status = "running"
+        job.worker_id = worker_id
+        job.attempts += 1
+        return job
+
+    def renew(self, job_id: str, worker_id: str, lease_s: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET lease_until = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (time.time() + lease_s, job_id, worker_id),
+            )
+
+    def complete(self, job_id: str, worker_id: str, result: str) -> bool:
+        return self._finish(job_id, worker_id, "done", "result", result)
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        return self._finish(job_id, worker_id, "failed", "error", error)
+
+    def _finish(
+        self, job_id: str, worker_id: str, status: JobStatus, column: str, value: str
+    ) -> bool:
+        # Only the current, unexpired lease holder may finish a job; a worker whose lease
+        # ran out must not overwrite the outcome of whoever re-leased it.
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = ?, {column} = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running' AND lease_until >= ?",
+                (status, value, job_id, worker_id, time.time()),
+            )
+            return cursor.rowcount > 0
+
+    def get(self, job_id: str) -> Job | None:
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return None if row is None else self._to_job(row)
+
+    def requeue_expired(self, max_attempts: int) -> int:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'worker lost' "
+                "WHERE status = 'running' AND lease_until < ? AND attempts >= ?",
+                (now, max_attempts),
+            )
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', worker_id = NULL "
+                "WHERE status = 'running' AND lease_until < ?",
+                (now,),
+            )
+            return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        rows = self._connect().execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ).fetchall()
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update({str(status): int(count) for status, count in rows})
+        return counts
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross threads or a fork, so each thread opens its own.
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            factory=row["factory"],
+            input=row["input"],
+            kwargs=json.loads(row["kwargs"]),
+            deadline_s=row["deadline_s"],
+            status=row["status"],
+            result=row["result"],
+            error=row["error"],
+            worker_id=row["worker_id"],
+            attempts=row["attempts"],
+            lease_until=row["lease_until"],
+            created_at=row["created_at"],
+        )
@@ -0,0 +1,362 @@
+"""In-process asynchronous job API: submit runs, poll for status, get callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+import logging
+import socket
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import IO, Any, Literal
+
+from forgeai.agent.base import Agent
+from forgeai.deadline import Deadline
+from forgeai.engine.engine import Engine
+from forgeai.engine.scheduler import QueueFull
+from forgeai.observability.logger import log_event
+from forgeai.observability.registry import JOB_QUEUE_DEPTH, JOB_REQUESTS, JOBS_RUNNING
+
+JobState = Literal["queued", "running", "done", "failed", "cancelled"]
+FINISHED_STATES: frozenset[str] = frozenset({"done", "failed", "cancelled"})
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """Status and outcome of one submitted run."""
+
+    id: str
+    status: JobState = "queued"
+    result: str | None = None
+    error: str | None = None
+    callback_url: str | None = None
+    callback_status: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> dict[str, Any]:
+        queued_s = (self.started_at or time.time()) - self.created_at
+        run_s = None
+        if self.started_at is not None:
+            run_s = (self.finished_at or time.time()) - self.started_at
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "callback_status": self.callback_status,
+            "created_at": self.created_at,
+            "queued_s": round(queued_s, 4),
+            "run_s": None if run_s is None else round(run_s, 4),
+            "metadata": self.metadata,
+        }
+
+
+@dataclass(slots=True)
+class _Pending:
+    record: JobRecord
+    engine: Engine
+    agent: Agent
+    initial_input: str
+    deadline: Deadline | float | None
+    done: asyncio.Event
+    task: asyncio.Task[str] | None = None
+
+
+class JobManager:
+    """
+    Runs submitted engine jobs on a fixed set of worker tasks and keeps their outcomes.
+
+    `submit` returns immediately with a job id; at most `max_pending` jobs may be queued
+    or running, beyond which `QueueFull` is raised so HTTP layers can answer 429.
+    Finished records are kept for `result_ttl_s` (and at most `max_records`) for polling.
+    When a job has a `callback_url` (http or https only), its final status is POSTed there
+    as JSON, retried `callback_retries` times with exponential backoff. Callbacks to
+    loopback, link-local, private or otherwise non-public addresses are refused (the host
+    is resolved again before every attempt, and redirects are not followed) unless the
+    host is listed in `callback_allowed_hosts`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_pending: int = 100,
+        result_ttl_s: float = 3600.0,
+        max_records: int = 10_000,
+        callback_timeout_s: float = 10.0,
+        callback_retries: int = 2,
+        callback_allowed_hosts: Iterable[str] = (),
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if max_concurrency < 1 or max_pending < 1:
+            raise ValueError("max_concurrency and max_pending must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.result_ttl_s = result_ttl_s
+        self.max_records = max_records
+        self.callback_timeout_s = callback_timeout_s
+        self.callback_retries = callback_retries
+        self.callback_allowed_hosts = frozenset(host.lower() for host in callback_allowed_hosts)
+        self.logger = logger
+        self._jobs: OrderedDict[str, _Pending] = OrderedDict()
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._callbacks: set[asyncio.Task[None]] = set()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running."""
+        return self._pending
+
+    def submit(
+        self,
+        engine: Engine,
+        agent: Agent,
+        initial_input: str = "",
+        deadline: Deadline | float | None = None,
+        callback_url: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> JobRecord:
+        """Queue a run and return its record without waiting for it."""
+        if callback_url is not None:
+            self._check_callback_url(callback_url)
+        self._start_workers()
+        assert self._queue is not None
+        if self._pending >= self.max_pending:
+            JOB_REQUESTS.inc(outcome="rejected")
+            raise QueueFull(f"job queue is full ({self.max_pending} pending)")
+        self._prune()
+        record = JobRecord(id=uuid.uuid4().hex, callback_url=callback_url)
+        record.metadata.update(metadata or {})
+        pending = _Pending(record, engine, agent, initial_input, deadline, asyncio.Event())
+        self._jobs[record.id] = pending
+        self._pending += 1
+        self._queue.put_nowait(pending)
+        JOB_REQUESTS.inc(outcome="accepted")
+        JOB_QUEUE_DEPTH.inc()
+        return record
+
+    def get(self, job_id: str) -> JobRecord | None:
+        self._prune()
+        pending = self._jobs.get(job_id)
+        return None if pending is None else pending.record
+
+    async def wait(self, job_id: str, timeout_s: float | None = None) -> JobRecord | None:
+        """Return the record once finished, or as it stands after `timeout_s` (long poll)."""
+        pending = self._jobs.get(job_id)
+        if pending is None:
+            return None
+        if not pending.record.finished:
+            try:
+                async with asyncio.timeout(timeout_s):
+                    await pending.done.wait()
+            except TimeoutError:
+                pass
+        return pending.record
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; returns False if unknown or already finished."""
+        pending = self._jobs.get(job_id)
+        if pending is None or pending.record.finished:
+            return False
+        if pending.task is not None:
+            pending.task.cancel()
+        else:
+            JOB_QUEUE_DEPTH.dec()
+            self._settle(pending, "cancelled", error="cancelled before start")
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        counts = {state: 0 for state in ("queued", "running", "done", "failed", "cancelled")}
+        for pending in self._jobs.values():
+            counts[pending.record.status] += 1
+        return {
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "max_concurrency": self.max_concurrency,
+            "jobs": counts,
+        }
+
+    async def close(self) -> None:
+        """Stop the workers, cancelling unfinished jobs, and wait for callbacks to finish."""
+        for pending in list(self._jobs.values()):
+            self.cancel(pending.record.id)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await asyncio.gather(*self._callbacks, return_exceptions=True)
+        self._workers.clear()
+        self._queue = None
+
+    def _start_workers(self) -> None:
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"forgeai-job-worker-{index}")
+            for index in range(self.max_concurrency)
+        ]
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            pending = await queue.get()
+            if pending.record.finished:
+                continue
+            JOB_QUEUE_DEPTH.dec()
+            JOBS_RUNNING.inc()
+            pending.record.status = "running"
+            pending.record.started_at = time.time()
+            pending.task = asyncio.create_task(
+                pending.engine.run(
+                    pending.agent,
+                    initial_input=pending.initial_input,
+                    deadline=pending.deadline,
+                )
+            )
+            try:
+                result = await asyncio.shield(pending.task)
+            except asyncio.CancelledError:
+                if not pending.task.cancelled():
+                    pending.task.cancel()
+                    self._settle(pending, "cancelled", error="job manager closed")
+                    JOBS_RUNNING.dec()
+                    raise
+                self._settle(pending, "cancelled", error="cancelled")
+            except Exception as exc:
+                self._settle(pending, "failed", error=f"{type(exc).__name__}: {exc}")
+            else:
+                self._settle(pending, "done", result=result)
+            JOBS_RUNNING.dec()
+
+    def _settle(
+        self,
+        pending: _Pending,
+        status: JobState,
+        result: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        record = pending.record
+        record.status = status
+        record.result = result
+        record.error = error
+        record.finished_at = time.time()
+        self._pending -= 1
+        pending.done.set()
+        JOB_REQUESTS.inc(outcome=status)
+        log_event(
+            self.logger,
+            logging.INFO,
+            "job_finished",
+            {"job_id": record.id, "status": status, "error": error},
+        )
+        if record.callback_url:
+            record.callback_status = "pending"
+            task = asyncio.create_task(self._deliver(record))
+            self._callbacks.add(task)
+            task.add_done_callback(self._callbacks.discard)
+
+    async def _deliver(self, record: JobRecord) -> None:
+        assert record.callback_url is not None
+        body = json.dumps(record.to_dict()).encode("utf-8")
+        for attempt in range(self.callback_retries + 1):
+            try:
+                await asyncio.to_thread(self._post, record.callback_url, body)
+            except Exception as exc:
+                log_event(
+                    self.logger,
+                    logging.WARNING,
+                    "job_callback_failed",
+                    {"job_id": record.id, "attempt": attempt + 1, "error": str(exc)},
+                )
+                if attempt < self.callback_retries:
+                    await asyncio.sleep(0.5 * 2**attempt)
+            else:
+                record.callback_status = "delivered"
+                return
+        record.callback_status = "failed"
+
+    def _check_callback_url(self, url: str) -> None:
+        """Reject callback URLs that are not http(s) or name a non-public host literally."""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"callback_url must be an http(s) URL, got {url!r}")
+        host = parts.hostname.lower()
+        if host in self.callback_allowed_hosts:
+            return
+        if host == "localhost" or host.endswith(".localhost"):
+            raise ValueError(f"callback_url host is not public: {host!r}")
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return
+        if not _is_public(address):
+            raise ValueError(f"callback_url host is not public: {host!r}")
+
+    def _post(self, url: str, body: bytes) -> None:
+        parts = urllib.parse.urlsplit(url)
+        host = (parts.hostname or "").lower()
+        if host not in self.callback_allowed_hosts:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            for *_, sockaddr in socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP):
+                if not _is_public(ipaddress.ip_address(sockaddr[0])):
+                    raise ValueError(f"callback host {host!r} resolves to {sockaddr[0]}")
+        request = urllib.request.Request(
+            url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with _CALLBACK_OPENER.open(request, timeout=self.callback_timeout_s) as response:
+            response.read()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.result_ttl_s
+        finished = [
+            job_id
+            for job_id, pending in self._jobs.items()
+            if pending.record.finished and (pending.record.finished_at or 0.0) < cutoff
+        ]
+        for job_id in finished:
+            del self._jobs[job_id]
+        overflow = len(self._jobs) - self.max_records
+        if overflow <= 0:
+            return
+        for job_id in [j for j, p in self._jobs.items() if p.record.finished][:overflow]:
+            del self._jobs[job_id]
+
+
+def _is_public(address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+class _RefuseRedirects(urllib.request.HTTPRedirectHandler):
+    """A redirect could point a vetted callback at an internal address, so fail instead."""
+
+    def redirect_request(
+        self,
+        req: urllib.request.Request,
+        fp: IO[bytes],
+        code: int,
+        msg: str,
+        headers: Message,
+        newurl: str,
+    ) -> None:
+        return None
+
+
+_CALLBACK_OPENER = urllib.request.build_opener(_RefuseRedirects)
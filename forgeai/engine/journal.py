@@ -0,0 +1,138 @@
+"""Append-only run journals used to checkpoint and resume engine runs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """One journal record: `start`, `iteration`, or `complete`, keyed by run id."""
+
+    run_id: str
+    kind: str
+    data: dict[str, Any]
+    created_at: float = field(default_factory=time.time)
+
+
+class BaseRunJournal(ABC):
+    """Abstract append-only store of engine run progress."""
+
+    @abstractmethod
+    async def append(self, entry: JournalEntry) -> None:
+        """Durably append an entry."""
+
+    @abstractmethod
+    async def load(self, run_id: str) -> list[JournalEntry]:
+        """Return all entries for a run in append order."""
+
+
+class FileRunJournal(BaseRunJournal):
+    """JSON-lines journal in a single local file."""
+
+    def __init__(self, path: str | os.PathLike[str], fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+    async def append(self, entry: JournalEntry) -> None:
+        await asyncio.to_thread(self._append, entry)
+
+    async def load(self, run_id: str) -> list[JournalEntry]:
+        return await asyncio.to_thread(self._load, run_id)
+
+    def _append(self, entry: JournalEntry) -> None:
+        line = json.dumps(
+            {
+                "run_id": entry.run_id,
+                "kind": entry.kind,
+                "data": entry.data,
+                "created_at": entry.created_at,
+            },
+            default=str,
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+
+    def _load(self, run_id: str) -> list[JournalEntry]:
+        if not self.path.exists():
+            return []
+        entries: list[JournalEntry] = []
+        with self._lock, self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write is not a completed step.
+                    continue
+                if record.get("run_id") == run_id:
+                    entries.append(
+                        JournalEntry(
+                            run_id=run_id,
+                            kind=str(record["kind"]),
+                            data=dict(record["data"]),
+                            created_at=float(record["created_at"]),
+                        )
+                    )
+        return entries
+
+
+class SQLiteRunJournal(BaseRunJournal):
+    """Journal backed by a local SQLite database."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS run_journal ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "run_id TEXT NOT NULL, kind TEXT NOT NULL, "
+                "data TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS run_journal_run_id ON run_journal (run_id, id)"
+            )
+
+    async def append(self, entry: JournalEntry) -> None:
+        await asyncio.to_thread(self._append, entry)
+
+    async def load(self, run_id: str) -> list[JournalEntry]:
+        return await asyncio.to_thread(self._load, run_id)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _append(self, entry: JournalEntry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO run_journal (run_id, kind, data, created_at) VALUES (?, ?, ?, ?)",
+                (entry.run_id, entry.kind, json.dumps(entry.data, default=str), entry.created_at),
+            )
+
+    def _load(self, run_id: str) -> list[JournalEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, data, created_at FROM run_journal WHERE run_id = ? ORDER BY id",
+                (run_id,),
+            ).fetchall()
+        return [
+            JournalEntry(run_id=run_id, kind=kind, data=json.loads(data), created_at=created_at)
+            for kind, data, created_at in rows
+        ]
@@ -0,0 +1,250 @@
+"""Admission control and fair-share scheduling for concurrent engine runs."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from forgeai.agent.base import Agent
+from forgeai.deadline import Deadline
+from forgeai.engine.engine import Engine
+from forgeai.observability.registry import SCHEDULER_IN_FLIGHT, SCHEDULER_QUEUE_DEPTH
+from forgeai.providers.base import BaseProvider
+
+
+class Priority(IntEnum):
+    """Priority classes; lower values are always dispatched first."""
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BATCH = 2
+
+
+class QueueFull(RuntimeError):
+    """Raised when the scheduler queue is at capacity."""
+
+
+def provider_key(provider: BaseProvider) -> str:
+    """Concurrency-cap key for a provider: `ClassName/model`."""
+    return f"{type(provider).__name__}/{getattr(provider, 'model', '')}"
+
+
+@dataclass(slots=True)
+class _Job:
+    engine: Engine
+    agent: Agent
+    initial_input: str
+    deadline: Deadline | float | None
+    tenant: str
+    priority: Priority
+    key: str
+    future: asyncio.Future[str]
+    enqueued_at: float
+    finish_tag: float = 0.0
+    start_tag: float = 0.0
+    task: asyncio.Task[str] | None = None
+    cancelled: bool = False
+
+
+@dataclass(slots=True)
+class SchedulerStats:
+    """Queue depth and wait-time counters per priority class."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    wait_count: dict[str, int] = field(default_factory=dict)
+    wait_total_ms: dict[str, float] = field(default_factory=dict)
+    wait_max_ms: dict[str, float] = field(default_factory=dict)
+
+    def track_wait(self, priority: Priority, waited_ms: float) -> None:
+        name = priority.name.lower()
+        self.wait_count[name] = self.wait_count.get(name, 0) + 1
+        self.wait_total_ms[name] = self.wait_total_ms.get(name, 0.0) + waited_ms
+        self.wait_max_ms[name] = max(self.wait_max_ms.get(name, 0.0), waited_ms)
+
+    def average_wait_ms(self, priority: Priority) -> float:
+        name = priority.name.lower()
+        count = self.wait_count.get(name, 0)
+        return self.wait_total_ms.get(name, 0.0) / count if count else 0.0
+
+
+class RunScheduler:
+    """
+    Schedules `Engine.run` calls with priority classes and per-tenant fair sharing.
+
+    Within a priority class, tenants share slots by start-time fair queuing weighted by
+    `tenant_weights`. `provider_limits` caps concurrent runs per provider key
+    (`ClassName/model`) or provider class name, and `reserved_interactive` keeps slots free
+    that only interactive runs may use, so bulk jobs soak up spare capacity only.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        provider_limits: dict[str, int] | None = None,
+        tenant_weights: dict[str, float] | None = None,
+        reserved_interactive: int = 0,
+        max_queue: int | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.provider_limits = provider_limits or {}
+        self.tenant_weights = tenant_weights or {}
+        self.reserved_interactive = min(reserved_interactive, max_concurrency - 1)
+        self.max_queue = max_queue
+        self.logger = logger
+        self.stats = SchedulerStats()
+        self._queues: dict[Priority, list[tuple[float, int, _Job]]] = {p: [] for p in Priority}
+        self._virtual_time: dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._last_finish: dict[tuple[Priority, str], float] = {}
+        self._in_flight = 0
+        self._in_flight_by_key: dict[str, int] = {}
+        self._seq = itertools.count()
+
+    async def submit(
+        self,
+        engine: Engine,
+        agent: Agent,
+        initial_input: str = "",
+        tenant: str = "default",
+        priority: Priority = Priority.DEFAULT,
+        cost: float = 1.0,
+        deadline: Deadline | float | None = None,
+    ) -> str:
+        """Queue a run and wait for its result."""
+        if self.max_queue is not None and self.queue_depth() >= self.max_queue:
+            self.stats.rejected += 1
+            raise QueueFull("scheduler queue is full")
+
+        job = _Job(
+            engine=engine,
+            agent=agent,
+            initial_input=initial_input,
+            deadline=deadline,
+            tenant=tenant,
+            priority=priority,
+            key=provider_key(agent.provider),
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.perf_counter(),
+        )
+        weight = max(self.tenant_weights.get(tenant, 1.0), 1e-6)
+        job.start_tag = max(
+            self._virtual_time[priority], self._last_finish.get((priority, tenant), 0.0)
+        )
+        job.finish_tag = job.start_tag + max(cost, 0.0) / weight
+        self._last_finish[(priority, tenant)] = job.finish_tag
+        heapq.heappush(self._queues[priority], (job.finish_tag, next(self._seq), job))
+        self.stats.submitted += 1
+        SCHEDULER_QUEUE_DEPTH.inc(priority=priority.name.lower())
+        self._dispatch()
+
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            job.cancelled = True
+            if job.task is not None:
+                job.task.cancel()
+            else:
+                SCHEDULER_QUEUE_DEPTH.dec(priority=priority.name.lower())
+            raise
+
+    def queue_depth(self, priority: Priority | None = None) -> int:
+        if priority is not None:
+            return sum(1 for *_, job in self._queues[priority] if not job.cancelled)
+        return sum(self.queue_depth(p) for p in Priority)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "in_flight": self._in_flight,
+            "in_flight_by_provider": dict(self._in_flight_by_key),
+            "queue_depth": {p.name.lower(): self.queue_depth(p) for p in Priority},
+            "submitted": self.stats.submitted,
+            "completed": self.stats.completed,
+            "failed": self.stats.failed,
+            "rejected": self.stats.rejected,
+            "average_wait_ms": {
+                p.name.lower(): round(self.stats.average_wait_ms(p), 2) for p in Priority
+            },
+            "max_wait_ms": {k: round(v, 2) for k, v in self.stats.wait_max_ms.items()},
+        }
+
+    def _dispatch(self) -> None:
+        for priority in Priority:
+            queue = self._queues[priority]
+            skipped: list[tuple[float, int, _Job]] = []
+            while queue and self._has_slot(priority):
+                item = heapq.heappop(queue)
+                job = item[2]
+                if job.cancelled:
+                    continue
+                if not self._key_has_slot(job.key):
+                    skipped.append(item)
+                    continue
+                self._start(job)
+            for item in skipped:
+                heapq.heappush(queue, item)
+
+    def _has_slot(self, priority: Priority) -> bool:
+        limit = self.max_concurrency
+        if priority != Priority.INTERACTIVE:
+            limit -= self.reserved_interactive
+        return self._in_flight < limit
+
+    def _key_has_slot(self, key: str) -> bool:
+        limit = self.provider_limits.get(key)
+        if limit is None:
+            limit = self.provider_limits.get(key.split("/", 1)[0])
+        return limit is None or self._in_flight_by_key.get(key, 0) < limit
+
+    def _start(self, job: _Job) -> None:
+        waited_ms = (time.perf_counter() - job.enqueued_at) * 1000
+        self.stats.track_wait(job.priority, waited_ms)
+        self._virtual_time[job.priority] = max(self._virtual_time[job.priority], job.start_tag)
+        self._in_flight += 1
+        self._in_flight_by_key[job.key] = self._in_flight_by_key.get(job.key, 0) + 1
+        SCHEDULER_QUEUE_DEPTH.dec(priority=job.priority.name.lower())
+        SCHEDULER_IN_FLIGHT.inc(provider=job.key)
+        if self.logger:
+            self.logger.info(
+                "scheduler_dispatch",
+                extra={
+                    "extra_data": {
+                        "tenant": job.tenant,
+                        "priority": job.priority.name.lower(),
+                        "provider": job.key,
+                        "wait_ms": round(waited_ms, 2),
+                    }
+                },
+            )
+        job.task = asyncio.create_task(
+            job.engine.run(job.agent, initial_input=job.initial_input, deadline=job.deadline)
+        )
+        job.task.add_done_callback(lambda task: self._finish(job, task))
+
+    def _finish(self, job: _Job, task: asyncio.Task[str]) -> None:
+        self._in_flight -= 1
+        self._in_flight_by_key[job.key] -= 1
+        SCHEDULER_IN_FLIGHT.dec(provider=job.key)
+        if task.cancelled():
+            if not job.future.done():
+                job.future.cancel()
+        elif (error := task.exception()) is not None:
+            self.stats.failed += 1
+            if not job.future.done():
+                job.future.set_exception(error)
+        else:
+            self.stats.completed += 1
+            if not job.future.done():
+                job.future.set_result(task.result())
+        self._dispatch()
@@ -0,0 +1,250 @@
+"""Multi-process execution backend for engine runs."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event
+from typing import Any
+
+from forgeai.agent.base import Agent
+from forgeai.engine.engine import Engine
+from forgeai.engine.job_queue import BaseJobQueue, Job, SQLiteJobQueue
+
+
+class JobFailed(RuntimeError):
+    """Raised when a pooled job finished with an error."""
+
+
+@dataclass(slots=True)
+class _WorkerHandle:
+    worker_id: str
+    process: BaseProcess
+    heartbeat: Synchronized[float]
+
+
+class WorkerPool:
+    """
+    Distributes `Engine` runs across worker processes through a pluggable job queue.
+
+    Jobs name a factory by import path (`"package.module:function"`). Inside the worker the
+    factory is called with the job kwargs and must return an `Agent` or an
+    `(Engine, Agent)` tuple; a default `Engine` built from `engine_options` is used otherwise.
+    """
+
+    def __init__(
+        self,
+        queue: BaseJobQueue | None = None,
+        workers: int | None = None,
+        engine_options: dict[str, Any] | None = None,
+        poll_interval_s: float = 0.05,
+        lease_s: float = 30.0,
+        health_timeout_s: float = 10.0,
+        max_attempts: int = 2,
+        mp_context: BaseContext | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.queue = queue or SQLiteJobQueue()
+        self.workers = workers or os.cpu_count() or 1
+        self.engine_options = engine_options or {}
+        self.poll_interval_s = poll_interval_s
+        self.lease_s = lease_s
+        self.health_timeout_s = health_timeout_s
+        self.max_attempts = max_attempts
+        self.logger = logger
+        self._ctx: Any = mp_context or multiprocessing.get_context("spawn")
+        self._stop: Event = self._ctx.Event()
+        self._handles: list[_WorkerHandle] = []
+        self._monitor: asyncio.Task[None] | None = None
+        self._accepting = False
+
+    async def start(self) -> None:
+        """Start worker processes and the health monitor."""
+        if self._handles:
+            return
+        self._stop.clear()
+        for _ in range(self.workers):
+            self._handles.append(self._spawn())
+        self._accepting = True
+        self._monitor = asyncio.create_task(self._monitor_loop())
+
+    async def submit(
+        self,
+        factory: str,
+        input: str = "",
+        deadline_s: float | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Queue an engine run and return its job id."""
+        if not self._accepting:
+            raise RuntimeError("WorkerPool is not accepting jobs")
+        job = Job(factory=factory, input=input, kwargs=kwargs, deadline_s=deadline_s)
+        return await asyncio.to_thread(self.queue.put, job)
+
+    async def result(self, job_id: str, timeout_s: float | None = None) -> str:
+        """Wait for a job result, raising `JobFailed` if the run failed."""
+        started = time.monotonic()
+        delay = self.poll_interval_s
+        while True:
+            job = await asyncio.to_thread(self.queue.get, job_id)
+            if job is None:
+                raise KeyError(f"Unknown job_id: {job_id}")
+            if job.status == "done":
+                return job.result or ""
+            if job.status == "failed":
+                raise JobFailed(job.error or "job failed")
+            if timeout_s is not None and time.monotonic() - started >= timeout_s:
+                raise TimeoutError(f"Job {job_id} did not finish in {timeout_s}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    async def run(self, factory: str, input: str = "", **kwargs: Any) -> str:
+        """Submit a job and wait for its result."""
+        job_id = await self.submit(factory, input, **kwargs)
+        return await self.result(job_id)
+
+    def healthy_workers(self) -> int:
+        now = time.time()
+        return sum(
+            1
+            for handle in self._handles
+            if handle.process.is_alive() and now - handle.heartbeat.value < self.health_timeout_s
+        )
+
+    async def drain(self, timeout_s: float | None = None) -> None:
+        """Stop accepting jobs and wait until queued and running jobs have finished."""
+        self._accepting = False
+        started = time.monotonic()
+        while True:
+            counts = await asyncio.to_thread(self.queue.counts)
+            if counts["queued"] == 0 and counts["running"] == 0:
+                return
+            if timeout_s is not None and time.monotonic() - started >= timeout_s:
+                raise TimeoutError("WorkerPool drain timed out")
+            await asyncio.sleep(self.poll_interval_s)
+
+    async def stop(self, graceful: bool = True, timeout_s: float = 30.0) -> None:
+        """Stop workers; graceful stops drain the queue first."""
+        if graceful:
+            await self.drain(timeout_s)
+        self._accepting = False
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+        self._stop.set()
+        for handle in self._handles:
+            await asyncio.to_thread(handle.process.join, timeout_s)
+            if handle.process.is_alive():
+                handle.process.terminate()
+        self._handles = []
+
+    def check_health(self) -> int:
+        """Replace dead or unresponsive workers and requeue their jobs. Returns replacements."""
+        replaced = 0
+        now = time.time()
+        for index, handle in enumerate(self._handles):
+            alive = handle.process.is_alive()
+            stale = now - handle.heartbeat.value > self.health_timeout_s
+            if alive and not stale:
+                continue
+            if alive:
+                handle.process.terminate()
+                handle.process.join(1.0)
+            self._log("worker_replaced", {"worker_id": handle.worker_id, "stale": stale})
+            self._handles[index] = self._spawn()
+            replaced += 1
+        self.queue.requeue_expired(self.max_attempts)
+        return replaced
+
+    async def _monitor_loop(self) -> None:
+        interval = max(min(self.health_timeout_s, self.lease_s) / 3, self.poll_interval_s)
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.check_health)
+
+    def _spawn(self) -> _WorkerHandle:
+        worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+        heartbeat = self._ctx.Value("d", time.time())
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                self.queue,
+                worker_id,
+                self._stop,
+                heartbeat,
+                self.engine_options,
+                self.poll_interval_s,
+                self.lease_s,
+            ),
+            name=worker_id,
+            daemon=True,
+        )
+        process.start()
+        return _WorkerHandle(worker_id=worker_id, process=process, heartbeat=heartbeat)
+
+    def _log(self, message: str, data: dict[str, object]) -> None:
+        if self.logger:
+            self.logger.warning(message, extra={"extra_data": data})
+
+
+def _worker_main(
+    queue: BaseJobQueue,
+    worker_id: str,
+    stop: Event,
+    heartbeat: Synchronized[float],
+    engine_options: dict[str, Any],
+    poll_interval_s: float,
+    lease_s: float,
+) -> None:
+    current: list[str] = []
+
+    def beat() -> None:
+        while not stop.is_set():
+            heartbeat.value = time.time()
+            if current:
+                queue.renew(current[0], worker_id, lease_s)
+            time.sleep(min(lease_s / 3, 1.0))
+
+    threading.Thread(target=beat, name=f"{worker_id}-heartbeat", daemon=True).start()
+    while not stop.is_set():
+        job = queue.claim(worker_id, lease_s)
+        if job is None:
+            time.sleep(poll_interval_s)
+            continue
+        current[:] = [job.id]
+        # Both return False when the lease was lost; the job then belongs to another worker.
+        try:
+            result = asyncio.run(_execute(job, engine_options))
+        except Exception as exc:  # noqa: BLE001
+            queue.fail(job.id, worker_id, f"{type(exc).__name__}: {exc}")
+        else:
+            queue.complete(job.id, worker_id, result)
+        finally:
+            current.clear()
+
+
+async def _execute(job: Job, engine_options: dict[str, Any]) -> str:
+    module_name, _, attr = job.factory.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr)
+    built = factory(**job.kwargs)
+    if isinstance(built, tuple):
+        engine, agent = built
+    else:
+        engine, agent = Engine(**engine_options), built
+    if not isinstance(agent, Agent) or not isinstance(engine, Engine):
+        raise TypeError(f"Factory {job.factory} must return Agent or (Engine, Agent)")
+    return await engine.run(agent, initial_input=job.input, deadline=job.deadline_s)
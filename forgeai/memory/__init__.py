@@ -1,6 +1,19 @@
 """Memory interfaces and implementations."""
 
 from forgeai.memory.base import BaseMemory
+from forgeai.memory.blackboard import (
+    BlackboardEntry,
+    BlackboardMemory,
+    Subscription,
+    VersionConflict,
+)
 from forgeai.memory.short_term import ShortTermMemory
 
-__all__ = ["BaseMemory", "ShortTermMemory"]
+__all__ = [
+    "BaseMemory",
+    "BlackboardEntry",
+    "BlackboardMemory",
+    "ShortTermMemory",
+    "Subscription",
+    "VersionConflict",
+]
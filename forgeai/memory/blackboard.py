@@ -0,0 +1,172 @@
+"""Shared, versioned blackboard memory for concurrently running agents."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from forgeai.memory.base import BaseMemory
+from forgeai.memory.short_term import ShortTermMemory
+
+
+class VersionConflict(RuntimeError):
+    """Raised when a conditional publish sees a different version than expected."""
+
+    def __init__(self, key: str, expected: int, actual: int) -> None:
+        super().__init__(f"Version conflict on '{key}': expected {expected}, found {actual}")
+        self.key = key
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass(frozen=True, slots=True)
+class BlackboardEntry:
+    """A published value and the version it was written at (versions start at 1)."""
+
+    key: str
+    value: str
+    version: int
+    author: str | None = None
+    updated_at: float = field(default_factory=time.time)
+
+
+class Subscription:
+    """Bounded stream of entries published under a key prefix; oldest items drop when full."""
+
+    def __init__(self, board: _BoardState, prefix: str, maxsize: int) -> None:
+        self._board = board
+        self.prefix = prefix
+        self._queue: asyncio.Queue[BlackboardEntry] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def _deliver(self, entry: BlackboardEntry) -> None:
+        if not entry.key.startswith(self.prefix):
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(entry)
+
+    async def get(self) -> BlackboardEntry:
+        return await self._queue.get()
+
+    def close(self) -> None:
+        if self in self._board.subscribers:
+            self._board.subscribers.remove(self)
+
+    def __aiter__(self) -> AsyncIterator[BlackboardEntry]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[BlackboardEntry]:
+        while True:
+            yield await self._queue.get()
+
+
+@dataclass(slots=True)
+class _BoardState:
+    entries: dict[str, BlackboardEntry] = field(default_factory=dict)
+    log: list[tuple[str, str]] = field(default_factory=list)
+    subscribers: list[Subscription] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class BlackboardMemory(BaseMemory):
+    """
+    Key/value board shared by a team, with optimistic versioning and change subscriptions.
+
+    `namespace(name)` returns a view over the same board whose relative keys are prefixed
+    with `name/`; keys starting with `/` are absolute. `publish` with `expected_version`
+    is a compare-and-set (0 means "must not exist yet"). As `BaseMemory`, `add` appends to
+    the namespace log and `get_context` ranks log entries and published values together,
+    so agents pick up each other's intermediate results without a full handoff.
+    """
+
+    def __init__(
+        self,
+        context_window: int = 6,
+        max_log_entries: int = 200,
+        namespace: str = "",
+        _state: _BoardState | None = None,
+    ) -> None:
+        self._state = _state or _BoardState()
+        self._context_window = context_window
+        self._max_log_entries = max_log_entries
+        self.prefix = f"{namespace.strip('/')}/" if namespace.strip("/") else ""
+
+    def namespace(self, name: str) -> BlackboardMemory:
+        return BlackboardMemory(
+            context_window=self._context_window,
+            max_log_entries=self._max_log_entries,
+            namespace=f"{self.prefix}{name}",
+            _state=self._state,
+        )
+
+    def resolve(self, key: str) -> str:
+        return key[1:] if key.startswith("/") else f"{self.prefix}{key}"
+
+    async def get(self, key: str) -> BlackboardEntry | None:
+        return self._state.entries.get(self.resolve(key))
+
+    async def publish(
+        self,
+        key: str,
+        value: str,
+        expected_version: int | None = None,
+        author: str | None = None,
+    ) -> BlackboardEntry:
+        """Write `value`; with `expected_version`, raise `VersionConflict` if it is stale."""
+        full_key = self.resolve(key)
+        async with self._state.lock:
+            current = self._state.entries.get(full_key)
+            version = current.version if current else 0
+            if expected_version is not None and expected_version != version:
+                raise VersionConflict(full_key, expected_version, version)
+            entry = BlackboardEntry(full_key, value, version + 1, author)
+            self._state.entries[full_key] = entry
+        self._notify(entry)
+        return entry
+
+    async def compare_and_set(self, key: str, value: str, expected_version: int) -> bool:
+        try:
+            await self.publish(key, value, expected_version=expected_version)
+        except VersionConflict:
+            return False
+        return True
+
+    async def keys(self, prefix: str = "") -> list[str]:
+        full_prefix = self.resolve(prefix)
+        return sorted(key for key in self._state.entries if key.startswith(full_prefix))
+
+    def subscribe(self, prefix: str = "", maxsize: int = 100) -> Subscription:
+        """Subscribe to entries published under `prefix` (relative to this namespace)."""
+        subscription = Subscription(self._state, self.resolve(prefix), maxsize)
+        self._state.subscribers.append(subscription)
+        return subscription
+
+    async def add(self, entry: str) -> None:
+        async with self._state.lock:
+            self._state.log.append((self.prefix, entry))
+            if len(self._state.log) > self._max_log_entries:
+                del self._state.log[: -self._max_log_entries]
+
+    async def get_context(self, query: str) -> str:
+        async with self._state.lock:
+            own_log = [text for prefix, text in self._state.log if prefix == self.prefix]
+            published = [f"[{e.key}] {e.value}" for e in self._state.entries.values()]
+        candidates = own_log + published
+        if not candidates:
+            return "No memory yet."
+        if not query.strip():
+            return "\n".join(candidates[-self._context_window :])
+        ranked = sorted(
+            candidates,
+            key=lambda text: ShortTermMemory._score(query, text),
+            reverse=True,
+        )
+        return "\n".join(ranked[: self._context_window])
+
+    def _notify(self, entry: BlackboardEntry) -> None:
+        for subscription in list(self._state.subscribers):
+            subscription._deliver(entry)
@@ -1,6 +1,58 @@
 """Observability helpers."""
 
-from forgeai.observability.logger import bind_logger, get_logger
+from forgeai.observability.logger import (
+    JsonFormatter,
+    LazyPayload,
+    RateLimitFilter,
+    SamplingFilter,
+    bind_logger,
+    get_logger,
+    log_event,
+    shutdown_logging,
+)
 from forgeai.observability.metrics import Metrics
+from forgeai.observability.profiling import LoopLagMonitor, RunProfiler
+from forgeai.observability.registry import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from forgeai.observability.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    current_span,
+    set_tracer,
+    span,
+)
 
-__all__ = ["bind_logger", "get_logger", "Metrics"]
+__all__ = [
+    "bind_logger",
+    "Counter",
+    "current_span",
+    "FileSpanExporter",
+    "Gauge",
+    "get_logger",
+    "Histogram",
+    "InMemorySpanExporter",
+    "JsonFormatter",
+    "LazyPayload",
+    "log_event",
+    "LoopLagMonitor",
+    "Metrics",
+    "MetricsRegistry",
+    "RateLimitFilter",
+    "REGISTRY",
+    "RunProfiler",
+    "SamplingFilter",
+    "set_tracer",
+    "shutdown_logging",
+    "Span",
+    "span",
+    "SpanExporter",
+    "Tracer",
+]
@@ -2,9 +2,57 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from typing import Any
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+LogData = Mapping[str, object] | Callable[[], Mapping[str, object]]
+
+
+def dumps(payload: Any) -> str:
+    """Serialize to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(payload, default=str)
+
+
+class LazyPayload:
+    """Structured log data built on first use, so filtered-out records cost nothing."""
+
+    __slots__ = ("_factory", "_value")
+
+    def __init__(self, factory: Callable[[], Mapping[str, object]]) -> None:
+        self._factory: Callable[[], Mapping[str, object]] | None = factory
+        self._value: Mapping[str, object] = {}
+
+    def resolve(self) -> Mapping[str, object]:
+        if self._factory is not None:
+            self._value = self._factory()
+            self._factory = None
+        return self._value
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+
+def _extra(record: logging.LogRecord) -> Any:
+    data = getattr(record, "extra_data", None)
+    return data.resolve() if isinstance(data, LazyPayload) else data
 
 
 class JsonFormatter(logging.Formatter):
@@ -18,24 +66,148 @@ class JsonFormatter(logging.Formatter):
             "time": self.formatTime(record, self.datefmt),
         }
         if hasattr(record, "extra_data"):
-            payload["extra"] = getattr(record, "extra_data")
-        return json.dumps(payload, default=str)
+            payload["extra"] = _extra(record)
+        return dumps(payload)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of records for the given messages (event names)."""
+
+    def __init__(self, rates: Mapping[str, float], seed: int | None = None) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+        self._random = random.Random(seed)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.msg) if isinstance(record.msg, str) else None
+        return rate is None or self._random.random() < rate
+
 
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per message: at most `per_second` records (bursts up to `burst`).
 
-def get_logger(name: str = "forgeai", level: int = logging.INFO) -> logging.Logger:
-    """Build or return a configured structured logger."""
+    Warnings and errors always pass unless `include_errors` is set.
+    """
+
+    def __init__(
+        self,
+        per_second: float,
+        burst: int | None = None,
+        include_errors: bool = False,
+    ) -> None:
+        super().__init__()
+        self.per_second = per_second
+        self.burst = float(burst if burst is not None else max(1, int(per_second)))
+        self.include_errors = include_errors
+        self.dropped = 0
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING and not self.include_errors:
+            return True
+        key = str(record.msg)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.per_second)
+            allowed = tokens >= 1.0
+            self._buckets[key] = (tokens - 1.0 if allowed else tokens, now)
+            if not allowed:
+                self.dropped += 1
+        return allowed
+
+
+class _BackgroundQueueHandler(QueueHandler):
+    """Queue handler that defers formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve lazy data now (it may reference mutable state); skip formatting here.
+        if isinstance(getattr(record, "extra_data", None), LazyPayload):
+            record.extra_data = _extra(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Background loggers by name: the listener thread and the handler it writes through.
+_listeners: dict[str, tuple[QueueListener, logging.Handler]] = {}
+
+
+def get_logger(
+    name: str = "forgeai",
+    level: int = logging.INFO,
+    background: bool = False,
+    sample_rates: Mapping[str, float] | None = None,
+    max_per_second: float | None = None,
+    stream: TextIO | None = None,
+) -> logging.Logger:
+    """
+    Build or return a configured structured logger.
+
+    With `background=True`, records are queued and formatted and written by a listener
+    thread, so slow stderr or disk I/O does not stall the event loop. `sample_rates` keeps
+    a fraction of records per message and `max_per_second` rate-limits each message.
+    """
     logger = logging.getLogger(name)
     if logger.handlers:
         return logger
 
     logger.setLevel(level)
-    handler = logging.StreamHandler()
+    handler: logging.Handler = logging.StreamHandler(stream)
     handler.setFormatter(JsonFormatter())
+    if background:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(records, handler, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = (listener, handler)
+        handler = _BackgroundQueueHandler(records)
+    if sample_rates:
+        logger.addFilter(SamplingFilter(sample_rates))
+    if max_per_second is not None:
+        logger.addFilter(RateLimitFilter(max_per_second))
     logger.addHandler(handler)
     logger.propagate = False
     return logger
 
 
-def bind_logger(logger: logging.Logger, **fields: object) -> logging.LoggerAdapter:
+def shutdown_logging(name: str | None = None) -> None:
+    """
+    Flush and stop the background writer of logger `name`, or of every background logger.
+
+    The logger falls back to writing synchronously, so later records are not lost.
+    """
+    names = [name] if name is not None else list(_listeners)
+    for logger_name in names:
+        entry = _listeners.pop(logger_name, None)
+        if entry is None:
+            continue
+        listener, handler = entry
+        listener.stop()
+        logger = logging.getLogger(logger_name)
+        for queued in [h for h in logger.handlers if isinstance(h, _BackgroundQueueHandler)]:
+            logger.removeHandler(queued)
+            logger.addHandler(handler)
+
+
+atexit.register(shutdown_logging)
+
+
+def log_event(logger: logging.Logger | None, level: int, message: str, data: LogData) -> None:
+    """Log structured `data` only if `level` is enabled; callables are built lazily."""
+    if logger is None or not logger.isEnabledFor(level):
+        return
+    payload = LazyPayload(data) if callable(data) else data
+    logger.log(level, message, extra={"extra_data": payload})
+
+
+def bind_logger(
+    logger: logging.Logger, **fields: object
+) -> logging.LoggerAdapter[logging.Logger]:
     """Attach constant structured fields to every log entry."""
     return logging.LoggerAdapter(logger, extra={"extra_data": fields})
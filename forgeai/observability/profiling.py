@@ -0,0 +1,189 @@
+"""Opt-in profiling: event-loop lag monitoring and per-run cProfile capture."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from forgeai.observability.logger import log_event
+from forgeai.observability.registry import REGISTRY
+
+LOOP_LAG = REGISTRY.histogram(
+    "forgeai_event_loop_lag_seconds",
+    "Delay between when a loop callback was due and when it ran.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+LOOP_STALLS = REGISTRY.counter(
+    "forgeai_event_loop_stalls_total",
+    "Event-loop delays above the monitor threshold.",
+)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a periodic callback.
+
+    Lag above `threshold_ms` is logged as `event_loop_lag`. With `capture_stacks`, a
+    watchdog thread also logs the loop thread's stack while it is blocked, which points at
+    the synchronous code responsible (e.g. scoring, JSON formatting, a blocking client).
+    """
+
+    def __init__(
+        self,
+        interval_s: float = 0.1,
+        threshold_ms: float = 100.0,
+        capture_stacks: bool = True,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.interval_s = interval_s
+        self.threshold_ms = threshold_ms
+        self.capture_stacks = capture_stacks
+        self.logger = logger
+        self.max_lag_ms = 0.0
+        self.stalls = 0
+        self.stacks: list[str] = []
+        self._heartbeat = time.monotonic()
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stopped.clear()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._tick(), name="forgeai-loop-lag")
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(threading.get_ident(),),
+                name="forgeai-loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    async def __aenter__(self) -> LoopLagMonitor:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def _tick(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            now = time.monotonic()
+            self._heartbeat = now
+            lag_ms = max(0.0, (now - expected) * 1000)
+            LOOP_LAG.observe(lag_ms / 1000)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            if lag_ms >= self.threshold_ms:
+                self.stalls += 1
+                LOOP_STALLS.inc()
+                log_event(self.logger, logging.WARNING, "event_loop_lag", {"lag_ms": lag_ms})
+
+    def _watch(self, loop_thread_id: int) -> None:
+        reported_for = 0.0
+        poll_s = min(self.interval_s, self.threshold_ms / 1000) / 2
+        while not self._stopped.wait(poll_s):
+            heartbeat = self._heartbeat
+            overdue_ms = (time.monotonic() - heartbeat - self.interval_s) * 1000
+            if overdue_ms < self.threshold_ms or heartbeat == reported_for:
+                continue
+            reported_for = heartbeat
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            self.stacks.append(stack)
+            log_event(
+                self.logger,
+                logging.WARNING,
+                "event_loop_blocked",
+                {"blocked_ms": round(overdue_ms, 1), "stack": stack},
+            )
+
+
+class RunProfiler:
+    """
+    Captures cProfile data for engine runs and saves it as `{directory}/{run_id}.prof`.
+
+    With `always=True` every profiled run is saved; otherwise only runs slower than
+    `slow_threshold_s`. cProfile observes the whole thread, so a profile also contains
+    other coroutines that ran on the loop meanwhile, and only one run per process is
+    profiled at a time (`skipped` counts runs that found profiling busy). Load files with
+    `pstats`.
+    """
+
+    _active = False  # cProfile hooks are per thread, so share one slot process-wide.
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = "profiles",
+        always: bool = False,
+        slow_threshold_s: float | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if not always and slow_threshold_s is None:
+            raise ValueError("set always=True or slow_threshold_s")
+        self.directory = Path(directory)
+        self.always = always
+        self.slow_threshold_s = slow_threshold_s
+        self.logger = logger
+        self.saved: list[Path] = []
+        self.skipped = 0
+
+    @contextmanager
+    def profile(self, run_id: str) -> Iterator[None]:
+        if RunProfiler._active:
+            self.skipped += 1
+            yield
+            return
+        RunProfiler._active = True
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            RunProfiler._active = False
+            elapsed = time.perf_counter() - started
+            if self.always or (
+                self.slow_threshold_s is not None and elapsed >= self.slow_threshold_s
+            ):
+                self._save(profiler, run_id, elapsed)
+
+    def _save(self, profiler: cProfile.Profile, run_id: str, elapsed: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        safe_id = re.sub(r"[^\w.-]", "_", run_id)
+        path = self.directory / f"{safe_id}.prof"
+        profiler.dump_stats(path)
+        self.saved.append(path)
+        log_event(
+            self.logger,
+            logging.INFO,
+            "run_profile_saved",
+            {"run_id": run_id, "path": str(path), "duration_s": round(elapsed, 3)},
+        )
@@ -0,0 +1,343 @@
+"""Process-wide labelled metrics with Prometheus text exposition."""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, TypeVar
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "buckets", "counts", "sum", "count")
+
+    def __init__(self, lock: threading.Lock, buckets: Sequence[float]) -> None:
+        self._lock = lock
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+ChildT = TypeVar("ChildT", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(Generic[ChildT]):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[LabelValues, ChildT] = {}
+
+    def labels(self, **labels: object) -> ChildT:
+        """Return the series for these label values (all label names are required)."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self) -> ChildT:
+        raise NotImplementedError
+
+    def _series(self) -> Iterator[tuple[LabelValues, ChildT]]:
+        with self._lock:
+            items = list(self._children.items())
+        return iter(sorted(items, key=lambda item: item[0]))
+
+    def _label_text(self, values: LabelValues, extra: str = "") -> str:
+        pairs = zip(self.labelnames, values, strict=True)
+        parts = [f'{name}="{_escape(value)}"' for name, value in pairs]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.help)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for values, child in self._series():
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: LabelValues, child: ChildT) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        self.labels(**labels).inc(amount)
+
+    def _render_child(self, values: LabelValues, child: _CounterChild) -> list[str]:
+        return [f"{self.name}{self._label_text(values)} {_format(child.value)}"]
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def set(self, value: float, **labels: object) -> None:
+        self.labels(**labels).set(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        self.labels(**labels).inc(amount)
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.labels(**labels).dec(amount)
+
+    def _render_child(self, values: LabelValues, child: _GaugeChild) -> list[str]:
+        return [f"{self.name}{self._label_text(values)} {_format(child.value)}"]
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Cumulative bucketed distribution with `_sum` and `_count` series."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+    def observe(self, value: float, **labels: object) -> None:
+        self.labels(**labels).observe(value)
+
+    def _render_child(self, values: LabelValues, child: _HistogramChild) -> list[str]:
+        with self._lock:
+            counts, total, count = list(child.counts), child.sum, child.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+            cumulative += bucket_count
+            le = f'le="{_format(bound)}"'
+            lines.append(f"{self.name}_bucket{self._label_text(values, le)} {cumulative}")
+        labels = self._label_text(values)
+        lines.append(f"{self.name}_sum{labels} {_format(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", Counter, Gauge, Histogram)
+
+
+class MetricsRegistry:
+    """
+    Named metrics rendered together in the Prometheus text format.
+
+    Registration is get-or-create, so modules can declare the series they record at
+    import time. Recording takes one short lock per metric and is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def get(self, name: str) -> _Metric[Any] | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            raise ValueError(f"metric '{metric.name}' is already registered differently")
+        return existing
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Standard series recorded by forgeai components.
+PROVIDER_REQUESTS = REGISTRY.counter(
+    "forgeai_provider_requests_total",
+    "Provider generate calls by outcome (ok, error, fallback).",
+    ("provider", "model", "agent", "outcome"),
+)
+PROVIDER_LATENCY = REGISTRY.histogram(
+    "forgeai_provider_latency_seconds",
+    "Provider generate latency.",
+    ("provider", "model"),
+)
+ENGINE_RUNS = REGISTRY.counter(
+    "forgeai_engine_runs_total",
+    "Engine runs by outcome (ok, error, deadline).",
+    ("agent", "outcome"),
+)
+ENGINE_IN_FLIGHT = REGISTRY.gauge(
+    "forgeai_engine_runs_in_flight",
+    "Engine runs currently executing.",
+    ("agent",),
+)
+ENGINE_RETRIES = REGISTRY.counter(
+    "forgeai_engine_retries_total",
+    "Failed engine iterations that were retried.",
+    ("agent",),
+)
+TOOL_CALLS = REGISTRY.counter(
+    "forgeai_tool_calls_total",
+    "Tool invocations by outcome (ok, error, timeout, cancelled).",
+    ("tool", "outcome"),
+)
+TOOL_DURATION = REGISTRY.histogram(
+    "forgeai_tool_duration_seconds",
+    "Tool run time, excluding bulkhead queueing.",
+    ("tool",),
+)
+TOOL_QUEUE_WAIT = REGISTRY.histogram(
+    "forgeai_tool_queue_wait_seconds",
+    "Time spent waiting for a tool bulkhead slot.",
+    ("tool",),
+)
+TOOL_IN_FLIGHT = REGISTRY.gauge(
+    "forgeai_tool_in_flight",
+    "Tool calls currently running.",
+    ("tool",),
+)
+SCHEDULER_QUEUE_DEPTH = REGISTRY.gauge(
+    "forgeai_scheduler_queue_depth",
+    "Runs waiting in the scheduler.",
+    ("priority",),
+)
+SCHEDULER_IN_FLIGHT = REGISTRY.gauge(
+    "forgeai_scheduler_in_flight",
+    "Runs dispatched by the scheduler and still running.",
+    ("provider",),
+)
+JOB_REQUESTS = REGISTRY.counter(
+    "forgeai_jobs_total",
+    "Async job submissions and outcomes (accepted, rejected, done, failed, cancelled).",
+    ("outcome",),
+)
+JOB_QUEUE_DEPTH = REGISTRY.gauge(
+    "forgeai_jobs_queued",
+    "Async jobs accepted but not yet started.",
+)
+JOBS_RUNNING = REGISTRY.gauge(
+    "forgeai_jobs_running",
+    "Async jobs currently running.",
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "forgeai_cache_requests_total",
+    "Cache lookups by cache name and result (hit, miss).",
+    ("cache", "result"),
+)
+SEMANTIC_CACHE_SIMILARITY = REGISTRY.histogram(
+    "forgeai_semantic_cache_similarity",
+    "Best cosine similarity found per semantic cache lookup, by result (hit, miss).",
+    ("result",),
+    buckets=(0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.92, 0.94, 0.96, 0.98, 0.99, 1.0),
+)
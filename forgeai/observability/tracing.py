@@ -0,0 +1,259 @@
+"""Lightweight hierarchical tracing with OpenTelemetry-compatible JSON export."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from forgeai.observability.logger import dumps
+
+AttributeValue = str | int | float | bool
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed operation; `parent_id` links it into its trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    status: str = "UNSET"
+    status_message: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Span in OTLP/JSON field layout."""
+        payload: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": {"UNSET": 0, "OK": 1, "ERROR": 2}[self.status]},
+        }
+        if self.parent_id:
+            payload["parentSpanId"] = self.parent_id
+        if self.status_message:
+            payload["status"]["message"] = self.status_message
+        return payload
+
+
+class _NoopSpan(Span):
+    """Span handed out when tracing is disabled; attributes are discarded."""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        return None
+
+    def set_error(self, exc: BaseException) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan(name="noop", trace_id="0" * 32, span_id="0" * 16)
+
+
+def _otlp_attribute(key: str, value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        typed: dict[str, Any] = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def otlp_document(spans: Sequence[Span], service_name: str = "forgeai") -> dict[str, Any]:
+    """Wrap spans in an OTLP/JSON `ExportTraceServiceRequest` document."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", service_name)],
+                },
+                "scopeSpans": [
+                    {"scope": {"name": "forgeai"}, "spans": [s.to_otlp() for s in spans]}
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(ABC):
+    """Receives finished spans."""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        """Export a batch of finished spans."""
+
+    def shutdown(self) -> None:  # noqa: B027 - optional hook
+        """Flush and release resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and ad-hoc inspection."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def by_name(self, name: str) -> list[Span]:
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends one OTLP/JSON document per finished trace to a JSONL file.
+
+    Spans are buffered per trace and handed to a writer thread when the root span ends,
+    so one line holds a whole request and serialization and file I/O stay off the event
+    loop. `flush()` waits for queued traces; `shutdown()` (also run at exit) writes
+    unfinished traces and stops the writer. Set `service_name` to tag the resource.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], service_name: str = "forgeai") -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.service_name = service_name
+        self._pending: dict[str, list[Span]] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="forgeai-span-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.shutdown)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            for span in spans:
+                self._pending.setdefault(span.trace_id, []).append(span)
+                if span.parent_id is None:
+                    self._queue.put(self._pending.pop(span.trace_id))
+
+    def flush(self) -> None:
+        """Block until every trace queued so far is written."""
+        if self._writer.is_alive():
+            self._queue.join()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        if not self._writer.is_alive():
+            return
+        for batch in pending:
+            self._queue.put(batch)
+        self._queue.put(None)
+        self._writer.join()
+        atexit.unregister(self.shutdown)
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                line = dumps(otlp_document(batch, self.service_name))
+                with self.path.open("a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+            except Exception:
+                # Keep the writer alive; one unwritable trace must not drop the rest.
+                logging.getLogger(__name__).exception("span export to %s failed", self.path)
+            finally:
+                self._queue.task_done()
+
+
+_current_span: ContextVar[Span | None] = ContextVar("forgeai_current_span", default=None)
+
+
+class Tracer:
+    """Creates spans whose parent is the span active in the current context."""
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, **attributes: AttributeValue) -> Iterator[Span]:
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self.exporter.export([span])
+
+
+_tracer: Tracer | None = None
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install the process-wide tracer (`None` disables tracing)."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: AttributeValue) -> Iterator[Span]:
+    """Trace a block with the installed tracer; a no-op span when tracing is off."""
+    tracer = _tracer
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    with tracer.span(name, **attributes) as active:
+        yield active
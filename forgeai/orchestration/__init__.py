@@ -1,5 +1,31 @@
 """Orchestration utilities."""
 
+from forgeai.orchestration.cascade import (
+    CascadeProvider,
+    CascadeStats,
+    ConfidenceValidator,
+    SchemaValidator,
+    VerifierValidator,
+)
+from forgeai.orchestration.chunking import Chunker, split_sections
+from forgeai.orchestration.graph import AgentGraph, GraphResult, NodeFailed, default_join
+from forgeai.orchestration.map_reduce import MapReduceTeam
+from forgeai.orchestration.pipeline import PipelineTeam
 from forgeai.orchestration.team import AgentTeam
 
-__all__ = ["AgentTeam"]
+__all__ = [
+    "AgentGraph",
+    "AgentTeam",
+    "CascadeProvider",
+    "CascadeStats",
+    "Chunker",
+    "ConfidenceValidator",
+    "GraphResult",
+    "MapReduceTeam",
+    "NodeFailed",
+    "PipelineTeam",
+    "SchemaValidator",
+    "VerifierValidator",
+    "default_join",
+    "split_sections",
+]
@@ -0,0 +1,148 @@
+"""Model cascades: answer with a cheap provider, escalate only when validation fails."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+
+from forgeai.agent.base import Agent
+from forgeai.deadline import DeadlineExceeded
+from forgeai.providers.base import FALLBACK_MARKER, BaseProvider
+from forgeai.schemas.agent_schema import AgentResponse
+
+Validator = Callable[[str, str], Awaitable[bool]]
+
+
+def parse_structured(output: str) -> AgentResponse | None:
+    """Parse provider output as an `AgentResponse`, or None if it is not valid JSON for one."""
+    return Agent._parse_response(output)
+
+
+class SchemaValidator:
+    """Accept outputs that parse into an `AgentResponse` with a final answer or tool call."""
+
+    async def __call__(self, prompt: str, output: str) -> bool:
+        _ = prompt
+        parsed = parse_structured(output)
+        return parsed is not None and bool(parsed.final or parsed.tool_call)
+
+
+class ConfidenceValidator:
+    """Accept outputs whose self-reported `confidence` is at least `min_confidence`."""
+
+    def __init__(self, min_confidence: float = 0.7, accept_missing: bool = False) -> None:
+        self.min_confidence = min_confidence
+        self.accept_missing = accept_missing
+
+    async def __call__(self, prompt: str, output: str) -> bool:
+        _ = prompt
+        parsed = parse_structured(output)
+        if parsed is None or parsed.confidence is None:
+            return self.accept_missing
+        return parsed.confidence >= self.min_confidence
+
+
+class VerifierValidator:
+    """Ask a verifier agent whether the answer is acceptable; accepts replies starting `yes`."""
+
+    def __init__(self, verifier: Agent) -> None:
+        self.verifier = verifier
+
+    async def __call__(self, prompt: str, output: str) -> bool:
+        verdict = await self.verifier.run(
+            f"Task prompt:\n{prompt}\n\nCandidate answer:\n{output}\n\n"
+            "Is the candidate answer correct and complete? Reply 'yes' or 'no'."
+        )
+        return verdict.strip().lower().startswith("yes")
+
+
+@dataclass(slots=True)
+class CascadeStats:
+    """Counts of requests, escalations, and which tier served each request."""
+
+    requests: int = 0
+    escalations: int = 0
+    served_by_tier: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def escalation_rate(self) -> float:
+        if self.requests == 0:
+            return 0.0
+        return (self.requests - self.served_by_tier.get(0, 0)) / self.requests
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "requests": self.requests,
+            "escalations": self.escalations,
+            "escalation_rate": round(self.escalation_rate, 4),
+            "served_by_tier": dict(self.served_by_tier),
+        }
+
+
+class CascadeProvider(BaseProvider):
+    """
+    Provider that tries `tiers` in order, cheapest first.
+
+    An answer from a tier is returned once every validator accepts it; otherwise the
+    request escalates to the next tier. A tier that raises or answers with a provider
+    fallback (e.g. no API key, server unreachable) is escalated without validation. The last
+    tier's answer is always returned, and its errors propagate.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[BaseProvider],
+        validators: Sequence[Validator] = (),
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if not tiers:
+            raise ValueError("CascadeProvider requires at least one tier")
+        self.tiers = list(tiers)
+        self.validators = list(validators) or [SchemaValidator()]
+        self.logger = logger
+        self.model = "cascade"
+        self.stats = CascadeStats()
+
+    async def generate(self, prompt: str) -> str:
+        self.stats.requests += 1
+        for index, provider in enumerate(self.tiers[:-1]):
+            try:
+                output = await provider.generate(prompt)
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                reason = f"error: {type(exc).__name__}: {exc}"
+            else:
+                if FALLBACK_MARKER in output:
+                    reason = "fallback"
+                elif await self._accepts(prompt, output):
+                    self._served(index)
+                    return output
+                else:
+                    reason = "rejected"
+            self.stats.escalations += 1
+            if self.logger:
+                self.logger.info(
+                    "cascade_escalation",
+                    extra={
+                        "extra_data": {
+                            "from_tier": index,
+                            "provider": type(provider).__name__,
+                            "reason": reason,
+                            **self.stats.snapshot(),
+                        }
+                    },
+                )
+        output = await self.tiers[-1].generate(prompt)
+        self._served(len(self.tiers) - 1)
+        return output
+
+    def _served(self, tier: int) -> None:
+        self.stats.served_by_tier[tier] = self.stats.served_by_tier.get(tier, 0) + 1
+
+    async def _accepts(self, prompt: str, output: str) -> bool:
+        for validator in self.validators:
+            if not await validator(prompt, output):
+                return False
+        return True
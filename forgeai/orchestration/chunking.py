@@ -0,0 +1,33 @@
+"""Text chunkers shared by the streaming and map-reduce orchestrators."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+
+Chunker = Callable[[str], list[str]]
+
+
+def split_sections(text: str, max_chars: int = 2000) -> list[str]:
+    """
+    Split text on blank lines, packing paragraphs into sections of at most `max_chars`.
+
+    Paragraphs longer than `max_chars` are hard-split so no section exceeds the limit.
+    """
+    paragraphs = [part.strip() for part in re.split(r"\n\s*\n", text) if part.strip()]
+    sections: list[str] = []
+    current = ""
+    for paragraph in paragraphs:
+        while len(paragraph) > max_chars:
+            if current:
+                sections.append(current)
+                current = ""
+            sections.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if current and len(current) + 2 + len(paragraph) > max_chars:
+            sections.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        sections.append(current)
+    return sections
@@ -0,0 +1,182 @@
+"""Dependency-graph orchestration with concurrent independent branches."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from forgeai.agent.base import Agent
+
+JoinFn = Callable[[Mapping[str, str]], str]
+FailurePolicy = Literal["fail_fast", "skip_dependents", "continue"]
+
+
+class NodeFailed(RuntimeError):
+    """Raised under the `fail_fast` policy when a graph node fails."""
+
+    def __init__(self, node: str, error: BaseException) -> None:
+        super().__init__(f"Graph node '{node}' failed: {error}")
+        self.node = node
+        self.error = error
+
+
+def default_join(outputs: Mapping[str, str]) -> str:
+    """Pass a single upstream output through; label and concatenate several."""
+    if len(outputs) == 1:
+        return next(iter(outputs.values()))
+    return "\n\n".join(f"[{name}]\n{output}" for name, output in outputs.items())
+
+
+@dataclass(slots=True)
+class GraphNode:
+    """An agent plus the upstream nodes whose outputs it consumes."""
+
+    agent: Agent
+    inputs: tuple[str, ...] = ()
+    join: JoinFn = default_join
+    semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(1))
+
+
+@dataclass(slots=True)
+class GraphResult:
+    """Per-node outputs plus failed and skipped nodes of one graph run."""
+
+    outputs: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    skipped: set[str] = field(default_factory=set)
+    sinks: tuple[str, ...] = ()
+
+    @property
+    def output(self) -> str:
+        """Output of the sink node(s), joined when there are several."""
+        available = {name: self.outputs[name] for name in self.sinks if name in self.outputs}
+        return default_join(available) if available else ""
+
+    @property
+    def complete(self) -> bool:
+        return not self.errors and not self.skipped
+
+
+class AgentGraph:
+    """
+    Runs agents as a DAG: nodes start as soon as all of their inputs are ready.
+
+    Root nodes receive the initial input; other nodes receive `join(upstream_outputs)`.
+    `failure_policy` controls what happens when a node raises:
+    - `fail_fast`: cancel in-flight nodes and raise `NodeFailed`.
+    - `skip_dependents`: skip every node downstream of the failure, finish the rest.
+    - `continue`: run dependents on whatever inputs succeeded (skip only if none did).
+    """
+
+    def __init__(
+        self,
+        failure_policy: FailurePolicy = "fail_fast",
+        max_concurrency: int | None = None,
+    ) -> None:
+        self.failure_policy = failure_policy
+        self.max_concurrency = max_concurrency
+        self.nodes: dict[str, GraphNode] = {}
+
+    def add(
+        self,
+        name: str,
+        agent: Agent,
+        inputs: Sequence[str] = (),
+        join: JoinFn | None = None,
+        max_concurrency: int = 1,
+    ) -> AgentGraph:
+        """Register a node; `max_concurrency` bounds concurrent runs of this node's agent."""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate graph node: {name}")
+        self.nodes[name] = GraphNode(
+            agent=agent,
+            inputs=tuple(inputs),
+            join=join or default_join,
+            semaphore=asyncio.Semaphore(max_concurrency),
+        )
+        return self
+
+    def order(self) -> list[str]:
+        """Topological order of the nodes; raises `ValueError` on unknown inputs or cycles."""
+        for name, node in self.nodes.items():
+            unknown = [dep for dep in node.inputs if dep not in self.nodes]
+            if unknown:
+                raise ValueError(f"Node '{name}' depends on unknown nodes: {unknown}")
+
+        ordered: list[str] = []
+        state: dict[str, int] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle detected at graph node '{name}'")
+            state[name] = 1
+            for dep in self.nodes[name].inputs:
+                visit(dep)
+            state[name] = 2
+            ordered.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return ordered
+
+    def sinks(self) -> tuple[str, ...]:
+        consumed = {dep for node in self.nodes.values() for dep in node.inputs}
+        return tuple(name for name in self.nodes if name not in consumed)
+
+    async def run(self, initial_input: str = "") -> GraphResult:
+        order = self.order()
+        result = GraphResult(sinks=self.sinks())
+        limit = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        tasks: dict[str, asyncio.Task[str | None]] = {}
+        try:
+            async with asyncio.TaskGroup() as group:
+                for name in order:
+                    tasks[name] = group.create_task(
+                        self._run_node(name, tasks, result, initial_input, limit)
+                    )
+        except BaseExceptionGroup as group_error:
+            failures = [exc for exc in group_error.exceptions if isinstance(exc, NodeFailed)]
+            if failures:
+                raise failures[0] from failures[0].error
+            raise
+        return result
+
+    async def _run_node(
+        self,
+        name: str,
+        tasks: Mapping[str, asyncio.Task[str | None]],
+        result: GraphResult,
+        initial_input: str,
+        limit: asyncio.Semaphore | None,
+    ) -> str | None:
+        node = self.nodes[name]
+        upstream: dict[str, str] = {}
+        for dep in node.inputs:
+            value = await tasks[dep]
+            if value is not None:
+                upstream[dep] = value
+
+        missing = len(node.inputs) - len(upstream)
+        if missing and (self.failure_policy == "skip_dependents" or not upstream):
+            result.skipped.add(name)
+            return None
+
+        node_input = node.join(upstream) if node.inputs else initial_input
+        try:
+            async with node.semaphore:
+                if limit is None:
+                    output = await node.agent.run(node_input)
+                else:
+                    async with limit:
+                        output = await node.agent.run(node_input)
+        except Exception as exc:  # noqa: BLE001
+            if self.failure_policy == "fail_fast":
+                raise NodeFailed(name, exc) from exc
+            result.errors[name] = exc
+            return None
+        result.outputs[name] = output
+        return output
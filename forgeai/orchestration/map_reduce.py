@@ -0,0 +1,164 @@
+"""Map-reduce orchestration for inputs too large for a single prompt."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Callable, MutableMapping
+
+from forgeai.agent.base import Agent
+from forgeai.observability.registry import CACHE_REQUESTS
+from forgeai.orchestration.chunking import Chunker, split_sections
+
+AgentSource = Agent | Callable[[], Agent]
+# `Agent.run` records its input in memory before thinking, so it appears in the prompt twice.
+_MEMORY_ECHO = "UserInput => "
+
+
+class MapReduceTeam:
+    """
+    Maps an agent over chunks of a large input, then reduces the results as a tree.
+
+    The input is split by `chunker`; up to `max_parallel` mapper runs execute at once.
+    Mapped outputs are packed into batches and reduced level by level until one answer
+    remains. No prompt exceeds `max_prompt_chars`, counting the agent's template and memory:
+    chunks that would are split, and partial results too large to share a reducer prompt
+    are truncated (counted in `last_truncated`). Per-chunk results are kept in `cache` (any mutable
+    mapping, e.g. a `shelve` for persistence) keyed by mapper name and chunk hash, so
+    re-running over an edited document only re-maps the chunks that changed.
+
+    `mapper` and `reducer` may be agents or zero-argument factories; factories give every
+    call a fresh agent so concurrent calls do not share memory.
+    """
+
+    def __init__(
+        self,
+        mapper: AgentSource,
+        reducer: AgentSource,
+        chunker: Chunker = split_sections,
+        max_parallel: int = 4,
+        max_prompt_chars: int = 8000,
+        cache: MutableMapping[str, str] | None = None,
+        separator: str = "\n\n",
+    ) -> None:
+        self.mapper = mapper
+        self.reducer = reducer
+        self.chunker = chunker
+        self.max_parallel = max_parallel
+        self.max_prompt_chars = max_prompt_chars
+        self.cache: MutableMapping[str, str] = cache if cache is not None else {}
+        self.separator = separator
+        self.last_map_calls = 0
+        self.last_cache_hits = 0
+        self.last_reduce_calls = 0
+        self.last_truncated = 0
+
+    async def run(self, initial_input: str = "") -> str:
+        self.last_map_calls = 0
+        self.last_cache_hits = 0
+        self.last_reduce_calls = 0
+        self.last_truncated = 0
+        limit = asyncio.Semaphore(self.max_parallel)
+        budget = await self._input_budget(_resolve(self.mapper))
+        chunks = [
+            chunk[start : start + budget]
+            for chunk in self.chunker(initial_input)
+            for start in range(0, len(chunk), budget)
+        ]
+        if not chunks:
+            return ""
+        mapped = list(await asyncio.gather(*(self._map(chunk, limit) for chunk in chunks)))
+        return await self._reduce(mapped, limit)
+
+    async def _map(self, chunk: str, limit: asyncio.Semaphore) -> str:
+        mapper = _resolve(self.mapper)
+        key = hashlib.sha256(f"{mapper.name}\0{chunk}".encode()).hexdigest()
+        cached = self.cache.get(key)
+        CACHE_REQUESTS.inc(cache="map_reduce", result="miss" if cached is None else "hit")
+        if cached is not None:
+            self.last_cache_hits += 1
+            return cached
+        async with limit:
+            output = await mapper.run(await self._fit(mapper, chunk))
+        self.last_map_calls += 1
+        self.cache[key] = output
+        return output
+
+    async def _reduce(self, parts: list[str], limit: asyncio.Semaphore) -> str:
+        while True:
+            batches = self._batches(parts, await self._input_budget(_resolve(self.reducer)))
+            parts = list(await asyncio.gather(*(self._reduce_one(b, limit) for b in batches)))
+            if len(parts) == 1:
+                return parts[0]
+
+    async def _reduce_one(self, batch: list[str], limit: asyncio.Semaphore) -> str:
+        reducer = _resolve(self.reducer)
+        async with limit:
+            output = await reducer.run(await self._fit(reducer, self.separator.join(batch)))
+        self.last_reduce_calls += 1
+        return output
+
+    async def _input_budget(self, agent: Agent) -> int:
+        """Input size that keeps `agent`'s whole prompt within `max_prompt_chars`."""
+        overhead = len(await agent.think("")) - len("N/A")
+        budget = (self.max_prompt_chars - overhead - len(_MEMORY_ECHO) - 1) // 2
+        if budget < 1:
+            raise ValueError(
+                f"max_prompt_chars={self.max_prompt_chars} leaves no room for input: the "
+                f"prompt template and memory of agent {agent.name!r} take {overhead} chars"
+            )
+        return budget
+
+    async def _fit(self, agent: Agent, text: str) -> str:
+        """Trim `text` until the prompt `agent.run(text)` builds fits `max_prompt_chars`."""
+        while True:
+            size = len(await agent.think(text)) + len(_MEMORY_ECHO) + len(text) + 1
+            excess = size - self.max_prompt_chars
+            if excess <= 0:
+                return text
+            if len(text) <= 1:
+                raise ValueError(
+                    f"prompt of agent {agent.name!r} exceeds max_prompt_chars="
+                    f"{self.max_prompt_chars} even without input"
+                )
+            text = text[: max(1, len(text) - (excess + 1) // 2)]
+            self.last_truncated += 1
+
+    def _batches(self, parts: list[str], budget: int) -> list[list[str]]:
+        """Pack consecutive parts into batches whose joined size stays within `budget`."""
+        clipped = [self._clip(part, budget) for part in parts]
+        batches: list[list[str]] = []
+        current: list[str] = []
+        size = 0
+        for part in clipped:
+            added = len(part) + (len(self.separator) if current else 0)
+            if current and size + added > budget:
+                batches.append(current)
+                current, size = [], 0
+                added = len(part)
+            current.append(part)
+            size += added
+        if current:
+            batches.append(current)
+        if len(parts) > 1 and len(batches) == len(parts):
+            # No two parts fit together: truncate each to half the budget and pair them so
+            # the tree still converges.
+            half = (budget - len(self.separator)) // 2
+            if half < 1:
+                raise ValueError(
+                    f"max_prompt_chars={self.max_prompt_chars} is too small to reduce two "
+                    "partial results in one prompt"
+                )
+            clipped = [self._clip(part, half) for part in clipped]
+            batches = [clipped[index : index + 2] for index in range(0, len(clipped), 2)]
+        return batches
+
+    def _clip(self, part: str, size: int) -> str:
+        if len(part) <= size:
+            return part
+        self.last_truncated += 1
+        return part[:size]
+
+
+def _resolve(source: AgentSource) -> Agent:
+    return source if isinstance(source, Agent) else source()
@@ -0,0 +1,124 @@
+"""Pipelined multi-agent orchestration over streamed sections."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+
+from forgeai.agent.base import Agent
+from forgeai.orchestration.chunking import Chunker, split_sections
+
+
+@dataclass(slots=True)
+class _StageError:
+    error: BaseException
+
+
+_Item = str | _StageError | None
+
+
+class PipelineTeam:
+    """
+    Runs a chain of agents as a pipeline over sections of the input.
+
+    The input is split by `chunker`; each stage consumes sections from the previous stage as
+    soon as at least `min_chars` of input has arrived and emits its output downstream, so
+    later stages work on early sections while earlier stages are still generating.
+    Inter-stage queues hold at most `buffer_size` sections, applying backpressure to fast
+    upstream stages. Section order is preserved end to end.
+
+    Unlike `AgentTeam`, each downstream agent runs once per upstream output and sees only
+    that fragment, not the upstream agent's whole answer, so a chain of N agents over S
+    sections makes about S x N provider calls (fewer when `min_chars` groups sections).
+    With `join_last`, the final agent instead waits for every upstream section and runs
+    once on them joined by `separator`, for stages that must see the whole document.
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[Agent],
+        chunker: Chunker = split_sections,
+        min_chars: int = 1,
+        buffer_size: int = 4,
+        separator: str = "\n\n",
+        join_last: bool = False,
+    ) -> None:
+        if not agents:
+            raise ValueError("PipelineTeam requires at least one agent")
+        self.agents = list(agents)
+        self.chunker = chunker
+        self.min_chars = min_chars
+        self.buffer_size = buffer_size
+        self.separator = separator
+        self.join_last = join_last
+
+    async def run(self, initial_input: str = "") -> str:
+        return self.separator.join([section async for section in self.stream(initial_input)])
+
+    async def stream(self, initial_input: str = "") -> AsyncIterator[str]:
+        """Yield final-stage outputs section by section as they complete."""
+        queues: list[asyncio.Queue[_Item]] = [
+            asyncio.Queue(maxsize=self.buffer_size) for _ in range(len(self.agents) + 1)
+        ]
+        tasks = [asyncio.create_task(self._feed(self.chunker(initial_input), queues[0]))]
+        last = len(self.agents) - 1
+        tasks += [
+            asyncio.create_task(
+                self._stage(
+                    agent,
+                    queues[index],
+                    queues[index + 1],
+                    math.inf if self.join_last and index == last else self.min_chars,
+                )
+            )
+            for index, agent in enumerate(self.agents)
+        ]
+        try:
+            while True:
+                item = await queues[-1].get()
+                if item is None:
+                    return
+                if isinstance(item, _StageError):
+                    raise item.error
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _feed(sections: list[str], outbox: asyncio.Queue[_Item]) -> None:
+        for section in sections:
+            await outbox.put(section)
+        await outbox.put(None)
+
+    async def _stage(
+        self,
+        agent: Agent,
+        inbox: asyncio.Queue[_Item],
+        outbox: asyncio.Queue[_Item],
+        min_chars: float,
+    ) -> None:
+        pending: list[str] = []
+        while True:
+            item = await inbox.get()
+            if isinstance(item, _StageError):
+                await outbox.put(item)
+                return
+            if item is not None:
+                pending.append(item)
+                if sum(len(part) for part in pending) < min_chars:
+                    continue
+            if pending:
+                try:
+                    output = await agent.run(self.separator.join(pending))
+                except Exception as exc:  # noqa: BLE001
+                    await outbox.put(_StageError(exc))
+                    return
+                pending = []
+                await outbox.put(output)
+            if item is None:
+                await outbox.put(None)
+                return
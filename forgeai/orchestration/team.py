@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from forgeai.agent.base import Agent
+from forgeai.orchestration.graph import AgentGraph, FailurePolicy
 
 
 class AgentTeam:
-    """Runs agents sequentially, forwarding each output to the next agent."""
-
-    def __init__(self, agents: Sequence[Agent]) -> None:
+    """
+    Runs agents sequentially, forwarding each output to the next agent.
+
+    Passing `inputs` (agent name -> upstream agent names) switches to graph mode: agents
+    without declared inputs receive the initial input, independent branches run
+    concurrently, and the team returns the output of the final agent(s).
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[Agent],
+        inputs: Mapping[str, Sequence[str]] | None = None,
+        failure_policy: FailurePolicy = "fail_fast",
+        max_concurrency: int | None = None,
+    ) -> None:
         self.agents = list(agents)
+        self.graph: AgentGraph | None = None
+        if inputs is not None:
+            self.graph = AgentGraph(failure_policy=failure_policy, max_concurrency=max_concurrency)
+            for agent in self.agents:
+                self.graph.add(agent.name, agent, inputs=inputs.get(agent.name, ()))
+            self.graph.order()
 
     async def run(self, initial_input: str = "") -> str:
+        if self.graph is not None:
+            return (await self.graph.run(initial_input)).output
         current = initial_input
         for agent in self.agents:
             current = await agent.run(current)
         return current
-
@@ -1,21 +1,34 @@
 """LLM provider interfaces and implementations."""
 
 from forgeai.providers.anthropic_provider import AnthropicProvider
-from forgeai.providers.base import BaseProvider
+from forgeai.providers.base import BaseProvider, EmbeddingsUnavailable
 from forgeai.providers.deepseek_provider import DeepSeekProvider
+from forgeai.providers.embeddings import CachedEmbedder, EmbeddingCache
 from forgeai.providers.factory import create_provider
 from forgeai.providers.gemini_provider import GeminiProvider
 from forgeai.providers.grok_provider import GrokProvider
-from forgeai.providers.openai_provider import OpenAIProvider
 from forgeai.providers.ollama_provider import OllamaProvider
+from forgeai.providers.openai_provider import OpenAIProvider
+from forgeai.providers.replay import CassetteMiss, RecordingProvider, ReplayProvider
+from forgeai.providers.semantic_cache import SemanticCache, SemanticCacheProvider
+from forgeai.providers.simulated import SimulatedProvider
 
 __all__ = [
     "AnthropicProvider",
     "BaseProvider",
+    "CachedEmbedder",
+    "CassetteMiss",
     "DeepSeekProvider",
+    "EmbeddingCache",
+    "EmbeddingsUnavailable",
     "GeminiProvider",
     "GrokProvider",
     "OllamaProvider",
     "OpenAIProvider",
+    "RecordingProvider",
+    "ReplayProvider",
+    "SemanticCache",
+    "SemanticCacheProvider",
+    "SimulatedProvider",
     "create_provider",
 ]
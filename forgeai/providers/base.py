@@ -3,12 +3,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+# Built-in providers put this in the `thought` of their offline/fallback responses.
+FALLBACK_MARKER = "Provider fallback active"
+
+
+class EmbeddingsUnavailable(RuntimeError):
+    """Raised when a provider that supports embeddings cannot reach its backend."""
 
 
 class BaseProvider(ABC):
-    """Abstract asynchronous LLM provider interface."""
+    """
+    Abstract asynchronous LLM provider interface.
+
+    Providers that can embed set `supports_embeddings` and override `embed`.
+    """
+
+    supports_embeddings: bool = False
 
     @abstractmethod
     async def generate(self, prompt: str) -> str:
         """Generate text from a prompt."""
 
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return one embedding vector per text, in order."""
+        raise NotImplementedError(f"{type(self).__name__} does not support embeddings")
+
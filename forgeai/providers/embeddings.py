@@ -0,0 +1,170 @@
+"""Embedding helpers: request batching, retries, and a persistent content-hash cache."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from forgeai.deadline import call_timeout, sleep_within_deadline
+from forgeai.observability.registry import CACHE_REQUESTS
+from forgeai.providers.base import BaseProvider
+
+Vector = list[float]
+T = TypeVar("T")
+
+
+async def call_with_retries(
+    make_call: Callable[[], Awaitable[T]], timeout_s: float, retries: int
+) -> T:
+    """Await `make_call()` with a deadline-aware timeout, retrying with linear backoff."""
+    attempts = retries + 1
+    for attempt in range(attempts):
+        try:
+            return await asyncio.wait_for(make_call(), timeout=call_timeout(timeout_s))
+        except Exception:
+            if attempt == attempts - 1:
+                raise
+            await sleep_within_deadline(0.25 * (attempt + 1))
+    raise AssertionError("unreachable")
+
+
+async def embed_in_batches(
+    texts: Sequence[str],
+    embed_batch: Callable[[list[str]], Awaitable[list[Vector]]],
+    batch_size: int,
+    max_concurrency: int = 4,
+) -> list[Vector]:
+    """Split `texts` into batches of `batch_size`, embed them concurrently, keep order."""
+    batches = [list(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size)]
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(batch: list[str]) -> list[Vector]:
+        async with limit:
+            vectors = await embed_batch(batch)
+        if len(vectors) != len(batch):
+            raise ValueError(f"expected {len(batch)} embeddings, got {len(vectors)}")
+        return vectors
+
+    results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [vector for vectors in results for vector in vectors]
+
+
+def content_key(namespace: str, text: str) -> str:
+    """Cache key for `text` embedded under `namespace` (provider and embedding model)."""
+    return hashlib.sha256(f"{namespace}\0{text}".encode()).hexdigest()
+
+
+def embedding_namespace(provider: BaseProvider) -> str:
+    model = getattr(provider, "embedding_model", None) or getattr(provider, "model", "")
+    return f"{type(provider).__name__}/{model}"
+
+
+class EmbeddingCache:
+    """
+    Embeddings stored in SQLite by content hash, so repeated texts are never re-embedded.
+
+    Vectors are stored as float32 blobs. The default `":memory:"` database lasts for the
+    process; pass a file path to keep embeddings across restarts.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, dims INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    async def get_many(self, namespace: str, texts: Sequence[str]) -> list[Vector | None]:
+        return await asyncio.to_thread(self._get_many, namespace, texts)
+
+    async def put_many(self, namespace: str, items: dict[str, Vector]) -> None:
+        await asyncio.to_thread(self._put_many, namespace, items)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _get_many(self, namespace: str, texts: Sequence[str]) -> list[Vector | None]:
+        keys = [content_key(namespace, text) for text in texts]
+        found: dict[str, Vector] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return [found.get(key) for key in keys]
+
+    def _put_many(self, namespace: str, items: dict[str, Vector]) -> None:
+        now = time.time()
+        rows = [
+            (content_key(namespace, t), namespace, len(v), array("f", v).tobytes(), now)
+            for t, v in items.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+
+class CachedEmbedder:
+    """
+    Embeds through `provider.embed`, serving repeated texts from an `EmbeddingCache`.
+
+    Duplicates within one call are embedded once, and only cache misses reach the
+    provider. Entries are namespaced by provider class and embedding model.
+    """
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        cache: EmbeddingCache | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        self.provider = provider
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self.namespace = namespace or embedding_namespace(provider)
+        self.hits = 0
+        self.misses = 0
+
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        unique = list(dict.fromkeys(texts))
+        cached = await self.cache.get_many(self.namespace, unique)
+        vectors = {
+            text: vector for text, vector in zip(unique, cached, strict=True) if vector is not None
+        }
+        missing = [text for text in unique if text not in vectors]
+        self.hits += len(vectors)
+        self.misses += len(missing)
+        CACHE_REQUESTS.inc(len(vectors), cache="embeddings", result="hit")
+        CACHE_REQUESTS.inc(len(missing), cache="embeddings", result="miss")
+        if missing:
+            fresh = dict(zip(missing, await self.provider.embed(missing), strict=True))
+            await self.cache.put_many(self.namespace, fresh)
+            vectors.update(fresh)
+        return [vectors[text] for text in texts]
+
+    async def embed_one(self, text: str) -> Vector:
+        return (await self.embed([text]))[0]
@@ -12,6 +12,7 @@ from forgeai.providers.gemini_provider import GeminiProvider
 from forgeai.providers.grok_provider import GrokProvider
 from forgeai.providers.ollama_provider import OllamaProvider
 from forgeai.providers.openai_provider import OpenAIProvider
+from forgeai.providers.simulated import SimulatedProvider
 
 
 def create_provider(name: str, **kwargs: Any) -> BaseProvider:
@@ -29,6 +30,8 @@ def create_provider(name: str, **kwargs: Any) -> BaseProvider:
         return _construct(DeepSeekProvider, **kwargs)
     if normalized in {"grok", "xai"}:
         return _construct(GrokProvider, **kwargs)
+    if normalized == "simulated":
+        return _construct(SimulatedProvider, **kwargs)
     raise ValueError(f"Unsupported provider: {name}")
 
 
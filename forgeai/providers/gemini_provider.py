@@ -5,53 +5,99 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+from collections.abc import Sequence
 from typing import Any
 
-from forgeai.providers.base import BaseProvider
+from forgeai.deadline import call_timeout, check_deadline, sleep_within_deadline
+from forgeai.providers.base import BaseProvider, EmbeddingsUnavailable
+from forgeai.providers.embeddings import Vector, call_with_retries, embed_in_batches
 
 
 class GeminiProvider(BaseProvider):
     """Gemini provider using Google GenAI SDK if available."""
 
+    supports_embeddings = True
+
     def __init__(
         self,
         model: str = "gemini-2.0-flash",
         api_key: str | None = None,
         timeout_s: float = 30.0,
         retries: int = 1,
+        embedding_model: str = "text-embedding-004",
+        embed_batch_size: int = 100,
+        embed_concurrency: int = 4,
     ) -> None:
         self.model = model
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         self.timeout_s = timeout_s
         self.retries = retries
+        self.embedding_model = embedding_model
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
 
     async def generate(self, prompt: str) -> str:
         if not self.api_key:
             return self._fallback_response(prompt, reason="GEMINI_API_KEY or GOOGLE_API_KEY not set")
 
-        try:
-            from google import genai  # type: ignore
-        except Exception:
+        client = self._client()
+        if client is None:
             return self._fallback_response(prompt, reason="google-genai package not installed")
-
-        client = genai.Client(api_key=self.api_key)
         attempts = self.retries + 1
         last_error = "unknown"
         for attempt in range(attempts):
+            timeout_s = call_timeout(self.timeout_s)
             try:
                 response: Any = await asyncio.wait_for(
                     client.aio.models.generate_content(model=self.model, contents=prompt),
-                    timeout=self.timeout_s,
+                    timeout=timeout_s,
                 )
                 text = getattr(response, "text", None)
                 return str(text or "").strip()
             except Exception as exc:  # noqa: BLE001
                 last_error = str(exc)
                 if attempt < attempts - 1:
-                    await asyncio.sleep(0.25 * (attempt + 1))
+                    await sleep_within_deadline(0.25 * (attempt + 1))
 
+        check_deadline()
         return self._fallback_response(prompt, reason=f"provider_error: {last_error}")
 
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        """
+        Embed `texts` with `embedding_model`.
+
+        Texts are sent `embed_batch_size` per request (the API caps batches at 100),
+        with at most `embed_concurrency` requests in flight.
+        """
+        if not texts:
+            return []
+        if not self.api_key:
+            raise EmbeddingsUnavailable("GEMINI_API_KEY or GOOGLE_API_KEY not set")
+        client = self._client()
+        if client is None:
+            raise EmbeddingsUnavailable("google-genai package not installed")
+
+        async def embed_batch(batch: list[str]) -> list[Vector]:
+            response: Any = await call_with_retries(
+                lambda: client.aio.models.embed_content(
+                    model=self.embedding_model, contents=batch
+                ),
+                self.timeout_s,
+                self.retries,
+            )
+            return [list(item.values) for item in response.embeddings]
+
+        return await embed_in_batches(
+            texts, embed_batch, self.embed_batch_size, self.embed_concurrency
+        )
+
+    def _client(self) -> Any | None:
+        try:
+            from google import genai  # type: ignore
+        except Exception:
+            return None
+        return genai.Client(api_key=self.api_key)
+
     @staticmethod
     def _fallback_response(prompt: str, reason: str) -> str:
         _ = prompt
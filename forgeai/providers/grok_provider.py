@@ -7,6 +7,7 @@ import json
 import os
 from typing import Any
 
+from forgeai.deadline import call_timeout, check_deadline, sleep_within_deadline
 from forgeai.providers.base import BaseProvider
 
 
@@ -38,17 +39,19 @@ class GrokProvider(BaseProvider):
         attempts = self.retries + 1
         last_error = "unknown"
         for attempt in range(attempts):
+            timeout_s = call_timeout(self.timeout_s)
             try:
                 response: Any = await asyncio.wait_for(
                     client.responses.create(model=self.model, input=prompt),
-                    timeout=self.timeout_s,
+                    timeout=timeout_s,
                 )
                 return str(getattr(response, "output_text", "")).strip()
             except Exception as exc:  # noqa: BLE001
                 last_error = str(exc)
                 if attempt < attempts - 1:
-                    await asyncio.sleep(0.25 * (attempt + 1))
+                    await sleep_within_deadline(0.25 * (attempt + 1))
 
+        check_deadline()
         return self._fallback_response(prompt, reason=f"provider_error: {last_error}")
 
     @staticmethod
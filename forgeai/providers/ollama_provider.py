@@ -4,13 +4,47 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
 
-from forgeai.providers.base import BaseProvider
+from forgeai.deadline import call_timeout, check_deadline, sleep_within_deadline
+from forgeai.providers.base import BaseProvider, EmbeddingsUnavailable
+from forgeai.providers.embeddings import Vector, call_with_retries, embed_in_batches
+from forgeai.tools.bulkhead import Bulkhead, BulkheadRegistry
+
+T = TypeVar("T")
+
+# One client per (event loop, host): the underlying HTTP pool is bound to its loop.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+# Client-side slots per (event loop, host), shared by every provider instance.
+_slots = BulkheadRegistry()
+
+
+def _model_matches(loaded: str, wanted: str) -> bool:
+    def tagged(name: str) -> str:
+        return name if ":" in name else f"{name}:latest"
+
+    return tagged(loaded) == tagged(wanted)
 
 
 class OllamaProvider(BaseProvider):
-    """Ollama provider for local model execution."""
+    """
+    Ollama provider for local model execution.
+
+    `keep_alive` (e.g. `"30m"`, or `-1` to never unload) and `options` (plus the
+    `num_ctx`/`num_predict` shortcuts) are sent with every request. `max_concurrency`
+    caps in-flight requests per host across all instances on an event loop; match it to
+    the server's `OLLAMA_NUM_PARALLEL` so excess requests queue here instead of timing out
+    there.
+    Call `warmup()` at startup to load the model before the first request, and
+    `health()` as a readiness probe. `embed` uses `embedding_model` through the same slots.
+    """
+
+    supports_embeddings = True
 
     def __init__(
         self,
@@ -18,39 +52,203 @@ class OllamaProvider(BaseProvider):
         host: str = "http://localhost:11434",
         timeout_s: float = 30.0,
         retries: int = 1,
+        keep_alive: str | float | None = None,
+        options: dict[str, Any] | None = None,
+        num_ctx: int | None = None,
+        num_predict: int | None = None,
+        max_concurrency: int | None = None,
+        warmup_timeout_s: float = 300.0,
+        embedding_model: str = "nomic-embed-text",
+        embed_batch_size: int = 64,
+        embed_concurrency: int = 4,
+        client: Any | None = None,
     ) -> None:
         self.model = model
         self.host = host
         self.timeout_s = timeout_s
         self.retries = retries
+        self.keep_alive = keep_alive
+        self.options = dict(options or {})
+        if num_ctx is not None:
+            self.options["num_ctx"] = num_ctx
+        if num_predict is not None:
+            self.options["num_predict"] = num_predict
+        self.max_concurrency = max_concurrency
+        self.warmup_timeout_s = warmup_timeout_s
+        self.embedding_model = embedding_model
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self._client = client
+
+    @property
+    def slots(self) -> Bulkhead:
+        """Request slots for this provider's host, shared within the running event loop."""
+        return _slots.get(self.host, self.max_concurrency)
 
     async def generate(self, prompt: str) -> str:
-        try:
-            from ollama import AsyncClient  # type: ignore
-        except Exception:
+        client = self._get_client()
+        if client is None:
             return self._fallback_response(prompt, reason="ollama package not installed")
 
-        client = AsyncClient(host=self.host)
         attempts = self.retries + 1
         last_error = "unknown"
         for attempt in range(attempts):
             try:
-                response: Any = await asyncio.wait_for(
-                    client.chat(
+                response: Any = await self._call(
+                    lambda: client.chat(
                         model=self.model,
                         messages=[{"role": "user", "content": prompt}],
-                    ),
-                    timeout=self.timeout_s,
+                        **self._request_options(),
+                    )
                 )
                 message: dict[str, Any] = response.get("message", {})
                 return str(message.get("content", "")).strip()
             except Exception as exc:  # noqa: BLE001
-                last_error = str(exc)
-                if attempt < attempts - 1:
-                    await asyncio.sleep(0.25 * (attempt + 1))
+                last_error = str(exc) or type(exc).__name__
+            if attempt < attempts - 1:
+                await sleep_within_deadline(0.25 * (attempt + 1))
 
+        check_deadline()
         return self._fallback_response(prompt, reason=f"provider_error: {last_error}")
 
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        """
+        Embed `texts` with `embedding_model`, `embed_batch_size` texts per request.
+
+        At most `embed_concurrency` batches are in flight per call, each also waiting for
+        a host slot, so one large call cannot take every slot from chat requests.
+        """
+        if not texts:
+            return []
+        client = self._get_client()
+        if client is None:
+            raise EmbeddingsUnavailable("ollama package not installed")
+        extra = {"keep_alive": self.keep_alive} if self.keep_alive is not None else {}
+
+        async def embed_batch(batch: list[str]) -> list[Vector]:
+            # Each attempt takes its own slot, so retry backoff does not hold one.
+            response: Any = await call_with_retries(
+                lambda: self._call(
+                    lambda: client.embed(model=self.embedding_model, input=batch, **extra)
+                ),
+                self.timeout_s,
+                self.retries,
+            )
+            return [list(vector) for vector in response.get("embeddings", [])]
+
+        return await embed_in_batches(
+            texts, embed_batch, self.embed_batch_size, self.embed_concurrency
+        )
+
+    async def warmup(self) -> dict[str, Any]:
+        """
+        Load the model into memory with an empty chat request, without generating.
+
+        Uses the same `keep_alive` and `options` as real requests; a different `num_ctx`
+        would make the server reload the model on the first real call.
+        """
+        client = self._get_client()
+        if client is None:
+            return {"ready": False, "model": self.model, "error": "ollama package not installed"}
+        started = time.perf_counter()
+        try:
+            response: Any = await asyncio.wait_for(
+                client.chat(model=self.model, messages=[], **self._request_options()),
+                timeout=self.warmup_timeout_s,
+            )
+        except Exception as exc:  # noqa: BLE001
+            return {
+                "ready": False,
+                "model": self.model,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "error": str(exc) or type(exc).__name__,
+            }
+        load_ns = response.get("load_duration") or 0
+        return {
+            "ready": True,
+            "model": self.model,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "load_ms": round(load_ns / 1e6, 1),
+        }
+
+    async def health(self, timeout_s: float = 5.0) -> dict[str, Any]:
+        """
+        Readiness probe: `reachable` when the server answers, `ready` when `model` is loaded.
+
+        A reachable server with the model unloaded is healthy but not ready; the next
+        request (or `warmup()`) pays the load time.
+        """
+        client = self._get_client()
+        if client is None:
+            return {
+                "reachable": False,
+                "ready": False,
+                "model": self.model,
+                "error": "ollama package not installed",
+            }
+        started = time.perf_counter()
+        try:
+            response: Any = await asyncio.wait_for(client.ps(), timeout=timeout_s)
+        except Exception as exc:  # noqa: BLE001
+            return {
+                "reachable": False,
+                "ready": False,
+                "model": self.model,
+                "error": str(exc) or type(exc).__name__,
+            }
+        loaded = [
+            str(entry.get("model") or entry.get("name") or "")
+            for entry in response.get("models") or []
+        ]
+        return {
+            "reachable": True,
+            "ready": any(_model_matches(name, self.model) for name in loaded),
+            "model": self.model,
+            "loaded_models": loaded,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "in_flight": self.slots.stats.in_flight,
+            "queued": self.slots.stats.queued,
+        }
+
+    async def _call(self, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Wait for a host slot and run `make_call()` under one call timeout.
+
+        Queueing for the slot counts against `timeout_s` (and the run deadline), so a busy
+        host cannot hold a caller past its budget.
+        """
+        slots = self.slots
+        acquired = False
+        try:
+            async with asyncio.timeout(call_timeout(self.timeout_s)):
+                await slots.acquire()
+                acquired = True
+                return await make_call()
+        finally:
+            if acquired:
+                slots.release()
+
+    def _request_options(self) -> dict[str, Any]:
+        extra: dict[str, Any] = {}
+        if self.keep_alive is not None:
+            extra["keep_alive"] = self.keep_alive
+        if self.options:
+            extra["options"] = self.options
+        return extra
+
+    def _get_client(self) -> Any | None:
+        if self._client is not None:
+            return self._client
+        try:
+            from ollama import AsyncClient  # type: ignore
+        except Exception:
+            return None
+        per_loop = _clients.setdefault(asyncio.get_running_loop(), {})
+        client = per_loop.get(self.host)
+        if client is None:
+            client = per_loop[self.host] = AsyncClient(host=self.host)
+        return client
+
     @staticmethod
     def _fallback_response(prompt: str, reason: str) -> str:
         _ = prompt
@@ -5,25 +5,36 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+from collections.abc import Sequence
 from typing import Any
 
-from forgeai.providers.base import BaseProvider
+from forgeai.deadline import call_timeout, check_deadline, sleep_within_deadline
+from forgeai.providers.base import BaseProvider, EmbeddingsUnavailable
+from forgeai.providers.embeddings import Vector, call_with_retries, embed_in_batches
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI chat provider using the official SDK if available."""
 
+    supports_embeddings = True
+
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         timeout_s: float = 30.0,
         retries: int = 1,
+        embedding_model: str = "text-embedding-3-small",
+        embed_batch_size: int = 512,
+        embed_concurrency: int = 4,
     ) -> None:
         self.model = model
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.timeout_s = timeout_s
         self.retries = retries
+        self.embedding_model = embedding_model
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
 
     async def generate(self, prompt: str) -> str:
         """
@@ -35,28 +46,62 @@ class OpenAIProvider(BaseProvider):
         if not self.api_key:
             return self._fallback_response(prompt, reason="OPENAI_API_KEY not set")
 
-        try:
-            from openai import AsyncOpenAI  # type: ignore
-        except Exception:
+        client = self._client()
+        if client is None:
             return self._fallback_response(prompt, reason="openai package not installed")
-
-        client = AsyncOpenAI(api_key=self.api_key)
         attempts = self.retries + 1
         last_error = "unknown"
         for attempt in range(attempts):
+            timeout_s = call_timeout(self.timeout_s)
             try:
                 response: Any = await asyncio.wait_for(
                     client.responses.create(model=self.model, input=prompt),
-                    timeout=self.timeout_s,
+                    timeout=timeout_s,
                 )
                 return str(getattr(response, "output_text", "")).strip()
             except Exception as exc:  # noqa: BLE001
                 last_error = str(exc)
                 if attempt < attempts - 1:
-                    await asyncio.sleep(0.25 * (attempt + 1))
+                    await sleep_within_deadline(0.25 * (attempt + 1))
 
+        check_deadline()
         return self._fallback_response(prompt, reason=f"provider_error: {last_error}")
 
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        """
+        Embed `texts` with `embedding_model`.
+
+        Texts are sent `embed_batch_size` per request (the API accepts up to 2048 inputs),
+        with at most `embed_concurrency` requests in flight.
+        """
+        if not texts:
+            return []
+        if not self.api_key:
+            raise EmbeddingsUnavailable("OPENAI_API_KEY not set")
+        client = self._client()
+        if client is None:
+            raise EmbeddingsUnavailable("openai package not installed")
+
+        async def embed_batch(batch: list[str]) -> list[Vector]:
+            response: Any = await call_with_retries(
+                lambda: client.embeddings.create(model=self.embedding_model, input=batch),
+                self.timeout_s,
+                self.retries,
+            )
+            items = sorted(response.data, key=lambda item: item.index)
+            return [list(item.embedding) for item in items]
+
+        return await embed_in_batches(
+            texts, embed_batch, self.embed_batch_size, self.embed_concurrency
+        )
+
+    def _client(self) -> Any | None:
+        try:
+            from openai import AsyncOpenAI  # type: ignore
+        except Exception:
+            return None
+        return AsyncOpenAI(api_key=self.api_key)
+
     @staticmethod
     def _fallback_response(prompt: str, reason: str) -> str:
         """Deterministic fallback response for offline/stub mode."""
@@ -0,0 +1,155 @@
+"""Record/replay providers for deterministic offline runs and benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from forgeai.providers.base import BaseProvider
+
+LatencyMode = Literal["none", "recorded", "synthetic"]
+
+
+class CassetteMiss(LookupError):
+    """Raised by a strict `ReplayProvider` when a prompt was never recorded."""
+
+
+def prompt_key(prompt: str) -> str:
+    """Stable short key identifying a prompt in a cassette."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.GzipFile(path, mode + "b"), encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class RecordingProvider(BaseProvider):
+    """
+    Wraps a provider and appends every call to a JSON-lines cassette.
+
+    Each record holds the prompt key, response, latency and approximate token usage; the
+    prompt text itself is kept only with `store_prompts=True`. Paths ending in `.gz` are
+    gzip-compressed.
+    """
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        path: str | os.PathLike[str],
+        store_prompts: bool = False,
+    ) -> None:
+        self.provider = provider
+        self.path = Path(path)
+        self.store_prompts = store_prompts
+        self.model = getattr(provider, "model", "")
+        self._lock = threading.Lock()
+
+    async def generate(self, prompt: str) -> str:
+        started = time.perf_counter()
+        response = await self.provider.generate(prompt)
+        latency_ms = (time.perf_counter() - started) * 1000
+        record: dict[str, Any] = {
+            "key": prompt_key(prompt),
+            "response": response,
+            "latency_ms": round(latency_ms, 3),
+            "usage": {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": len(response.split()),
+            },
+        }
+        if self.store_prompts:
+            record["prompt"] = prompt
+        await asyncio.to_thread(self._append, record)
+        return response
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _open(self.path, "a") as handle:
+                handle.write(line + "\n")
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Serves responses from a cassette written by `RecordingProvider`.
+
+    Prompts are matched by key; repeated prompts replay their recorded responses in order.
+    Unmatched prompts raise `CassetteMiss` when `strict`, otherwise the cassette is replayed
+    sequentially. `latency` selects no delay, the recorded per-call latency, or samples
+    from a log-normal distribution fitted to the recorded latencies. `speed` is a playback
+    rate: `2.0` replays twice as fast, `0.5` at half speed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        latency: LatencyMode = "none",
+        speed: float = 1.0,
+        strict: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.path = Path(path)
+        self.latency = latency
+        self.speed = speed
+        self.strict = strict
+        self.model = "replay"
+        self.records = self._load(self.path)
+        if not self.records:
+            raise ValueError(f"Cassette {self.path} is empty")
+        self._by_key: dict[str, deque[dict[str, Any]]] = {}
+        for record in self.records:
+            self._by_key.setdefault(str(record["key"]), deque()).append(record)
+        self._sequence = 0
+        self._random = random.Random(seed)
+        latencies = [max(float(r.get("latency_ms", 0.0)), 1e-3) for r in self.records]
+        logs = [math.log(value) for value in latencies]
+        self._mu = statistics.fmean(logs)
+        self._sigma = statistics.pstdev(logs) if len(logs) > 1 else 0.0
+
+    async def generate(self, prompt: str) -> str:
+        record = self._match(prompt)
+        delay_ms = self._delay_ms(record)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / self.speed / 1000)
+        return str(record["response"])
+
+    def _match(self, prompt: str) -> dict[str, Any]:
+        matches = self._by_key.get(prompt_key(prompt))
+        if matches:
+            record = matches[0]
+            matches.rotate(-1)
+            return record
+        if self.strict:
+            raise CassetteMiss(f"No recorded response for prompt {prompt_key(prompt)}")
+        record = self.records[self._sequence % len(self.records)]
+        self._sequence += 1
+        return record
+
+    def _delay_ms(self, record: dict[str, Any]) -> float:
+        if self.latency == "recorded":
+            return float(record.get("latency_ms", 0.0))
+        if self.latency == "synthetic":
+            return self._random.lognormvariate(self._mu, self._sigma)
+        return 0.0
+
+    @staticmethod
+    def _load(path: Path) -> list[dict[str, Any]]:
+        with _open(path, "r") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
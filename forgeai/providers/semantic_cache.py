@@ -0,0 +1,454 @@
+"""Semantic response cache: serve answers for prompts similar to ones already answered."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from forgeai.observability.registry import CACHE_REQUESTS, SEMANTIC_CACHE_SIMILARITY
+from forgeai.providers.base import FALLBACK_MARKER, BaseProvider
+from forgeai.providers.embeddings import CachedEmbedder, Vector
+
+if TYPE_CHECKING:
+    from forgeai.agent.base import Agent
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+_VOLATILE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+    r"|\b\d{1,2}:\d{2}(?::\d{2})?\b"
+    r"|\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"
+    r"|\b[0-9a-f]{16,}\b",
+    flags=re.IGNORECASE,
+)
+_MEMORY_BLOCK = re.compile(r"(^Memory:\n)(.*?)(\n\n|\Z)", flags=re.DOTALL | re.MULTILINE)
+_USER_INPUT = re.compile(r"^User Input: (.*)$", flags=re.MULTILINE)
+# `Agent.run` echoes the current user input into memory before building the prompt.
+_MEMORY_ECHO = "UserInput => "
+_TOKEN = re.compile(r"\w+")
+TOOL_RESULT_MARKER = "\n\nTool result:\n"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Canonical form of a prompt for cache lookups.
+
+    In an agent prompt, timestamps, dates, UUIDs and long hex ids outside the
+    `User Input:` line become placeholders; the user's own text keeps them, as does a
+    prompt without that line, since they are often what the question is about. Lines of
+    an agent `Memory:` block are sorted (their order follows relevance scores, not
+    meaning), and case and whitespace are folded.
+    """
+    text = prompt
+    user = _USER_INPUT.search(prompt)
+    if user is not None:
+        text = (
+            _VOLATILE.sub("<id>", prompt[: user.start(1)])
+            + user.group(1)
+            + _VOLATILE.sub("<id>", prompt[user.end(1) :])
+        )
+    text = _MEMORY_BLOCK.sub(
+        lambda match: match.group(1) + "\n".join(sorted(match.group(2).splitlines()))
+        + match.group(3),
+        text,
+    )
+    return " ".join(text.lower().split())
+
+
+def _without_echo(prompt: str, query: str) -> str:
+    """Drop one memory line echoing `query`, the current turn's user input."""
+    echo = f"{_MEMORY_ECHO}{query}"
+
+    def drop(match: re.Match[str]) -> str:
+        lines = match.group(2).splitlines()
+        if echo in lines:
+            lines.remove(echo)
+        return match.group(1) + "\n".join(lines) + match.group(3)
+
+    return _MEMORY_BLOCK.sub(drop, prompt, count=1)
+
+
+def agent_query(prompt: str) -> str:
+    """
+    Cache key source for agent prompts: the `User Input:` line, else the whole prompt.
+
+    Pass `key=agent_query` to make answers independent of memory and the rest of the
+    prompt, which suits stateless agents (FAQ and support bots) only.
+    """
+    match = _USER_INPUT.search(prompt)
+    return match.group(1) if match and match.group(1) != "N/A" else prompt
+
+
+class HashingEmbedder:
+    """
+    Local embedder without a model: hashed word unigrams and bigrams, L2-normalised.
+
+    Catches rewordings that share most words; use a provider embedder (ideally through
+    `CachedEmbedder`) when paraphrases should match too.
+    """
+
+    def __init__(self, dims: int = 1024) -> None:
+        self.dims = dims
+
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        return [self.vector(text) for text in texts]
+
+    def vector(self, text: str) -> Vector:
+        tokens = _TOKEN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)]
+        vector = [0.0] * self.dims
+        for feature in features:
+            digest = zlib.crc32(feature.encode())
+            vector[digest % self.dims] += 1.0 if digest & 0x80000000 else -1.0
+        return _unit(vector)
+
+
+# Anything with `async embed(texts)`; providers work best wrapped in `CachedEmbedder`.
+Embedder = HashingEmbedder | CachedEmbedder | BaseProvider
+
+
+def _unit(vector: Sequence[float]) -> Vector:
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else list(vector)
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    key: str
+    namespace: str
+    text: str
+    response: str
+    created_at: float
+    expires_at: float
+    context: str = ""
+    hits: int = 0
+    row: int = -1
+
+
+@dataclass(slots=True)
+class CacheHit:
+    """A served answer, the cached key text it came from, and how similar it was."""
+
+    response: str
+    similarity: float
+    matched: str
+    exact: bool
+
+
+class _PythonIndex:
+    """Brute-force cosine index over unit vectors in plain Python."""
+
+    def __init__(self) -> None:
+        self.vectors: list[Vector] = []
+
+    def add(self, vector: Vector) -> int:
+        self.vectors.append(vector)
+        return len(self.vectors) - 1
+
+    def remove(self, row: int) -> None:
+        self.vectors[row] = self.vectors[-1]
+        self.vectors.pop()
+
+    def best(self, query: Vector) -> tuple[int, float]:
+        best_row, best_score = -1, -1.0
+        for row, vector in enumerate(self.vectors):
+            score = sum(a * b for a, b in zip(vector, query, strict=True))
+            if score > best_score:
+                best_row, best_score = row, score
+        return best_row, best_score
+
+
+class _NumpyIndex:
+    """Cosine index as one float32 matrix; a lookup is a single matrix-vector product."""
+
+    def __init__(self, dims: int) -> None:
+        assert np is not None
+        self.matrix = np.zeros((64, dims), dtype=np.float32)
+        self.size = 0
+
+    def add(self, vector: Vector) -> int:
+        if self.size == len(self.matrix):
+            grown = np.zeros((len(self.matrix) * 2, self.matrix.shape[1]), dtype=np.float32)
+            grown[: self.size] = self.matrix
+            self.matrix = grown
+        self.matrix[self.size] = vector
+        self.size += 1
+        return self.size - 1
+
+    def remove(self, row: int) -> None:
+        self.size -= 1
+        self.matrix[row] = self.matrix[self.size]
+
+    def best(self, query: Vector) -> tuple[int, float]:
+        if self.size == 0:
+            return -1, -1.0
+        scores = self.matrix[: self.size] @ np.asarray(query, dtype=np.float32)
+        row = int(scores.argmax())
+        return row, float(scores[row])
+
+
+@dataclass(slots=True)
+class SemanticCacheStats:
+    """Lookup outcomes plus similarity figures for judging hit quality."""
+
+    lookups: int = 0
+    hits: int = 0
+    exact_hits: int = 0
+    misses: int = 0
+    near_misses: int = 0
+    expired: int = 0
+    stores: int = 0
+    skipped: int = 0
+    evictions: int = 0
+    hit_similarity_total: float = 0.0
+    hit_similarity_min: float = 1.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def hit_similarity_avg(self) -> float:
+        return self.hit_similarity_total / self.hits if self.hits else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "exact_hits": self.exact_hits,
+            "misses": self.misses,
+            "near_misses": self.near_misses,
+            "expired": self.expired,
+            "stores": self.stores,
+            "skipped": self.skipped,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+            "hit_similarity_avg": round(self.hit_similarity_avg, 4),
+            "hit_similarity_min": round(self.hit_similarity_min if self.hits else 0.0, 4),
+        }
+
+
+class SemanticCache:
+    """
+    Answers keyed by prompt similarity, partitioned by namespace (one per agent).
+
+    By default an agent prompt is matched on its user input, but only against entries
+    whose normalized rest of the prompt (role, goal, tools and memory without the echo of
+    the current input, see `normalize_prompt`) is identical, so different conversations
+    never share answers.
+    A `key` function (e.g. `agent_query`) replaces this with a single text per prompt.
+    Identical texts hit without embedding; otherwise the text is embedded and the nearest
+    cached one in the same namespace and context is served if its cosine similarity is
+    at least `threshold`. Entries expire after `ttl_s`; beyond
+    `max_entries` the least recently used are evicted. `near_misses` counts misses within
+    `near_miss_margin` of the threshold, and `forgeai_semantic_cache_similarity` records
+    the best similarity of every lookup, which together show whether the threshold is
+    too strict or too loose.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        threshold: float = 0.9,
+        ttl_s: float | None = 3600.0,
+        max_entries: int = 10_000,
+        key: Callable[[str], str] | None = None,
+        normalizer: Callable[[str], str] = normalize_prompt,
+        near_miss_margin: float = 0.05,
+        use_numpy: bool | None = None,
+    ) -> None:
+        self.embedder: Embedder = embedder if embedder is not None else HashingEmbedder()
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.key = key
+        self.normalizer = normalizer
+        self.near_miss_margin = near_miss_margin
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise RuntimeError("numpy is not installed; pip install pyforgeai[semantic]")
+        self.stats = SemanticCacheStats()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._indexes: dict[
+            tuple[str, str], tuple[_PythonIndex | _NumpyIndex, list[CacheEntry]]
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def prepare(self, prompt: str) -> tuple[str, str]:
+        """The normalized text a prompt is matched on, and a digest of its context."""
+        if self.key is not None:
+            return self.normalizer(self.key(prompt)), ""
+        user = _USER_INPUT.search(prompt)
+        if user is None:
+            return self.normalizer(prompt), ""
+        query = user.group(1)
+        rest = _without_echo(prompt[: user.start(1)] + prompt[user.end(1) :], query)
+        rest = self.normalizer(rest)
+        return self.normalizer(query), hashlib.sha256(rest.encode()).hexdigest()
+
+    async def lookup(self, prompt: str, namespace: str = "default") -> CacheHit | None:
+        text, context = self.prepare(prompt)
+        hit, _ = await self._match(text, context, namespace)
+        return hit
+
+    async def store(self, prompt: str, response: str, namespace: str = "default") -> None:
+        text, context = self.prepare(prompt)
+        vector = (await self.embedder.embed([text]))[0]
+        self._insert(text, context, response, namespace, vector)
+
+    def invalidate(self, namespace: str | None = None) -> int:
+        """Drop every entry (or those of one namespace); returns how many were removed."""
+        doomed = [e for e in self._entries.values() if namespace in (None, e.namespace)]
+        for entry in doomed:
+            self._remove(entry)
+        return len(doomed)
+
+    def enable(self, agent: Agent, namespace: str | None = None) -> SemanticCacheProvider:
+        """Opt `agent` in: wrap its provider so its prompts use this cache."""
+        provider = SemanticCacheProvider(agent.provider, self, namespace or agent.name)
+        agent.provider = provider
+        return provider
+
+    async def _match(
+        self, text: str, context: str, namespace: str
+    ) -> tuple[CacheHit | None, Vector | None]:
+        self.stats.lookups += 1
+        entry = self._entries.get(self._key(namespace, context, text))
+        if entry is not None and self._live(entry):
+            return self._hit(entry, 1.0, exact=True), None
+
+        vector = (await self.embedder.embed([text]))[0]
+        best: CacheEntry | None = None
+        similarity = -1.0
+        if (namespace, context) in self._indexes:
+            index, rows = self._indexes[namespace, context]
+            row, similarity = index.best(vector)
+            best = rows[row] if row >= 0 else None
+        if best is not None and similarity >= self.threshold and self._live(best):
+            SEMANTIC_CACHE_SIMILARITY.observe(similarity, result="hit")
+            return self._hit(best, similarity, exact=False), vector
+
+        self.stats.misses += 1
+        CACHE_REQUESTS.inc(cache="semantic", result="miss")
+        if best is not None:
+            SEMANTIC_CACHE_SIMILARITY.observe(max(similarity, 0.0), result="miss")
+            if similarity >= self.threshold - self.near_miss_margin:
+                self.stats.near_misses += 1
+        return None, vector
+
+    def _hit(self, entry: CacheEntry, similarity: float, exact: bool) -> CacheHit:
+        entry.hits += 1
+        self._entries.move_to_end(entry.key)
+        self.stats.hits += 1
+        self.stats.exact_hits += exact
+        self.stats.hit_similarity_total += similarity
+        self.stats.hit_similarity_min = min(self.stats.hit_similarity_min, similarity)
+        CACHE_REQUESTS.inc(cache="semantic", result="hit")
+        return CacheHit(entry.response, similarity, entry.text, exact)
+
+    def _live(self, entry: CacheEntry) -> bool:
+        if entry.expires_at > time.time():
+            return True
+        self.stats.expired += 1
+        self._remove(entry)
+        return False
+
+    def _insert(
+        self, text: str, context: str, response: str, namespace: str, vector: Vector
+    ) -> None:
+        key = self._key(namespace, context, text)
+        if key in self._entries:
+            self._remove(self._entries[key])
+        now = time.time()
+        expires_at = now + self.ttl_s if self.ttl_s is not None else math.inf
+        entry = CacheEntry(key, namespace, text, response, now, expires_at, context)
+        if (namespace, context) not in self._indexes:
+            index = _NumpyIndex(len(vector)) if self.use_numpy else _PythonIndex()
+            self._indexes[namespace, context] = (index, [])
+        index, rows = self._indexes[namespace, context]
+        entry.row = index.add(vector)
+        rows.append(entry)
+        self._entries[key] = entry
+        self.stats.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries.values())))
+            self.stats.evictions += 1
+
+    def _remove(self, entry: CacheEntry) -> None:
+        self._entries.pop(entry.key, None)
+        index, rows = self._indexes[entry.namespace, entry.context]
+        last = rows.pop()
+        index.remove(entry.row)
+        if last is not entry:
+            rows[entry.row] = last
+            last.row = entry.row
+
+    @staticmethod
+    def _key(namespace: str, context: str, text: str) -> str:
+        return hashlib.sha256(f"{namespace}\0{context}\0{text}".encode()).hexdigest()
+
+
+class SemanticCacheProvider(BaseProvider):
+    """
+    Provider wrapper that answers from a `SemanticCache` before calling `provider`.
+
+    Fallback answers are never stored, and neither are tool follow-up prompts (they embed
+    fresh tool output) unless `cache_tool_results` is set.
+    """
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        cache: SemanticCache | None = None,
+        namespace: str = "default",
+        cache_tool_results: bool = False,
+    ) -> None:
+        self.provider = provider
+        self.cache = cache if cache is not None else SemanticCache()
+        self.namespace = namespace
+        self.cache_tool_results = cache_tool_results
+        self.model = str(getattr(provider, "model", ""))
+        self.last_hit: CacheHit | None = None
+
+    @property
+    def supports_embeddings(self) -> bool:  # type: ignore[override]
+        return self.provider.supports_embeddings
+
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        return await self.provider.embed(texts)
+
+    async def generate(self, prompt: str) -> str:
+        self.last_hit = None
+        if not self.cache_tool_results and TOOL_RESULT_MARKER in prompt:
+            self.cache.stats.skipped += 1
+            return await self.provider.generate(prompt)
+
+        text, context = self.cache.prepare(prompt)
+        hit, vector = await self.cache._match(text, context, self.namespace)
+        if hit is not None:
+            self.last_hit = hit
+            return hit.response
+
+        response = await self.provider.generate(prompt)
+        if FALLBACK_MARKER in response or not response.strip():
+            self.cache.stats.skipped += 1
+            return response
+        if vector is None:
+            vector = (await self.cache.embedder.embed([text]))[0]
+        self.cache._insert(text, context, response, self.namespace, vector)
+        return response
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"namespace": self.namespace, **self.cache.stats.snapshot()}
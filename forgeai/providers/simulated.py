@@ -0,0 +1,57 @@
+"""Simulated-latency provider for benchmarks and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+
+from forgeai.providers.base import BaseProvider
+
+
+class SimulatedProvider(BaseProvider):
+    """
+    Returns well-formed agent JSON after a configurable delay, without any network I/O.
+
+    Each call sleeps `latency_s` plus up to `jitter_s`. With probability `tool_call_rate`
+    a first-turn prompt gets a `tool_call` for `tool` instead of a final answer, so tool
+    round trips can be exercised. `output_chars` pads the thought to a realistic size.
+    """
+
+    def __init__(
+        self,
+        model: str = "simulated",
+        latency_s: float = 0.05,
+        jitter_s: float = 0.0,
+        tool_call_rate: float = 0.0,
+        tool: str = "python",
+        tool_input: str = "print(sum(range(10)))",
+        output_chars: int = 200,
+        seed: int | None = None,
+    ) -> None:
+        self.model = model
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.tool_call_rate = tool_call_rate
+        self.tool = tool
+        self.tool_input = tool_input
+        self.output_chars = output_chars
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        delay = self.latency_s + self._random.uniform(0.0, self.jitter_s)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        thought = ("Reasoning about the request. " * (self.output_chars // 29 + 1))[
+            : self.output_chars
+        ]
+        if "Tool result:" not in prompt and self._random.random() < self.tool_call_rate:
+            payload: dict[str, object] = {
+                "thought": thought,
+                "tool_call": {"tool": self.tool, "input": self.tool_input},
+            }
+        else:
+            payload = {"thought": thought, "final": f"FINAL: Simulated answer #{self.calls}"}
+        return json.dumps(payload)
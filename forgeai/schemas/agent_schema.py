@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import math
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ToolCall(BaseModel):
@@ -24,3 +25,42 @@ class AgentResponse(BaseModel):
     thought: str | None = Field(default=None, description="Optional reasoning summary.")
     tool_call: ToolCall | None = Field(default=None, description="Optional tool call.")
     final: str | None = Field(default=None, description="Final user-facing response.")
+    confidence: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Optional self-reported confidence in the response (0-1).",
+    )
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _coerce_confidence(cls, value: Any) -> float | None:
+        """
+        Keep a malformed confidence from invalidating the whole response.
+
+        Percentages (`95`) are scaled to 0-1, other out-of-range values are clamped, and
+        values that are not numbers are dropped.
+        """
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            number = float(str(value).strip().rstrip("%"))
+        except ValueError:
+            return None
+        if math.isnan(number):
+            return None
+        if 1.0 < number <= 100.0:
+            number /= 100.0
+        return min(max(number, 0.0), 1.0)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_legacy_tool(cls, data: Any) -> Any:
+        """Accept the legacy `{"tool": ..., "tool_input": ...}` shape as a `tool_call`."""
+        if not isinstance(data, dict) or "tool_call" in data:
+            return data
+        tool_name = data.get("tool")
+        tool_input = data.get("tool_input")
+        if tool_name and tool_input:
+            return {**data, "tool_call": {"tool": str(tool_name), "input": str(tool_input)}}
+        return data
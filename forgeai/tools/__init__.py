@@ -1,6 +1,29 @@
 """Tool primitives and built-in tool implementations."""
 
-from forgeai.tools.base import BaseTool
+from forgeai.tools.base import BaseTool, current_cancel_event
+from forgeai.tools.bulkhead import Bulkhead, ToolStats, tool_stats
+from forgeai.tools.compiler import CodeCache, CodeCacheStats, CodePolicy, CodeRejected
+from forgeai.tools.execution import ExecutionResult
+from forgeai.tools.namespaces import NamespaceStore, SessionConfig
+from forgeai.tools.output import OutputLimits
 from forgeai.tools.python_tool import PythonTool
+from forgeai.tools.sandbox import ProcessSandbox, SandboxLimits
 
-__all__ = ["BaseTool", "PythonTool"]
+__all__ = [
+    "BaseTool",
+    "Bulkhead",
+    "CodeCache",
+    "CodeCacheStats",
+    "CodePolicy",
+    "CodeRejected",
+    "ExecutionResult",
+    "NamespaceStore",
+    "OutputLimits",
+    "ProcessSandbox",
+    "PythonTool",
+    "SandboxLimits",
+    "SessionConfig",
+    "ToolStats",
+    "current_cancel_event",
+    "tool_stats",
+]
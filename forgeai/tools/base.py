@@ -2,20 +2,120 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
+
+from forgeai.deadline import DeadlineExceeded, check_deadline, current_deadline
+from forgeai.observability.registry import (
+    TOOL_CALLS,
+    TOOL_DURATION,
+    TOOL_IN_FLIGHT,
+    TOOL_QUEUE_WAIT,
+)
+from forgeai.tools.bulkhead import ToolStats, get_bulkhead, get_tool_stats
+
+_cancel_event: ContextVar[threading.Event | None] = ContextVar("forgeai_tool_cancel", default=None)
+
+
+def current_cancel_event() -> threading.Event | None:
+    """
+    Cancellation flag for the tool call running in this context, if invoked via `invoke`.
+
+    Only calls that can time out (a tool `timeout_s` or a run deadline) get a flag; it is
+    set when the call times out, is cancelled, or finishes. Work handed to threads
+    (`asyncio.to_thread` copies the context) should poll it and stop early.
+    """
+    return _cancel_event.get()
 
 
 class BaseTool(ABC):
-    """Abstract asynchronous interface for agent tools."""
+    """
+    Abstract asynchronous interface for agent tools.
+
+    Agents call tools through `invoke`, which applies the tool's declared `timeout_s` and
+    its `max_concurrency` bulkhead. The bulkhead is shared by every tool with the same
+    name on the event loop, so one slow tool type cannot take every worker thread.
+    """
 
     name: str
     description: str
+    timeout_s: float | None = None
+    max_concurrency: int | None = None
 
-    def __init__(self, name: str, description: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        timeout_s: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
         self.name = name
         self.description = description
+        if timeout_s is not None:
+            self.timeout_s = timeout_s
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+
+    @property
+    def stats(self) -> ToolStats:
+        """Process-wide stats shared by tools with this name."""
+        return get_tool_stats(self.name)
 
     @abstractmethod
     async def run(self, input: str) -> str:
         """Run the tool with a string input and return a string response."""
 
+    async def invoke(self, input: str) -> str:
+        """
+        Run the tool inside its bulkhead and timeout.
+
+        A timeout returns an error message the agent can react to; run deadlines raise
+        `DeadlineExceeded` as usual. The cancellation flag, when there is one, is set
+        either way.
+        """
+        check_deadline()
+        bulkhead = get_bulkhead(self.name, self.max_concurrency)
+        waited_ms = await bulkhead.acquire()
+        TOOL_QUEUE_WAIT.observe(waited_ms / 1000, tool=self.name)
+        TOOL_IN_FLIGHT.inc(tool=self.name)
+        # Without a timeout or deadline there is nothing to signal, and a flag would make
+        # thread-backed tools pay for polling it (PythonTool traces every line).
+        interruptible = self.timeout_s is not None or current_deadline() is not None
+        cancelled = threading.Event() if interruptible else None
+        token = _cancel_event.set(cancelled)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            async with asyncio.timeout(self.timeout_s) as scope:
+                result = await self.run(input)
+            outcome = "ok"
+            return result
+        except DeadlineExceeded:
+            bulkhead.stats.timeouts += 1
+            outcome = "timeout"
+            raise
+        except TimeoutError:
+            if not scope.expired():
+                bulkhead.stats.errors += 1
+                raise
+            bulkhead.stats.timeouts += 1
+            outcome = "timeout"
+            return f"Tool '{self.name}' timed out after {self.timeout_s:.2f}s."
+        except asyncio.CancelledError:
+            bulkhead.stats.cancellations += 1
+            outcome = "cancelled"
+            raise
+        except Exception:
+            bulkhead.stats.errors += 1
+            raise
+        finally:
+            if cancelled is not None:
+                cancelled.set()
+            _cancel_event.reset(token)
+            bulkhead.release()
+            TOOL_IN_FLIGHT.dec(tool=self.name)
+            TOOL_DURATION.observe(time.perf_counter() - started, tool=self.name)
+            TOOL_CALLS.inc(tool=self.name, outcome=outcome)
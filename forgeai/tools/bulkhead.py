@@ -0,0 +1,151 @@
+"""Process-wide concurrency bulkheads and call statistics for tools."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ToolStats:
+    """Counters for one tool key; wait times measure queueing before the tool starts."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    cancellations: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    queue_wait_ms_total: float = 0.0
+    queue_wait_ms_max: float = 0.0
+
+    @property
+    def queue_wait_ms_avg(self) -> float:
+        return self.queue_wait_ms_total / self.calls if self.calls else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "cancellations": self.cancellations,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "queue_wait_ms_avg": round(self.queue_wait_ms_avg, 3),
+            "queue_wait_ms_max": round(self.queue_wait_ms_max, 3),
+        }
+
+
+class Bulkhead:
+    """
+    FIFO concurrency limit shared by every tool instance with the same key.
+
+    Waiters are futures on the caller's loop and the bulkhead is not thread-safe, so use
+    one bulkhead per event loop (`BulkheadRegistry` does this); several may share `stats`.
+    `limit=None` only records stats.
+    """
+
+    def __init__(self, limit: int | None = None, stats: ToolStats | None = None) -> None:
+        self.limit = limit
+        self.stats = stats if stats is not None else ToolStats()
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> float:
+        """Wait for a slot; return the time spent queueing in milliseconds."""
+        started = time.perf_counter()
+        if self.limit is None or (self._active < self.limit and not self._waiters):
+            self._active += 1
+            self.stats.in_flight += 1
+            return self._record_wait(started)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats.queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on.
+                self.release()
+            elif waiter in self._waiters:
+                # release() may already have popped and skipped this cancelled waiter.
+                self._waiters.remove(waiter)
+            raise
+        finally:
+            self.stats.queued -= 1
+        return self._record_wait(started)
+
+    def release(self) -> None:
+        # Hand the slot directly to the next waiter so in_flight never over-admits.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+        self.stats.in_flight -= 1
+
+    def _record_wait(self, started: float) -> float:
+        waited_ms = (time.perf_counter() - started) * 1000
+        self.stats.calls += 1
+        self.stats.queue_wait_ms_total += waited_ms
+        self.stats.queue_wait_ms_max = max(self.stats.queue_wait_ms_max, waited_ms)
+        return waited_ms
+
+
+class BulkheadRegistry:
+    """
+    Bulkheads by key, one per running event loop, with process-wide limits and stats.
+
+    A loop torn down with callers still queued (a finished `asyncio.run`, a worker
+    thread's loop) takes its bulkheads with it instead of leaving dead waiters behind, so
+    the limit applies per event loop while stats add up across loops.
+    """
+
+    def __init__(self) -> None:
+        self._limits: dict[str, int | None] = {}
+        self._stats: dict[str, ToolStats] = {}
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, Bulkhead]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(self, key: str, limit: int | None = None) -> Bulkhead:
+        """Return the running loop's bulkhead for `key`; the first declared limit wins."""
+        if self._limits.get(key) is None:
+            self._limits[key] = limit
+        bulkheads = self._loops.setdefault(asyncio.get_running_loop(), {})
+        bulkhead = bulkheads.get(key)
+        if bulkhead is None:
+            bulkhead = bulkheads[key] = Bulkhead(self._limits[key], self.stats(key))
+        else:
+            bulkhead.limit = self._limits[key]
+        return bulkhead
+
+    def stats(self, key: str) -> ToolStats:
+        """Process-wide stats for `key`."""
+        return self._stats.setdefault(key, ToolStats())
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {key: stats.snapshot() for key, stats in sorted(self._stats.items())}
+
+
+_tools = BulkheadRegistry()
+
+
+def get_bulkhead(key: str, limit: int | None = None) -> Bulkhead:
+    """Return the running loop's bulkhead for tool `key` (see `BulkheadRegistry`)."""
+    return _tools.get(key, limit)
+
+
+def get_tool_stats(key: str) -> ToolStats:
+    """Process-wide stats for tool `key`."""
+    return _tools.stats(key)
+
+
+def tool_stats() -> dict[str, dict[str, float]]:
+    """Snapshot of stats for every tool key used in this process."""
+    return _tools.snapshot()
@@ -0,0 +1,162 @@
+"""Validated, cached compilation of Python snippets."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import CodeType
+
+from forgeai.observability.registry import CACHE_REQUESTS
+
+SNIPPET_FILENAME = "<snippet>"
+
+
+class CodeRejected(ValueError):
+    """Raised when a snippet uses a construct the `CodePolicy` forbids."""
+
+    def __init__(self, reason: str, lineno: int | None = None) -> None:
+        location = f" (line {lineno})" if lineno is not None else ""
+        super().__init__(f"Code rejected: {reason}{location}")
+        self.reason = reason
+        self.lineno = lineno
+
+
+@dataclass(frozen=True, slots=True)
+class CodePolicy:
+    """
+    Constructs rejected before a snippet is scheduled.
+
+    This is a fail-fast filter for obviously unwanted code, not a security boundary; use
+    `ProcessSandbox` limits or an isolated runtime for untrusted input.
+    """
+
+    blocked_modules: frozenset[str] = frozenset(
+        {"ctypes", "importlib", "multiprocessing", "os", "shutil", "signal", "socket", "subprocess"}
+    )
+    blocked_calls: frozenset[str] = frozenset({"__import__", "compile", "eval", "exec"})
+    block_dunder_access: bool = True
+    allowed_dunders: frozenset[str] = frozenset({"__doc__", "__init__", "__name__"})
+
+    def validate(self, tree: ast.AST) -> None:
+        """Raise `CodeRejected` for the first disallowed construct in `tree`."""
+        for node in ast.walk(tree):
+            lineno = getattr(node, "lineno", None)
+            for module in _imported_modules(node):
+                if module.split(".")[0] in self.blocked_modules:
+                    raise CodeRejected(f"import of '{module}' is not allowed", lineno)
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id in self.blocked_calls
+            ):
+                raise CodeRejected(f"call to '{node.func.id}' is not allowed", lineno)
+            if self.block_dunder_access:
+                name = _accessed_name(node)
+                if name and _is_dunder(name) and name not in self.allowed_dunders:
+                    raise CodeRejected(f"access to '{name}' is not allowed", lineno)
+
+
+def _imported_modules(node: ast.AST) -> list[str]:
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+        return [node.module]
+    return []
+
+
+def _accessed_name(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _is_dunder(name: str) -> bool:
+    return len(name) > 4 and name.startswith("__") and name.endswith("__")
+
+
+@dataclass(slots=True)
+class CodeCacheStats:
+    """Compile cache counters; `compile_ms` is total time spent parsing and compiling."""
+
+    hits: int = 0
+    misses: int = 0
+    rejected: int = 0
+    evictions: int = 0
+    compile_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+            "compile_ms": round(self.compile_ms, 3),
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass(slots=True)
+class CodeCache:
+    """
+    Bounded LRU of compiled code objects keyed by the SHA-256 of the source.
+
+    Sources are parsed once, checked against `policy` if one is set (opt-in, e.g.
+    `CodeCache(policy=CodePolicy())`), and compiled from the same tree. Rejections are cached
+    as well, so a resent bad snippet fails without reparsing.
+    """
+
+    max_entries: int = 256
+    policy: CodePolicy | None = None
+    stats: CodeCacheStats = field(default_factory=CodeCacheStats)
+    _entries: OrderedDict[str, CodeType | CodeRejected] = field(default_factory=OrderedDict)
+
+    def compile(self, source: str) -> CodeType:
+        """Return the compiled snippet; raise `CodeRejected` or `SyntaxError` if invalid."""
+        key = hashlib.sha256(source.encode()).hexdigest()
+        cached = self._entries.get(key)
+        CACHE_REQUESTS.inc(cache="python_code", result="miss" if cached is None else "hit")
+        if cached is not None:
+            self._entries.move_to_end(key)
+            if isinstance(cached, CodeRejected):
+                self.stats.rejected += 1
+                raise CodeRejected(cached.reason, cached.lineno)
+            self.stats.hits += 1
+            return cached
+
+        self.stats.misses += 1
+        started = time.perf_counter()
+        try:
+            tree = ast.parse(source, SNIPPET_FILENAME, "exec")
+            if self.policy is not None:
+                self.policy.validate(tree)
+            code = compile(tree, SNIPPET_FILENAME, "exec")
+        except CodeRejected as exc:
+            self.stats.rejected += 1
+            self._store(key, CodeRejected(exc.reason, exc.lineno))
+            raise
+        finally:
+            self.stats.compile_ms += (time.perf_counter() - started) * 1000
+        self._store(key, code)
+        return code
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: str, value: CodeType | CodeRejected) -> None:
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
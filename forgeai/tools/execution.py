@@ -0,0 +1,160 @@
+"""Snippet execution with per-execution output capture, shared by thread and process backends."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, TextIO
+
+from forgeai.deadline import DeadlineExceeded
+from forgeai.tools.output import BoundedOutput, OutputLimits, digest_header
+
+
+@dataclass(slots=True)
+class ExecutionResult:
+    """
+    Captured outcome of one snippet execution.
+
+    `stdout` holds the bounded capture; when `truncated`, `stdout_chars`/`stdout_lines`
+    describe the full stream and `spill_path` points at its complete copy, if spilled.
+    """
+
+    stdout: str = ""
+    stderr: str = ""
+    error: str | None = None
+    timed_out: bool = False
+    duration_ms: float = 0.0
+    notice: str | None = None
+    stdout_chars: int = 0
+    stdout_lines: int = 0
+    truncated: bool = False
+    spill_path: str | None = None
+
+    def render(self) -> str:
+        """Text returned to the agent: the traceback on error, otherwise stdout (+ stderr)."""
+        if self.error:
+            output = self.error.strip()
+        else:
+            parts = [self.stdout.strip()]
+            if self.truncated:
+                header = digest_header(self.stdout_chars, self.stdout_lines, self.spill_path)
+                parts.insert(0, header)
+            if self.stderr.strip():
+                parts.append(f"stderr:\n{self.stderr.strip()}")
+            output = "\n".join(part for part in parts if part)
+            output = output or "Execution completed with no output."
+        if self.notice:
+            output = f"{output}\n[{self.notice}]"
+        return output
+
+
+class _CaptureRouter:
+    """Stream proxy that routes writes to the current thread's capture buffer, if any."""
+
+    def __init__(self, stream: TextIO, local: threading.local, attr: str) -> None:
+        self._stream = stream
+        self._local = local
+        self._attr = attr
+
+    def write(self, text: str) -> int:
+        target: BoundedOutput | None = getattr(self._local, self._attr, None)
+        if target is not None:
+            return target.write(text)
+        return self._stream.write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, self._attr, None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_active = 0
+
+
+def _install_routers() -> None:
+    global _active
+    # Re-checked on every execution because test runners and servers may swap the streams.
+    with _install_lock:
+        _active += 1
+        if not isinstance(sys.stdout, _CaptureRouter):
+            sys.stdout = _CaptureRouter(sys.stdout, _local, "stdout")
+        if not isinstance(sys.stderr, _CaptureRouter):
+            sys.stderr = _CaptureRouter(sys.stderr, _local, "stderr")
+
+
+def _remove_routers() -> None:
+    """Put the original streams back once no execution is capturing."""
+    global _active
+    with _install_lock:
+        _active -= 1
+        if _active:
+            return
+        if isinstance(sys.stdout, _CaptureRouter):
+            sys.stdout = sys.stdout._stream
+        if isinstance(sys.stderr, _CaptureRouter):
+            sys.stderr = sys.stderr._stream
+
+
+def execute_snippet(
+    code: str | Any,
+    namespace: dict[str, Any] | None = None,
+    cancelled: threading.Event | None = None,
+    output: OutputLimits | None = None,
+) -> ExecutionResult:
+    """
+    Execute source or a code object, capturing stdout/stderr for this thread only.
+
+    Other threads keep writing to the real streams, so concurrent executions and logging
+    do not interleave. With `cancelled`, execution is interrupted between Python lines once
+    the event is set. Captured output is bounded by `output` (see `OutputLimits`).
+    """
+    _install_routers()
+    stdout = BoundedOutput(output)
+    stderr = BoundedOutput(output, spill=False)
+    scope = namespace if namespace is not None else {"__builtins__": __builtins__}
+    _local.stdout, _local.stderr = stdout, stderr
+    if cancelled is not None:
+        sys.settrace(_interrupt_when(cancelled))
+    started = time.perf_counter()
+    error: str | None = None
+    try:
+        exec(code, scope)
+    except Exception:  # noqa: BLE001
+        error = traceback.format_exc()
+    finally:
+        if cancelled is not None:
+            sys.settrace(None)
+        _local.stdout, _local.stderr = None, None
+        _remove_routers()
+        stdout.close()
+    return ExecutionResult(
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        error=error,
+        duration_ms=(time.perf_counter() - started) * 1000,
+        stdout_chars=stdout.chars,
+        stdout_lines=stdout.lines,
+        truncated=stdout.truncated,
+        spill_path=stdout.spill_path,
+    )
+
+
+def _interrupt_when(cancelled: threading.Event) -> Callable[[FrameType, str, Any], Any]:
+    """Trace function that aborts executing snippet frames once `cancelled` is set."""
+
+    def tracer(frame: FrameType, event: str, arg: Any) -> Any:
+        _ = (frame, event, arg)
+        if cancelled.is_set():
+            raise DeadlineExceeded("python execution cancelled")
+        return tracer
+
+    return tracer
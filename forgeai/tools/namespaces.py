@@ -0,0 +1,94 @@
+"""Persistent per-session namespaces for Python snippet execution."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class SessionConfig:
+    """Limits and warm-up for persistent session namespaces."""
+
+    max_sessions: int = 16
+    idle_ttl_s: float = 900.0
+    max_bytes: int | None = 256 * 1024 * 1024
+    preload: tuple[str, ...] = ()
+
+
+def approximate_size(namespace: dict[str, Any]) -> int:
+    """Cheap size estimate: top-level values plus the direct members of containers."""
+    total = 0
+    for name, value in namespace.items():
+        if name.startswith("__") or type(value).__name__ == "module":
+            continue
+        total += sys.getsizeof(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            total += sum(sys.getsizeof(item) for item in value)
+        elif isinstance(value, dict):
+            total += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return total
+
+
+class NamespaceStore:
+    """LRU of session namespaces with idle eviction, size caps, and preloaded modules."""
+
+    def __init__(self, config: SessionConfig | None = None) -> None:
+        self.config = config or SessionConfig()
+        self._sessions: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    def get(self, session_id: str) -> dict[str, Any]:
+        """Return the session namespace, creating (and preloading) it on first use."""
+        self.evict_idle()
+        entry = self._sessions.pop(session_id, None)
+        namespace = entry[0] if entry else self._new_namespace()
+        self._sessions[session_id] = (namespace, time.monotonic())
+        while len(self._sessions) > self.config.max_sessions:
+            self._sessions.popitem(last=False)
+        return namespace
+
+    def reset(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def evict_idle(self) -> list[str]:
+        cutoff = time.monotonic() - self.config.idle_ttl_s
+        expired = [sid for sid, (_, used_at) in self._sessions.items() if used_at < cutoff]
+        for session_id in expired:
+            del self._sessions[session_id]
+        return expired
+
+    def enforce_limit(self, session_id: str) -> str | None:
+        """Reset a namespace that outgrew `max_bytes`; return a notice when it does."""
+        entry = self._sessions.get(session_id)
+        if entry is None or self.config.max_bytes is None:
+            return None
+        size = approximate_size(entry[0])
+        if size <= self.config.max_bytes:
+            return None
+        self.reset(session_id)
+        return (
+            f"Session '{session_id}' namespace reached ~{size} bytes "
+            f"(limit {self.config.max_bytes}) and was reset."
+        )
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _new_namespace(self) -> dict[str, Any]:
+        namespace: dict[str, Any] = {"__builtins__": __builtins__, "__name__": "__session__"}
+        for spec in self.config.preload:
+            module_name, _, alias = (part.strip() for part in spec.partition(" as "))
+            module = importlib.import_module(module_name)
+            if alias:
+                namespace[alias] = module
+            else:
+                top_level = module_name.split(".")[0]
+                namespace[top_level] = sys.modules[top_level]
+        return namespace
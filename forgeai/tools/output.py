@@ -0,0 +1,139 @@
+"""Bounded capture and digests for large tool output."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TextIO
+
+SPILL_PREFIX = "forgeai-output-"
+
+
+@dataclass(frozen=True, slots=True)
+class OutputLimits:
+    """
+    How much captured output is kept in memory and shown to the agent.
+
+    Output beyond `head_chars + tail_chars` keeps only its first and last characters;
+    with `spill` enabled the full stream is written to a file in `spill_dir` (a
+    `forgeai-output` folder in the system temp directory by default). Each new spill prunes
+    that folder to the newest `spill_max_files` files, none older than `spill_max_age_s`.
+    """
+
+    head_chars: int = 4000
+    tail_chars: int = 2000
+    spill: bool = True
+    spill_dir: str | None = None
+    spill_max_files: int = 100
+    spill_max_age_s: float = 24 * 3600.0
+
+
+class BoundedOutput:
+    """Write-only text sink keeping the head and tail of a stream, spilling the rest."""
+
+    def __init__(self, limits: OutputLimits | None = None, spill: bool | None = None) -> None:
+        self.limits = limits or OutputLimits()
+        self._spill_enabled = self.limits.spill if spill is None else spill
+        self._head: list[str] = []
+        self._head_len = 0
+        self._tail = ""
+        self._spill_file: TextIO | None = None
+        self.spill_path: str | None = None
+        self.chars = 0
+        self.lines = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.chars > self.limits.head_chars + self.limits.tail_chars
+
+    def write(self, text: str) -> int:
+        written = len(text)
+        self.chars += written
+        self.lines += text.count("\n")
+        if self._spill_file is not None:
+            self._spill_file.write(text)
+
+        room = self.limits.head_chars - self._head_len
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_len += len(text[:room])
+            text = text[room:]
+        if not text:
+            return written
+
+        self._tail += text
+        if self.truncated:
+            if self._spill_enabled and self._spill_file is None:
+                # Nothing has been dropped yet, so head + tail is still the full stream.
+                self._open_spill()
+            keep = self.limits.tail_chars
+            if len(self._tail) > 2 * keep:
+                self._tail = self._tail[-keep:] if keep else ""
+        return written
+
+    def flush(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def getvalue(self) -> str:
+        head = "".join(self._head)
+        if not self.truncated:
+            return head + self._tail
+        tail = self._tail[-self.limits.tail_chars :] if self.limits.tail_chars else ""
+        omitted = self.chars - len(head) - len(tail)
+        return f"{head}\n... [{omitted} chars omitted] ...\n{tail}"
+
+    def _open_spill(self) -> None:
+        directory = self.limits.spill_dir or os.path.join(tempfile.gettempdir(), "forgeai-output")
+        os.makedirs(directory, exist_ok=True)
+        prune_spills(directory, self.limits.spill_max_files - 1, self.limits.spill_max_age_s)
+        handle, self.spill_path = tempfile.mkstemp(
+            prefix=SPILL_PREFIX, suffix=".txt", dir=directory
+        )
+        self._spill_file = os.fdopen(handle, "w", encoding="utf-8", errors="replace")
+        self._spill_file.write("".join(self._head) + self._tail)
+
+
+def prune_spills(directory: str, max_files: int, max_age_s: float) -> int:
+    """Delete spill files in `directory` beyond the newest `max_files` or older than `max_age_s`."""
+    spills: list[tuple[float, str]] = []
+    for name in os.listdir(directory):
+        if name.startswith(SPILL_PREFIX):
+            path = os.path.join(directory, name)
+            try:
+                spills.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+    spills.sort(reverse=True)
+    cutoff = time.time() - max_age_s
+    removed = 0
+    for index, (mtime, path) in enumerate(spills):
+        if index >= max_files or mtime < cutoff:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def digest_header(chars: int, lines: int, spill_path: str | None) -> str:
+    location = f"; full output saved to {spill_path}" if spill_path else ""
+    return f"[output truncated: {chars} chars, {lines} lines{location}]"
+
+
+def truncate_middle(text: str, max_chars: int) -> str:
+    """Keep the first two thirds and last third of `max_chars` when `text` is longer."""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    head = text[: max_chars * 2 // 3]
+    tail = text[len(text) - (max_chars - len(head)) :]
+    omitted = len(text) - len(head) - len(tail)
+    return f"{head}\n... [{omitted} chars omitted] ...\n{tail}"
@@ -3,35 +3,128 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import redirect_stdout
-from io import StringIO
+import threading
 import traceback
+from types import CodeType
 
-from forgeai.tools.base import BaseTool
+from forgeai.deadline import Deadline, DeadlineExceeded, current_deadline
+from forgeai.tools.base import BaseTool, current_cancel_event
+from forgeai.tools.compiler import CodeCache, CodeRejected
+from forgeai.tools.execution import ExecutionResult, execute_snippet
+from forgeai.tools.namespaces import NamespaceStore, SessionConfig
+from forgeai.tools.output import OutputLimits
+from forgeai.tools.sandbox import ProcessSandbox
 
 
 class PythonTool(BaseTool):
-    """Executes Python snippets in-process with best-effort output capture."""
+    """
+    Executes Python snippets with per-execution output capture.
 
-    def __init__(self) -> None:
+    By default snippets run in-process on a worker thread. Pass a `ProcessSandbox` to run
+    them in warm, resource-limited worker processes with hard timeouts instead.
+
+    With a `session_id`, variables and imports persist between calls (opt-in; give each
+    agent its own session). Session namespaces live in the sandbox worker, or in this
+    process for the thread backend, and follow `sessions` limits there.
+
+    Snippets are compiled through `code_cache` before anything is scheduled: repeated
+    sources reuse their code object, and syntax errors (or constructs rejected by an opt-in
+    `CodePolicy`) come back as errors without occupying a thread or worker.
+
+    Captured output is bounded by `output_limits`: oversized output is returned as a
+    digest (sizes plus first and last characters) and spilled in full to a file.
+    """
+
+    def __init__(
+        self,
+        sandbox: ProcessSandbox | None = None,
+        session_id: str | None = None,
+        sessions: SessionConfig | None = None,
+        code_cache: CodeCache | None = None,
+        output_limits: OutputLimits | None = None,
+        timeout_s: float | None = None,
+        max_concurrency: int | None = 4,
+    ) -> None:
         super().__init__(
             name="python",
             description="Execute Python code and return captured stdout or errors.",
+            timeout_s=timeout_s,
+            max_concurrency=max_concurrency,
         )
+        self.sandbox = sandbox
+        self.session_id = session_id
+        self.code_cache = code_cache if code_cache is not None else CodeCache()
+        self.output_limits = output_limits or OutputLimits()
+        self._namespaces = NamespaceStore(sessions)
+        self._session_lock = asyncio.Lock()
+
+    async def reset_session(self) -> None:
+        """Discard this tool's session namespace."""
+        if self.session_id is None:
+            return
+        if self.sandbox is not None:
+            await self.sandbox.reset_session(self.session_id)
+        else:
+            self._namespaces.reset(self.session_id)
 
     async def run(self, input: str) -> str:
-        """Run Python code asynchronously by offloading to a worker thread."""
-        return await asyncio.to_thread(self._execute, input)
+        """
+        Run Python code without blocking the event loop.
+
+        Under a run deadline, sandboxed executions are killed when the budget expires;
+        thread executions are interrupted between Python lines once the budget expires or
+        the call is cancelled or times out via `invoke` (blocking C calls cannot be
+        interrupted).
+        """
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+
+        try:
+            code = self.code_cache.compile(input)
+        except CodeRejected as exc:
+            return ExecutionResult(error=str(exc)).render()
+        except SyntaxError as exc:
+            return ExecutionResult(error="".join(traceback.format_exception_only(exc))).render()
+
+        if self.sandbox is not None:
+            timeout_s = deadline.remaining() if deadline is not None else None
+            result = await self.sandbox.execute(
+                code,
+                timeout_s=timeout_s,
+                session_id=self.session_id,
+                output=self.output_limits,
+            )
+            if result.timed_out and deadline is not None and deadline.expired:
+                raise DeadlineExceeded("python tool exceeded the run deadline")
+            return result.render()
+
+        if self.session_id is None:
+            return await self._run_in_thread(code, deadline)
+        async with self._session_lock:
+            return await self._run_in_thread(code, deadline)
+
+    async def _run_in_thread(self, code: CodeType, deadline: Deadline | None) -> str:
+        external = current_cancel_event()
+        if deadline is None and external is None:
+            # No way to be interrupted, so skip the per-line tracing cost.
+            return await asyncio.to_thread(self._execute, code)
 
-    @staticmethod
-    def _execute(code: str) -> str:
-        buffer = StringIO()
-        local_scope: dict[str, object] = {}
+        cancelled = external or threading.Event()
         try:
-            with redirect_stdout(buffer):
-                exec(code, {"__builtins__": __builtins__}, local_scope)
-            output = buffer.getvalue().strip()
-            return output or "Execution completed with no output."
-        except Exception:  # noqa: BLE001
-            return traceback.format_exc().strip()
+            return await asyncio.wait_for(
+                asyncio.to_thread(self._execute, code, cancelled),
+                timeout=deadline.remaining() if deadline is not None else None,
+            )
+        except TimeoutError as exc:
+            raise DeadlineExceeded("python tool exceeded the run deadline") from exc
+        finally:
+            cancelled.set()
 
+    def _execute(self, code: CodeType, cancelled: threading.Event | None = None) -> str:
+        if self.session_id is None:
+            return execute_snippet(code, cancelled=cancelled, output=self.output_limits).render()
+        namespace = self._namespaces.get(self.session_id)
+        result = execute_snippet(code, namespace, cancelled=cancelled, output=self.output_limits)
+        result.notice = self._namespaces.enforce_limit(self.session_id)
+        return result.render()
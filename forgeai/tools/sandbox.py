@@ -0,0 +1,295 @@
+"""Warm pool of sandboxed worker processes for Python snippet execution."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import marshal
+import multiprocessing
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from types import CodeType
+from typing import Any
+
+from forgeai.tools.execution import ExecutionResult, execute_snippet
+from forgeai.tools.namespaces import NamespaceStore, SessionConfig
+from forgeai.tools.output import OutputLimits
+
+
+@dataclass(slots=True)
+class SandboxLimits:
+    """Per-worker resource limits; `None` leaves a limit unset."""
+
+    cpu_seconds: int | None = 10
+    memory_bytes: int | None = 512 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class _Worker:
+    process: BaseProcess
+    conn: Connection
+    busy: bool = False
+    sessions: set[str] = field(default_factory=set)
+
+
+class ProcessSandbox:
+    """
+    Executes snippets in a pool of pre-started worker processes.
+
+    Each execution has a hard wall-clock timeout; a worker that times out, is cancelled,
+    or dies (for example on its CPU rlimit) is killed and replaced with a fresh warm one.
+    Workers import `preload` modules at startup and capture stdout/stderr per execution.
+
+    Executions with a `session_id` always go to the same worker, which keeps that
+    session's namespace alive between calls (see `SessionConfig`). A worker restart
+    loses the namespaces it held; the next result carries a notice when that happens.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout_s: float = 10.0,
+        limits: SandboxLimits | None = None,
+        preload: tuple[str, ...] = (),
+        sessions: SessionConfig | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        self.workers = workers
+        self.timeout_s = timeout_s
+        self.limits = limits or SandboxLimits()
+        self.preload = preload
+        self.sessions = sessions or SessionConfig()
+        self._ctx: Any = mp_context or multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        self._slots: list[_Worker] = []
+        self._bindings: dict[str, int] = {}
+        self._lost_sessions: set[str] = set()
+        self._available: asyncio.Condition | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self.restarts = 0
+
+    async def start(self) -> None:
+        """Start and warm up the worker processes."""
+        if self._available is not None:
+            return
+        self._available = asyncio.Condition()
+        self._slots = list(
+            await asyncio.gather(*(asyncio.to_thread(self._spawn) for _ in range(self.workers)))
+        )
+
+    async def execute(
+        self,
+        code: str | CodeType,
+        timeout_s: float | None = None,
+        session_id: str | None = None,
+        output: OutputLimits | None = None,
+    ) -> ExecutionResult:
+        """
+        Run a snippet in a worker, killing the worker if it overruns.
+
+        Code objects compiled in the parent (see `CodeCache`) are shipped marshalled, so
+        workers skip compilation. Output is bounded in the worker by `output`.
+        """
+        timeout = self.timeout_s if timeout_s is None else min(timeout_s, self.timeout_s)
+        payload = marshal.dumps(code) if isinstance(code, CodeType) else code
+        request = {"op": "exec", "code": payload, "session": session_id, "output": output}
+        result = await self._request(request, timeout)
+        if session_id is not None and session_id in self._lost_sessions:
+            self._lost_sessions.discard(session_id)
+            result.notice = "Session state was lost in a worker restart and started fresh."
+        return result
+
+    async def reset_session(self, session_id: str) -> None:
+        """Drop a session's namespace in its worker."""
+        if session_id in self._bindings:
+            await self._request({"op": "reset", "session": session_id}, self.timeout_s)
+            self._slots[self._bindings.pop(session_id)].sessions.discard(session_id)
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        for worker in self._slots:
+            self._kill(worker)
+        self._slots = []
+        self._bindings = {}
+        self._available = None
+
+    async def _request(self, request: dict[str, Any], timeout: float) -> ExecutionResult:
+        await self.start()
+        session_id: str | None = request.get("session")
+        index = await self._acquire(session_id)
+        worker = self._slots[index]
+        try:
+            worker.conn.send(request)
+            result: ExecutionResult = await self._receive(worker.conn, timeout)
+        except TimeoutError:
+            result = ExecutionResult(
+                error=f"Execution timed out after {timeout:.2f}s", timed_out=True
+            )
+        except (EOFError, OSError):
+            result = ExecutionResult(
+                error="Execution worker exited unexpectedly (resource limit exceeded?)"
+            )
+        except BaseException:
+            # Cancelled mid-request: the worker may still be running the snippet.
+            await asyncio.shield(self._track(self._replace(index, worker)))
+            raise
+        else:
+            await asyncio.shield(self._track(self._release(index)))
+            return result
+        await asyncio.shield(self._track(self._replace(index, worker)))
+        return result
+
+    async def _replace(self, index: int, worker: _Worker) -> None:
+        """Kill a worker and start a fresh one in its slot, freeing the slot either way."""
+        try:
+            self._kill(worker)
+            self._lost_sessions.update(worker.sessions)
+            # If spawning fails the dead worker stays in the slot; the next request on it
+            # fails to send and retries the replacement.
+            self._slots[index] = await asyncio.to_thread(self._spawn)
+            self.restarts += 1
+        finally:
+            await self._release(index)
+
+    def _track(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        # Keep shielded slot bookkeeping alive even if the caller is cancelled again.
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def _acquire(self, session_id: str | None) -> int:
+        assert self._available is not None
+        async with self._available:
+            while True:
+                index = self._pick(session_id)
+                if index is not None:
+                    worker = self._slots[index]
+                    worker.busy = True
+                    if session_id is not None:
+                        self._bindings[session_id] = index
+                        worker.sessions.add(session_id)
+                    return index
+                await self._available.wait()
+
+    def _pick(self, session_id: str | None) -> int | None:
+        if session_id is not None and session_id in self._bindings:
+            index = self._bindings[session_id]
+            return None if self._slots[index].busy else index
+        idle = [index for index, worker in enumerate(self._slots) if not worker.busy]
+        if not idle:
+            return None
+        # New sessions go to the idle worker holding the fewest namespaces.
+        return min(idle, key=lambda index: len(self._slots[index].sessions))
+
+    async def _release(self, index: int) -> None:
+        assert self._available is not None
+        async with self._available:
+            self._slots[index].busy = False
+            self._available.notify_all()
+
+    @staticmethod
+    async def _receive(conn: Connection, timeout: float) -> Any:
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[None] = loop.create_future()
+
+        def on_ready() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        try:
+            loop.add_reader(conn.fileno(), on_ready)
+        except NotImplementedError:
+            if not await asyncio.to_thread(conn.poll, timeout):
+                raise TimeoutError from None
+            return conn.recv()
+        try:
+            await asyncio.wait_for(ready, timeout)
+        finally:
+            loop.remove_reader(conn.fileno())
+        return conn.recv()
+
+    def _spawn(self) -> _Worker:
+        parent, child = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child, self.limits, self.preload, self.sessions),
+            name="forgeai-sandbox",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        # Block until the worker has applied limits and finished preloading.
+        parent.recv()
+        return _Worker(process=process, conn=parent)
+
+    @staticmethod
+    def _kill(worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(1.0)
+        worker.conn.close()
+
+
+def _apply_limits(limits: SandboxLimits) -> None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return
+    if limits.memory_bytes is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory_bytes, hard))
+
+
+def _arm_cpu_limit(limits: SandboxLimits) -> None:
+    """Allow `cpu_seconds` more CPU time for the next execution (RLIMIT_CPU is cumulative)."""
+    if limits.cpu_seconds is None:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + limits.cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(
+    conn: Connection,
+    limits: SandboxLimits,
+    preload: tuple[str, ...],
+    sessions: SessionConfig,
+) -> None:
+    _apply_limits(limits)
+    for module in preload:
+        importlib.import_module(module)
+    store = NamespaceStore(sessions)
+    conn.send("ready")
+    while True:
+        try:
+            request: dict[str, Any] = conn.recv()
+        except EOFError:
+            return
+        session_id: str | None = request.get("session")
+        if request["op"] == "reset":
+            if session_id is not None:
+                store.reset(session_id)
+            conn.send(ExecutionResult())
+            continue
+        namespace = store.get(session_id) if session_id is not None else None
+        _arm_cpu_limit(limits)
+        code = request["code"]
+        if isinstance(code, bytes):
+            code = marshal.loads(code)
+        result = execute_snippet(code, namespace, output=request.get("output"))
+        if session_id is not None:
+            result.notice = store.enforce_limit(session_id)
+        conn.send(result)
@@ -58,3 +58,27 @@ async def test_agent_handles_non_json_output() -> None:
 
     result = await agent.run("start")
     assert result == "plain text output"
+
+
+async def test_agent_parses_fenced_literal_and_legacy_shapes() -> None:
+    agent = Agent(
+        name="t3",
+        role="tester",
+        goal="parse",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=DummyProvider([]),
+    )
+
+    fenced = await agent.act('Here you go:\n```json\n{"final": "42", "confidence": 0.9}\n```')
+    literal = await agent.act("{'thought': 'quick', 'final': 'Paris'}")
+    legacy = await agent.act('{"tool": "echo", "tool_input": "hi"}')
+    percent = await agent.act('{"final": "the answer", "confidence": 95}')
+    unusable = await agent.act('{"final": "x", "confidence": "high"}')
+
+    assert (fenced.final, fenced.confidence) == ("42", 0.9)
+    assert literal.final == "Paris"
+    assert legacy.tool_call is not None
+    assert (legacy.tool_call.tool, legacy.tool_call.input) == ("echo", "hi")
+    assert (percent.final, percent.confidence) == ("the answer", 0.95)
+    assert (unusable.final, unusable.confidence) == ("x", None)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+
+from forgeai.bench import BenchConfig, percentile, run_benchmarks
+from forgeai.bench.__main__ import main
+from forgeai.providers.factory import create_provider
+from forgeai.providers.simulated import SimulatedProvider
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+async def test_simulated_provider_returns_agent_json() -> None:
+    provider = create_provider("simulated", latency_s=0.0, tool_call_rate=1.0, seed=1)
+    assert isinstance(provider, SimulatedProvider)
+
+    first = json.loads(await provider.generate("Task: add numbers"))
+    follow_up = json.loads(await provider.generate("Tool result: 45"))
+
+    assert first["tool_call"]["tool"] == "python"
+    assert follow_up["final"] == "FINAL: Simulated answer #2"
+
+
+async def test_run_benchmarks_reports_each_configuration() -> None:
+    config = BenchConfig(latency_s=0.0, jitter_s=0.0, concurrency=(1, 4), runs=20, quick=True)
+    report = await run_benchmarks(config, ["engine", "parse"])
+
+    names = [result["name"] for result in report["results"]]
+    assert names.count("engine.run") == 2
+    assert "agent.act" in names
+    assert report["meta"]["suites"] == ["engine", "parse"]
+    for result in report["results"]:
+        assert result["ops"] > 0
+        assert result["p50_ms"] <= result["p99_ms"]
+
+
+def test_cli_writes_json_report(tmp_path) -> None:
+    output = tmp_path / "bench.json"
+    code = main(
+        ["--suite", "memory", "--quick", "--memory-sizes", "20", "--output", str(output)]
+    )
+
+    assert code == 0
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["results"][0]["name"] == "memory.get_context"
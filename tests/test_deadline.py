@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.deadline import Deadline, DeadlineExceeded, deadline_scope, sleep_within_deadline
+from forgeai.engine.engine import Engine
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import BaseProvider
+from forgeai.tools.python_tool import PythonTool
+
+
+class SlowProvider(BaseProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        _ = prompt
+        self.calls += 1
+        await asyncio.sleep(5)
+        return '{"final":"too late"}'
+
+
+async def test_engine_cancels_run_at_deadline_without_retrying() -> None:
+    provider = SlowProvider()
+    agent = Agent(
+        name="slow",
+        role="tester",
+        goal="time out",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=provider,
+    )
+    engine = Engine(max_iterations=3, max_retries=2)
+
+    with pytest.raises(DeadlineExceeded):
+        await engine.run(agent, initial_input="go", deadline=0.1)
+    assert provider.calls == 1
+
+
+async def test_retry_backoff_refused_when_budget_is_short() -> None:
+    with deadline_scope(Deadline.after(0.05)):
+        with pytest.raises(DeadlineExceeded):
+            await sleep_within_deadline(1.0)
+
+
+async def test_python_tool_interrupts_runaway_snippet() -> None:
+    tool = PythonTool()
+    with deadline_scope(Deadline.after(0.2)):
+        with pytest.raises(DeadlineExceeded):
+            await tool.run("while True:\n    pass")
+    assert await tool.run("print('still usable')") == "still usable"
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.bench.loadgen import InProcessJobTarget, run_load
+from forgeai.engine.engine import Engine
+from forgeai.engine.jobs import JobManager
+from forgeai.engine.scheduler import QueueFull
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.simulated import SimulatedProvider
+
+
+def _agent(latency_s: float = 0.01) -> Agent:
+    return Agent(
+        name="job-agent",
+        role="tester",
+        goal="finish jobs",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=SimulatedProvider(latency_s=latency_s),
+    )
+
+
+async def test_submit_returns_immediately_and_result_can_be_polled() -> None:
+    manager = JobManager(max_concurrency=2)
+    engine = Engine(max_iterations=2, max_retries=0)
+
+    record = manager.submit(engine, _agent(), "hello")
+    assert record.status == "queued"
+
+    finished = await manager.wait(record.id, timeout_s=5)
+    assert finished is not None and finished.status == "done"
+    assert finished.result == "FINAL: Simulated answer #1"
+    assert manager.get(record.id) is finished
+    assert manager.pending == 0
+    await manager.close()
+
+
+async def test_full_queue_rejects_and_queued_jobs_can_be_cancelled() -> None:
+    manager = JobManager(max_concurrency=1, max_pending=2)
+    engine = Engine(max_iterations=1, max_retries=0)
+
+    running = manager.submit(engine, _agent(latency_s=0.2), "first")
+    queued = manager.submit(engine, _agent(latency_s=0.2), "second")
+    with pytest.raises(QueueFull):
+        manager.submit(engine, _agent(), "third")
+
+    assert manager.cancel(queued.id)
+    assert queued.status == "cancelled"
+    assert manager.pending == 1
+    await manager.wait(running.id, timeout_s=5)
+    assert running.status == "done"
+    assert manager.snapshot()["jobs"] == {
+        "queued": 0,
+        "running": 0,
+        "done": 1,
+        "failed": 0,
+        "cancelled": 1,
+    }
+    await manager.close()
+
+
+async def test_finished_job_is_posted_to_callback_url() -> None:
+    received: list[dict[str, object]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        manager = JobManager(callback_allowed_hosts=["127.0.0.1"])
+        url = f"http://127.0.0.1:{server.server_port}/done"
+        record = manager.submit(Engine(max_retries=0), _agent(), "hi", callback_url=url)
+        await manager.wait(record.id, timeout_s=5)
+        for _ in range(100):
+            if record.callback_status == "delivered":
+                break
+            await asyncio.sleep(0.02)
+        await manager.close()
+    finally:
+        server.shutdown()
+
+    assert record.callback_status == "delivered"
+    assert received[0]["job_id"] == record.id
+    assert received[0]["status"] == "done"
+
+    with pytest.raises(ValueError, match="http"):
+        JobManager().submit(Engine(), _agent(), "hi", callback_url="file:///etc/passwd")
+
+
+async def test_callbacks_to_non_public_hosts_are_refused(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = JobManager(callback_retries=0)
+    for url in (
+        "http://169.254.169.254/latest/meta-data",
+        "http://127.0.0.1:8000/done",
+        "http://10.0.0.7/done",
+        "http://[::ffff:192.168.1.1]/done",
+        "http://localhost/done",
+    ):
+        with pytest.raises(ValueError, match="not public"):
+            manager.submit(Engine(), _agent(), "hi", callback_url=url)
+
+    # A public-looking name that resolves to a private address fails at delivery.
+    def resolve(host: str, port: int, *args: object, **kwargs: object) -> list[tuple[object, ...]]:
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", resolve)
+    record = manager.submit(
+        Engine(max_retries=0), _agent(), "hi", callback_url="http://hooks.example.com/done"
+    )
+    await manager.wait(record.id, timeout_s=5)
+    for _ in range(100):
+        if record.callback_status != "pending":
+            break
+        await asyncio.sleep(0.02)
+    await manager.close()
+    assert record.callback_status == "failed"
+
+
+async def test_load_generator_finds_saturation_in_process() -> None:
+    manager = JobManager(max_concurrency=2, max_pending=4)
+    target = InProcessJobTarget(manager, latency_s=0.05)
+
+    report = await run_load(target, rates=[10.0, 400.0], duration_s=0.5, timeout_s=5)
+
+    light, heavy = report["steps"]
+    assert light["rejected"] == 0 and light["completed"] == light["sent"]
+    assert heavy["rejected"] > 0
+    assert report["saturation_rps"] is not None
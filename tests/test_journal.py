@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.engine.engine import Engine
+from forgeai.engine.journal import BaseRunJournal, FileRunJournal, SQLiteRunJournal
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import BaseProvider
+
+
+class ScriptedProvider(BaseProvider):
+    def __init__(self, outputs: list[str]) -> None:
+        self._outputs = outputs
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        _ = prompt
+        self.calls += 1
+        output = self._outputs.pop(0)
+        if output == "boom":
+            raise RuntimeError("transient failure")
+        return output
+
+
+def _agent(provider: BaseProvider) -> Agent:
+    return Agent(
+        name="journaled",
+        role="tester",
+        goal="resume",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=provider,
+    )
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+async def test_resume_replays_completed_iterations(tmp_path: Path, backend: str) -> None:
+    journal: BaseRunJournal
+    if backend == "file":
+        journal = FileRunJournal(tmp_path / "runs.jsonl")
+    else:
+        journal = SQLiteRunJournal(tmp_path / "runs.db")
+
+    first = ScriptedProvider(['{"final":"step one"}', "boom"])
+    engine = Engine(max_iterations=3, max_retries=0, journal=journal)
+    with pytest.raises(RuntimeError):
+        await engine.run(_agent(first), initial_input="go", run_id="run-1")
+
+    second = ScriptedProvider(['{"final":"step two"}', '{"final":"FINAL: done"}'])
+    agent = _agent(second)
+    result = await engine.resume(agent, "run-1")
+
+    assert result == "FINAL: done"
+    assert second.calls == 2
+    assert "step one" in await agent.memory.get_context("")
+    assert await engine.resume(_agent(ScriptedProvider([])), "run-1") == "FINAL: done"
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
+from forgeai.memory.blackboard import BlackboardMemory, VersionConflict
 from forgeai.memory.short_term import ShortTermMemory
 
 
@@ -23,3 +28,32 @@ async def test_short_term_memory_respects_max_entries() -> None:
     assert "one" not in context
     assert "two" in context
     assert "three" in context
+
+
+async def test_blackboard_compare_and_set_and_namespaces() -> None:
+    board = BlackboardMemory()
+    analyst = board.namespace("analyst")
+
+    first = await analyst.publish("draft", "v1", expected_version=0)
+    assert first.key == "analyst/draft" and first.version == 1
+    assert await analyst.compare_and_set("draft", "v2", expected_version=1)
+    assert not await analyst.compare_and_set("draft", "stale", expected_version=1)
+    with pytest.raises(VersionConflict):
+        await board.publish("analyst/draft", "stale", expected_version=0)
+
+    writer = board.namespace("writer")
+    entry = await writer.get("/analyst/draft")
+    assert entry is not None and entry.value == "v2"
+    assert "v2" in await writer.get_context("draft")
+
+
+async def test_blackboard_subscriptions_see_published_changes() -> None:
+    board = BlackboardMemory()
+    subscription = board.subscribe("research/")
+
+    await board.namespace("research").publish("facts", "sky is blue")
+    await board.publish("other/noise", "ignored")
+
+    entry = await asyncio.wait_for(subscription.get(), timeout=1)
+    assert entry.key == "research/facts"
+    subscription.close()
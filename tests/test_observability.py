@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import pstats
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.engine.engine import Engine
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.observability.logger import (
+    RateLimitFilter,
+    SamplingFilter,
+    get_logger,
+    log_event,
+    shutdown_logging,
+)
+from forgeai.observability.profiling import LoopLagMonitor, RunProfiler
+from forgeai.observability.registry import REGISTRY, MetricsRegistry
+from forgeai.observability.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    current_span,
+    set_tracer,
+    span,
+)
+from forgeai.providers.base import BaseProvider
+from forgeai.tools.base import BaseTool
+
+
+def test_lazy_payload_is_only_built_when_level_is_enabled() -> None:
+    stream = io.StringIO()
+    logger = get_logger("forgeai.test.lazy", level=logging.WARNING, stream=stream)
+    built: list[str] = []
+
+    def payload() -> dict[str, object]:
+        built.append("built")
+        return {"step": 1}
+
+    log_event(logger, logging.INFO, "engine_step_complete", payload)
+    assert built == []
+
+    log_event(logger, logging.WARNING, "engine_step_complete", payload)
+    assert built == ["built"]
+    assert json.loads(stream.getvalue())["extra"] == {"step": 1}
+
+
+def test_background_logger_writes_from_listener_thread() -> None:
+    stream = io.StringIO()
+    logger = get_logger("forgeai.test.background", background=True, stream=stream)
+    counter = {"value": 1}
+
+    log_event(logger, logging.INFO, "tick", lambda: dict(counter))
+    counter["value"] = 2  # payload was captured when the record was queued
+    shutdown_logging("forgeai.test.background")
+
+    record = json.loads(stream.getvalue())
+    assert record["message"] == "tick"
+    assert record["extra"] == {"value": 1}
+
+    # After shutdown the logger writes synchronously instead of queueing for no one.
+    logger.info("after")
+    assert json.loads(stream.getvalue().splitlines()[-1])["message"] == "after"
+
+
+def test_sampling_and_rate_limit_filters() -> None:
+    def record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+        return logging.LogRecord("forgeai", level, __file__, 1, message, None, None)
+
+    sampler = SamplingFilter({"noisy": 0.0}, seed=1)
+    assert not sampler.filter(record("noisy"))
+    assert sampler.filter(record("rare"))
+
+    limiter = RateLimitFilter(per_second=0.001, burst=2)
+    allowed = [limiter.filter(record("step")) for _ in range(5)]
+    assert allowed == [True, True, False, False, False]
+    assert limiter.filter(record("other"))
+    assert limiter.filter(record("step", logging.ERROR))
+    assert limiter.dropped == 3
+
+
+class ToolCallingProvider(BaseProvider):
+    async def generate(self, prompt: str) -> str:
+        if "Tool result" in prompt:
+            return '{"final":"done"}'
+        return '{"tool_call":{"tool":"threaded","input":"x"}}'
+
+
+class ThreadedTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(name="threaded", description="checks span propagation")
+
+    async def run(self, input: str) -> str:
+        def in_thread() -> str:
+            with span("tool.work"):
+                active = current_span()
+                return active.name if active else "none"
+
+        return await asyncio.to_thread(in_thread)
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    memory = InMemorySpanExporter()
+    set_tracer(Tracer(memory))
+    yield memory
+    set_tracer(None)
+
+
+async def test_engine_run_produces_nested_spans(exporter: InMemorySpanExporter) -> None:
+    agent = Agent(
+        name="traced",
+        role="tester",
+        goal="trace",
+        tools=[ThreadedTool()],
+        memory=ShortTermMemory(),
+        provider=ToolCallingProvider(),
+    )
+    await Engine(max_iterations=1, max_retries=0).run(agent, "go", run_id="run-1")
+
+    by_id = {s.span_id: s for s in exporter.spans}
+    (root,) = exporter.by_name("engine.run")
+    assert root.parent_id is None and root.attributes["run_id"] == "run-1"
+    assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+
+    def ancestry(name: str) -> list[str]:
+        (current,) = exporter.by_name(name)
+        names = []
+        while current.parent_id:
+            current = by_id[current.parent_id]
+            names.append(current.name)
+        return names
+
+    assert ancestry("tool.work") == [
+        "tool.run",
+        "agent.run",
+        "engine.iteration",
+        "engine.run",
+    ]
+    assert ancestry("memory.get_context")[:2] == ["agent.think", "agent.run"]
+    assert len(exporter.by_name("provider.generate")) == 2
+    assert len(exporter.by_name("agent.parse")) == 2
+    assert exporter.by_name("tool.run")[0].attributes["output_chars"] == len("tool.work")
+
+
+def test_file_exporter_writes_one_otlp_document_per_trace(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(FileSpanExporter(path, service_name="svc"))
+    with pytest.raises(ValueError):
+        with tracer.span("root", tenant="a"):
+            with tracer.span("child"):
+                raise ValueError("boom")
+
+    tracer.exporter.shutdown()
+    (line,) = path.read_text().splitlines()
+    resource = json.loads(line)["resourceSpans"][0]
+    assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "svc"}
+    child, root = resource["scopeSpans"][0]["spans"]
+    assert child["parentSpanId"] == root["spanId"]
+    assert root["attributes"] == [{"key": "tenant", "value": {"stringValue": "a"}}]
+    assert root["status"] == {"code": 2, "message": "ValueError: boom"}
+
+
+def test_registry_renders_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("jobs_total", "Jobs seen.", ("queue",))
+    depth = registry.gauge("depth", "Queue depth.")
+    latency = registry.histogram("latency_seconds", "Latency.", ("queue",), buckets=(0.1, 1.0))
+
+    requests.inc(queue='a"b')
+    requests.inc(2, queue='a"b')
+    depth.set(3)
+    latency.observe(0.05, queue="q")
+    latency.observe(0.5, queue="q")
+    assert registry.counter("jobs_total", "Jobs seen.", ("queue",)) is requests
+
+    assert registry.render().splitlines() == [
+        "# HELP depth Queue depth.",
+        "# TYPE depth gauge",
+        "depth 3",
+        "# HELP jobs_total Jobs seen.",
+        "# TYPE jobs_total counter",
+        'jobs_total{queue="a\\"b"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{queue="q",le="0.1"} 1',
+        'latency_seconds_bucket{queue="q",le="1"} 2',
+        'latency_seconds_bucket{queue="q",le="+Inf"} 2',
+        'latency_seconds_sum{queue="q"} 0.55',
+        'latency_seconds_count{queue="q"} 2',
+    ]
+
+
+async def test_agent_runs_record_labelled_process_metrics() -> None:
+    agent = Agent(
+        name="metered",
+        role="tester",
+        goal="meter",
+        tools=[ThreadedTool()],
+        memory=ShortTermMemory(),
+        provider=ToolCallingProvider(),
+    )
+    provider_calls = REGISTRY.counter(
+        "forgeai_provider_requests_total", "", ("provider", "model", "agent", "outcome")
+    ).labels(provider="ToolCallingProvider", model="", agent="metered", outcome="ok")
+    before = provider_calls.value
+
+    await Engine(max_iterations=1, max_retries=0).run(agent, "go")
+
+    assert provider_calls.value == before + 2
+    text = REGISTRY.render()
+    assert 'forgeai_tool_calls_total{tool="threaded",outcome="ok"}' in text
+    assert 'forgeai_engine_runs_in_flight{agent="metered"} 0' in text
+
+
+async def test_loop_lag_monitor_reports_blocking_code_with_its_stack() -> None:
+    def blocking_scorer() -> None:
+        time.sleep(0.3)
+
+    async with LoopLagMonitor(interval_s=0.02, threshold_ms=100) as monitor:
+        await asyncio.sleep(0.05)
+        blocking_scorer()
+        await asyncio.sleep(0.05)
+
+    assert monitor.stalls == 1
+    assert monitor.max_lag_ms >= 200
+    assert any("blocking_scorer" in stack for stack in monitor.stacks)
+
+
+async def test_run_profiler_saves_only_slow_runs(tmp_path: Path) -> None:
+    class SlowProvider(BaseProvider):
+        async def generate(self, prompt: str) -> str:
+            if "slow" in prompt:
+                await asyncio.sleep(0.1)
+            return '{"final":"ok"}'
+
+    profiler = RunProfiler(tmp_path, slow_threshold_s=0.05)
+    engine = Engine(max_iterations=1, max_retries=0, profiler=profiler)
+    agent = Agent("profiled", "tester", "profile", [], ShortTermMemory(), SlowProvider())
+
+    await engine.run(agent, "fast", run_id="fast-run")
+    await engine.run(agent, "slow", run_id="slow/run")
+
+    assert profiler.saved == [tmp_path / "slow_run.prof"]
+    assert pstats.Stats(str(profiler.saved[0])).total_calls > 0
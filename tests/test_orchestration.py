@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.orchestration.cascade import CascadeProvider, ConfidenceValidator, SchemaValidator
+from forgeai.orchestration.chunking import split_sections
+from forgeai.orchestration.graph import AgentGraph, NodeFailed
+from forgeai.orchestration.map_reduce import MapReduceTeam
+from forgeai.orchestration.pipeline import PipelineTeam
+from forgeai.orchestration.team import AgentTeam
+from forgeai.providers.base import BaseProvider
+
+
+class TaggingProvider(BaseProvider):
+    def __init__(self, tag: str, delay: float = 0.05, fail: bool = False) -> None:
+        self.tag = tag
+        self.delay = delay
+        self.fail = fail
+
+    async def generate(self, prompt: str) -> str:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.tag} failed")
+        user_input = prompt.split("User Input: ", 1)[1].split("\nAvailable Tools", 1)[0]
+        return f"{self.tag}({user_input.replace(chr(10), ' | ')})"
+
+
+def _agent(name: str, fail: bool = False) -> Agent:
+    return Agent(
+        name=name,
+        role="tester",
+        goal="transform input",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=TaggingProvider(name, fail=fail),
+    )
+
+
+async def test_team_graph_mode_runs_independent_branches_concurrently() -> None:
+    agents = [_agent("research"), _agent("a"), _agent("b"), _agent("c"), _agent("writer")]
+    team = AgentTeam(
+        agents,
+        inputs={
+            "a": ["research"],
+            "b": ["research"],
+            "c": ["research"],
+            "writer": ["a", "b", "c"],
+        },
+    )
+
+    started = time.perf_counter()
+    result = await team.run("topic")
+    elapsed = time.perf_counter() - started
+
+    assert result.startswith("writer(")
+    assert "a(research(topic))" in result and "c(research(topic))" in result
+    assert elapsed < 0.2
+
+
+async def test_graph_failure_policies() -> None:
+    def build(policy: str) -> AgentGraph:
+        graph = AgentGraph(failure_policy=policy)  # type: ignore[arg-type]
+        graph.add("root", _agent("root"))
+        graph.add("bad", _agent("bad", fail=True), inputs=["root"])
+        graph.add("good", _agent("good"), inputs=["root"])
+        graph.add("join", _agent("join"), inputs=["bad", "good"])
+        return graph
+
+    with pytest.raises(NodeFailed):
+        await build("fail_fast").run("x")
+
+    partial = await build("skip_dependents").run("x")
+    assert partial.skipped == {"join"} and "good" in partial.outputs
+
+    tolerant = await build("continue").run("x")
+    assert tolerant.output == "join(good(root(x)))"
+    assert set(tolerant.errors) == {"bad"}
+
+
+def test_graph_rejects_cycles() -> None:
+    graph = AgentGraph()
+    graph.add("a", _agent("a"), inputs=["b"]).add("b", _agent("b"), inputs=["a"])
+    with pytest.raises(ValueError):
+        graph.order()
+
+
+async def test_pipeline_overlaps_stages_and_preserves_order() -> None:
+    team = PipelineTeam(
+        [_agent("s1"), _agent("s2"), _agent("s3")],
+        chunker=lambda text: split_sections(text, max_chars=5),
+        buffer_size=1,
+    )
+    document = "\n\n".join(f"part{i}" for i in range(4))
+
+    started = time.perf_counter()
+    result = await team.run(document)
+    elapsed = time.perf_counter() - started
+
+    assert result.split("\n\n") == [f"s3(s2(s1(part{i})))" for i in range(4)]
+    # 4 sections x 3 stages x 50ms run serially would take 0.6s; pipelined ~0.3s.
+    assert elapsed < 0.45
+
+
+async def test_pipeline_join_last_runs_final_agent_once_on_all_sections() -> None:
+    team = PipelineTeam(
+        [_agent("s1"), _agent("s2")],
+        chunker=lambda text: split_sections(text, max_chars=5),
+        join_last=True,
+    )
+
+    result = await team.run("one\n\ntwo\n\nthree")
+
+    assert result == "s2(s1(one) |  | s1(two) |  | s1(three))"
+
+
+async def test_pipeline_surfaces_stage_failures() -> None:
+    team = PipelineTeam([_agent("s1"), _agent("s2", fail=True)])
+    with pytest.raises(RuntimeError, match="s2 failed"):
+        await team.run("one\n\ntwo")
+
+
+def test_split_sections_respects_max_chars() -> None:
+    sections = split_sections("a" * 25 + "\n\nbb\n\ncc", max_chars=10)
+    assert sections == ["a" * 10, "a" * 10, "aaaaa\n\nbb", "cc"]
+
+
+class LengthProvider(BaseProvider):
+    def __init__(self, padding: int = 0) -> None:
+        self.padding = padding
+        self.longest_prompt = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.longest_prompt = max(self.longest_prompt, len(prompt))
+        return f"summary:{len(prompt)}" + "x" * self.padding
+
+
+async def test_map_reduce_bounds_prompts_and_caches_chunks() -> None:
+    reducer_provider = LengthProvider()
+    mapper_provider = LengthProvider()
+
+    def reducer() -> Agent:
+        return Agent("reduce", "r", "reduce", [], ShortTermMemory(), reducer_provider)
+
+    team = MapReduceTeam(
+        mapper=lambda: Agent("map", "m", "map", [], ShortTermMemory(), mapper_provider),
+        reducer=reducer,
+        chunker=lambda text: split_sections(text, max_chars=20),
+        max_prompt_chars=400,
+    )
+    document = "\n\n".join(f"paragraph number {i:02d}" for i in range(12))
+
+    first = await team.run(document)
+    assert first.startswith("summary:")
+    assert team.last_map_calls == 12 and team.last_reduce_calls > 1
+    assert mapper_provider.longest_prompt <= 400
+    assert reducer_provider.longest_prompt <= 400
+
+    edited = document.replace("paragraph number 05", "paragraph number XX")
+    await team.run(edited)
+    assert team.last_map_calls == 1
+    assert team.last_cache_hits == 11
+
+
+async def test_map_reduce_truncates_oversized_partials() -> None:
+    reducer_provider = LengthProvider()
+    team = MapReduceTeam(
+        mapper=lambda: Agent("map", "m", "map", [], ShortTermMemory(), LengthProvider(500)),
+        reducer=lambda: Agent("reduce", "r", "reduce", [], ShortTermMemory(), reducer_provider),
+        chunker=lambda text: text.split("|"),
+        max_prompt_chars=600,
+    )
+    await team.run("a|b|c")
+    assert reducer_provider.longest_prompt <= 600
+    assert team.last_truncated > 0
+
+    tiny = MapReduceTeam(mapper=team.mapper, reducer=team.reducer, max_prompt_chars=100)
+    with pytest.raises(ValueError, match="leaves no room for input"):
+        await tiny.run("a")
+
+
+class FixedProvider(BaseProvider):
+    def __init__(self, output: str) -> None:
+        self.output = output
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        _ = prompt
+        self.calls += 1
+        return self.output
+
+
+async def test_cascade_escalates_only_failing_answers() -> None:
+    confident = FixedProvider('{"final":"easy","confidence":0.9}')
+    unsure = FixedProvider('{"final":"guess","confidence":0.2}')
+    big = FixedProvider('{"final":"expert"}')
+
+    easy = CascadeProvider([confident, big], [SchemaValidator(), ConfidenceValidator(0.7)])
+    assert "easy" in await easy.generate("q")
+    assert big.calls == 0
+
+    hard = CascadeProvider([unsure, big], [SchemaValidator(), ConfidenceValidator(0.7)])
+    assert "expert" in await hard.generate("q")
+    assert hard.stats.escalations == 1
+    assert hard.stats.escalation_rate == 1.0
+
+    malformed = CascadeProvider([FixedProvider("not json"), big])
+    assert "expert" in await malformed.generate("q")
+
+
+class BrokenProvider(BaseProvider):
+    async def generate(self, prompt: str) -> str:
+        raise ConnectionError("connection refused")
+
+
+async def test_cascade_escalates_fallbacks_and_errors() -> None:
+    offline = FixedProvider('{"thought":"Provider fallback active: down","final":"try later"}')
+    big = FixedProvider('{"final":"expert"}')
+    cascade = CascadeProvider([offline, BrokenProvider(), big])
+    assert "expert" in await cascade.generate("q")
+    assert cascade.stats.escalations == 2
+    assert cascade.stats.served_by_tier == {2: 1}
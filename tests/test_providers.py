@@ -1,8 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.deadline import Deadline, DeadlineExceeded, deadline_scope
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import FALLBACK_MARKER, BaseProvider, EmbeddingsUnavailable
+from forgeai.providers.embeddings import CachedEmbedder, EmbeddingCache
 from forgeai.providers.factory import create_provider
 from forgeai.providers.ollama_provider import OllamaProvider
 from forgeai.providers.openai_provider import OpenAIProvider
+from forgeai.providers.semantic_cache import (
+    SemanticCache,
+    SemanticCacheProvider,
+    agent_query,
+    normalize_prompt,
+    np,
+)
+
+needs_numpy = pytest.mark.skipif(np is None, reason="numpy not installed")
 
 
 def test_provider_factory_builds_expected_provider() -> None:
@@ -14,3 +36,273 @@ async def test_openai_provider_fallback_without_key() -> None:
     provider = OpenAIProvider(api_key=None)
     result = await provider.generate("hello")
     assert "final" in result
+
+
+class FakeOllamaClient:
+    def __init__(
+        self, loaded: list[str] | None = None, delay: float = 0.0, embed_failures: int = 0
+    ) -> None:
+        self.loaded = loaded or []
+        self.delay = delay
+        self.embed_failures = embed_failures
+        self.calls: list[dict[str, Any]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def chat(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if not kwargs["messages"]:
+            self.loaded.append(f"{kwargs['model']}:latest")
+            return {"message": {}, "load_duration": 2_500_000_000}
+        return {"message": {"content": " hi "}}
+
+    async def ps(self) -> dict[str, Any]:
+        return {"models": [{"model": name} for name in self.loaded]}
+
+    async def embed(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if self.embed_failures:
+            self.embed_failures -= 1
+            raise ConnectionError("embed failed")
+        return {"embeddings": [[float(len(text)), 0.5] for text in kwargs["input"]]}
+
+
+async def test_ollama_sends_keep_alive_and_options() -> None:
+    client = FakeOllamaClient()
+    provider = OllamaProvider(
+        model="qwen3",
+        host="http://ollama-options",
+        keep_alive="30m",
+        options={"temperature": 0.1},
+        num_ctx=8192,
+        num_predict=256,
+        client=client,
+    )
+
+    assert await provider.generate("hello") == "hi"
+    assert client.calls[0]["keep_alive"] == "30m"
+    assert client.calls[0]["options"] == {"temperature": 0.1, "num_ctx": 8192, "num_predict": 256}
+
+
+async def test_ollama_concurrency_limit_is_shared_per_host() -> None:
+    client = FakeOllamaClient(delay=0.02)
+    providers = [
+        OllamaProvider(host="http://ollama-slots", max_concurrency=2, client=client)
+        for _ in range(3)
+    ]
+
+    await asyncio.gather(*(provider.generate("x") for provider in providers * 2))
+
+    assert client.peak == 2
+    assert providers[0].slots.stats.calls == 6
+
+
+async def test_ollama_slot_wait_counts_against_the_deadline() -> None:
+    client = FakeOllamaClient(delay=1.0)
+    busy = OllamaProvider(host="http://ollama-queue", max_concurrency=1, client=client)
+    queued = OllamaProvider(host="http://ollama-queue", max_concurrency=1, client=client)
+    running = asyncio.create_task(busy.generate("first"))
+    await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    with deadline_scope(Deadline.after(0.2)), pytest.raises(DeadlineExceeded):
+        await queued.generate("second")
+
+    assert time.perf_counter() - started < 0.6
+    assert len(client.calls) == 1
+    running.cancel()
+
+
+async def test_ollama_warmup_and_readiness_probe() -> None:
+    client = FakeOllamaClient()
+    provider = OllamaProvider(model="llama3.1", host="http://ollama-warm", client=client)
+
+    assert (await provider.health())["ready"] is False
+    warmup = await provider.warmup()
+    health = await provider.health()
+
+    assert warmup["ready"] is True and warmup["load_ms"] == 2500.0
+    assert client.calls[0]["messages"] == []
+    assert health["reachable"] is True and health["ready"] is True
+
+
+async def test_ollama_embed_batches_and_keeps_order() -> None:
+    client = FakeOllamaClient()
+    provider = OllamaProvider(host="http://ollama-embed", embed_batch_size=2, client=client)
+
+    vectors = await provider.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert [len(call["input"]) for call in client.calls] == [2, 2, 1]
+    assert client.calls[0]["model"] == "nomic-embed-text"
+
+
+async def test_ollama_embed_bounds_batches_and_frees_slot_during_backoff() -> None:
+    client = FakeOllamaClient(delay=0.01)
+    provider = OllamaProvider(
+        host="http://ollama-embed-limit", embed_batch_size=1, embed_concurrency=2, client=client
+    )
+    await provider.embed(["a", "b", "c", "d", "e", "f"])
+    assert client.peak == 2
+
+    client = FakeOllamaClient(delay=0.01, embed_failures=1)
+    provider = OllamaProvider(host="http://ollama-embed-retry", max_concurrency=1, client=client)
+    embedding = asyncio.create_task(provider.embed(["a", "bb"]))
+    await asyncio.sleep(0.05)
+
+    # The failed attempt is backing off without its slot, so chat is not blocked behind it.
+    assert await provider.generate("x") == "hi"
+    assert not embedding.done()
+    assert len(await embedding) == 2
+
+
+async def test_embeddings_without_backend_raise() -> None:
+    with pytest.raises(EmbeddingsUnavailable):
+        await OpenAIProvider(api_key=None).embed(["hello"])
+    with pytest.raises(NotImplementedError):
+        await create_provider("simulated").embed(["hello"])
+
+
+async def test_cached_embedder_persists_and_dedupes(tmp_path: Path) -> None:
+    client = FakeOllamaClient()
+    provider = OllamaProvider(host="http://ollama-cache", client=client)
+    path = tmp_path / "embeddings.db"
+
+    first = CachedEmbedder(provider, EmbeddingCache(path))
+    vectors = await first.embed(["x", "yy", "x"])
+    second = CachedEmbedder(provider, EmbeddingCache(path))
+    again = await second.embed(["yy", "x"])
+
+    assert vectors == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert again == [[2.0, 0.5], [1.0, 0.5]]
+    assert [call["input"] for call in client.calls] == [["x", "yy"]]
+    assert (first.misses, second.hits) == (2, 2)
+
+
+class CountingProvider(BaseProvider):
+    def __init__(self, answer: str = '{"final": "cached answer"}') -> None:
+        self.answer = answer
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        return self.answer
+
+
+def test_normalize_prompt_masks_volatile_parts_and_sorts_memory() -> None:
+    first = "At 2024-05-01T10:00:00Z  ID 3f2a9c1e8b7d6a5f4e3d\nUser Input: hi\nMemory:\nb\na\n\nEnd"
+    second = "at 2025-01-09T23:59:59Z ID 0011223344556677aabb\nUser Input: HI\nMemory:\na\nb\n\nend"
+    assert normalize_prompt(first) == normalize_prompt(second)
+
+
+async def test_semantic_cache_keeps_dates_and_ids_in_user_input() -> None:
+    pairs = [
+        ("What happened on 2024-01-05?", "What happened on 2024-03-17?"),
+        ("Where is order 1234567890123456?", "Where is order 9876543210987654?"),
+    ]
+    for first, second in pairs:
+        assert normalize_prompt(f"User Input: {first}") != normalize_prompt(f"User Input: {second}")
+        assert normalize_prompt(first) != normalize_prompt(second)
+
+        inner = CountingProvider()
+        provider = SemanticCacheProvider(inner, SemanticCache())
+        await provider.generate(f"Time: 10:00\nUser Input: {first}")
+        await provider.generate(f"Time: 11:30\nUser Input: {second}")
+        assert inner.calls == 2 and provider.last_hit is None
+
+
+@pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=needs_numpy)])
+async def test_semantic_cache_serves_near_duplicates_per_agent(use_numpy: bool) -> None:
+    cache = SemanticCache(threshold=0.8, use_numpy=use_numpy)
+    inner = CountingProvider()
+    agent = Agent(
+        name="support",
+        role="helpdesk",
+        goal="answer",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=inner,
+    )
+    provider = cache.enable(agent)
+
+    await provider.generate(await agent.think("How do I reset my password?"))
+    await provider.generate(await agent.think("how do I reset my  password please"))
+    assert inner.calls == 1
+    assert provider.last_hit is not None and 0.8 <= provider.last_hit.similarity < 1.0
+
+    await provider.generate(await agent.think("Where can I download my invoices?"))
+    assert inner.calls == 2
+    other = SemanticCacheProvider(inner, cache, namespace="billing")
+    await other.generate(await agent.think("How do I reset my password?"))
+    assert inner.calls == 3
+    assert cache.stats.snapshot()["hits"] == 1
+    assert cache.invalidate("billing") == 1 and len(cache) == 2
+
+
+async def test_semantic_cache_default_key_serves_paraphrases_from_agent_runs() -> None:
+    cache = SemanticCache()
+    inner = CountingProvider()
+    questions = ["How do I reset my password?", "how do I reset my password please?"]
+    for question in questions:
+        agent = Agent(
+            name="support",
+            role="helpdesk",
+            goal="answer",
+            tools=[],
+            memory=ShortTermMemory(),
+            provider=inner,
+        )
+        provider = cache.enable(agent)
+        assert await agent.run(question) == "cached answer"
+
+    # The run echoes each question into memory; that echo must not split the context.
+    assert inner.calls == 1
+    assert provider.last_hit is not None and not provider.last_hit.exact
+
+
+@pytest.mark.parametrize("key", [None, agent_query])
+async def test_semantic_cache_keeps_conversations_apart_unless_keyed_on_input(
+    key: Callable[[str], str] | None,
+) -> None:
+    cache = SemanticCache(key=key)
+    inner = CountingProvider()
+    providers = []
+    for user in ("alice", "bob"):
+        memory = ShortTermMemory()
+        await memory.add(f"user name is {user}")
+        await memory.add("user likes tea")
+        agent = Agent(
+            name="assistant", role="helper", goal="help", tools=[], memory=memory, provider=inner
+        )
+        providers.append((agent, cache.enable(agent)))
+
+    for agent, provider in providers:
+        await provider.generate(await agent.think("What is my name?"))
+
+    # By default memory is part of the key; `agent_query` shares answers across users.
+    assert inner.calls == (2 if key is None else 1)
+    agent, provider = providers[0]
+    await provider.generate(await agent.think("what is my name"))
+    assert provider.last_hit is not None
+
+
+async def test_semantic_cache_expires_and_skips_uncacheable() -> None:
+    cache = SemanticCache(ttl_s=0.0)
+    inner = CountingProvider()
+    provider = SemanticCacheProvider(inner, cache)
+    await provider.generate("User Input: status?")
+    await provider.generate("User Input: status?")
+    assert inner.calls == 2 and cache.stats.expired == 1
+
+    fallback = SemanticCacheProvider(CountingProvider(f"{FALLBACK_MARKER}: offline"))
+    await fallback.generate("User Input: hello")
+    await fallback.generate("prompt\n\nTool result:\n42\n")
+    assert len(fallback.cache) == 0 and fallback.cache.stats.skipped == 2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import BaseProvider
+from forgeai.providers.replay import CassetteMiss, RecordingProvider, ReplayProvider
+from forgeai.tools.base import BaseTool
+
+
+class ScriptedProvider(BaseProvider):
+    def __init__(self, outputs: list[str]) -> None:
+        self._outputs = outputs
+
+    async def generate(self, prompt: str) -> str:
+        _ = prompt
+        return self._outputs.pop(0)
+
+
+class EchoTool(BaseTool):
+    def __init__(self) -> None:
+        super().__init__(name="echo", description="echo tool")
+
+    async def run(self, input: str) -> str:
+        return f"echo:{input}"
+
+
+def _agent(provider: BaseProvider) -> Agent:
+    return Agent(
+        name="replayed",
+        role="tester",
+        goal="replay tool calls",
+        tools=[EchoTool()],
+        memory=ShortTermMemory(),
+        provider=provider,
+    )
+
+
+@pytest.mark.parametrize("name", ["calls.jsonl", "calls.jsonl.gz"])
+async def test_replay_serves_recorded_tool_call_flow(tmp_path: Path, name: str) -> None:
+    cassette = tmp_path / name
+    recorder = RecordingProvider(
+        ScriptedProvider(
+            [
+                '{"tool_call":{"tool":"echo","input":"hi"}}',
+                '{"final":"done"}',
+            ]
+        ),
+        cassette,
+    )
+    assert await _agent(recorder).run("start") == "done"
+
+    replay = ReplayProvider(cassette, strict=True)
+    agent = _agent(replay)
+    assert await agent.run("start") == "done"
+    assert agent.last_tool_calls == 1
+
+    with pytest.raises(CassetteMiss):
+        await replay.generate("never recorded")
+
+
+async def test_replay_applies_recorded_latency(tmp_path: Path) -> None:
+    cassette = tmp_path / "slow.jsonl"
+    cassette.write_text('{"key":"x","response":"ok","latency_ms":50}\n', encoding="utf-8")
+
+    fast = ReplayProvider(cassette)
+    started = time.perf_counter()
+    assert await fast.generate("anything") == "ok"
+    assert time.perf_counter() - started < 0.04
+
+    timed = ReplayProvider(cassette, latency="recorded")
+    started = time.perf_counter()
+    await timed.generate("anything")
+    assert time.perf_counter() - started >= 0.045
+
+    doubled = ReplayProvider(cassette, latency="recorded", speed=2.0)
+    started = time.perf_counter()
+    await doubled.generate("anything")
+    assert 0.02 <= time.perf_counter() - started < 0.045
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+
+from forgeai.agent.base import Agent
+from forgeai.engine.engine import Engine
+from forgeai.engine.scheduler import Priority, RunScheduler
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import BaseProvider
+
+
+class OrderedProvider(BaseProvider):
+    model = "sim"
+
+    def __init__(self, order: list[str], delay: float = 0.01) -> None:
+        self.order = order
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        tag = prompt.split("User Input: ", 1)[1].split("\n", 1)[0]
+        self.order.append(tag)
+        return f'{{"final":"FINAL: {tag}"}}'
+
+
+def _agent(provider: BaseProvider) -> Agent:
+    return Agent(
+        name="scheduled",
+        role="tester",
+        goal="be scheduled",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=provider,
+    )
+
+
+async def test_interactive_runs_jump_the_batch_queue() -> None:
+    order: list[str] = []
+    provider = OrderedProvider(order)
+    scheduler = RunScheduler(max_concurrency=1)
+    engine = Engine(max_iterations=1, max_retries=0)
+
+    batch = [
+        scheduler.submit(engine, _agent(provider), f"bulk-{i}", priority=Priority.BATCH)
+        for i in range(3)
+    ]
+    tasks = [asyncio.create_task(call) for call in batch]
+    await asyncio.sleep(0)
+    urgent = asyncio.create_task(
+        scheduler.submit(engine, _agent(provider), "urgent", priority=Priority.INTERACTIVE)
+    )
+    await asyncio.gather(*tasks, urgent)
+
+    assert order.index("urgent") <= 1
+    assert scheduler.snapshot()["completed"] == 4
+
+
+async def test_tenants_share_fairly_and_provider_cap_holds() -> None:
+    order: list[str] = []
+    provider = OrderedProvider(order)
+    scheduler = RunScheduler(max_concurrency=4, provider_limits={"OrderedProvider": 1})
+    engine = Engine(max_iterations=1, max_retries=0)
+
+    calls = [
+        scheduler.submit(engine, _agent(provider), f"a-{i}", tenant="a") for i in range(4)
+    ] + [scheduler.submit(engine, _agent(provider), f"b-{i}", tenant="b") for i in range(2)]
+    await asyncio.gather(*calls)
+
+    assert provider.peak == 1
+    assert [tag[0] for tag in order[:4]] in (list("abab"), list("baba"))
+    assert scheduler.queue_depth() == 0
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from forgeai.tools.base import BaseTool, current_cancel_event
+from forgeai.tools.bulkhead import Bulkhead, get_bulkhead
+from forgeai.tools.compiler import CodeCache, CodePolicy
+from forgeai.tools.execution import execute_snippet
+from forgeai.tools.namespaces import SessionConfig
+from forgeai.tools.output import BoundedOutput, OutputLimits
+from forgeai.tools.python_tool import PythonTool
+from forgeai.tools.sandbox import ProcessSandbox
+
+
+async def test_concurrent_thread_executions_capture_only_their_output() -> None:
+    tool = PythonTool()
+    snippet = "import time\nfor _ in range(20):\n    print('{tag}')\n    time.sleep(0.001)"
+
+    first, second = await asyncio.gather(
+        tool.run(snippet.format(tag="A")), tool.run(snippet.format(tag="B"))
+    )
+
+    assert set(first.split()) == {"A"}
+    assert set(second.split()) == {"B"}
+
+
+async def test_sandbox_kills_runaway_snippet_and_stays_warm() -> None:
+    sandbox = ProcessSandbox(workers=1, timeout_s=0.5)
+    tool = PythonTool(sandbox=sandbox)
+    try:
+        assert "timed out" in await tool.run("while True:\n    pass")
+        assert sandbox.restarts == 1
+        assert await tool.run("import sys\nprint('ok')\nprint('warn', file=sys.stderr)") == (
+            "ok\nstderr:\nwarn"
+        )
+    finally:
+        await sandbox.close()
+
+
+async def test_sandbox_frees_slot_when_respawn_or_request_is_interrupted() -> None:
+    sandbox = ProcessSandbox(workers=1, timeout_s=0.3)
+    try:
+        await sandbox.start()
+        spawn = sandbox._spawn
+
+        def broken_spawn() -> Any:
+            raise OSError("cannot start worker")
+
+        sandbox._spawn = broken_spawn  # type: ignore[method-assign]
+        with pytest.raises(OSError, match="cannot start worker"):
+            await sandbox.execute("while True:\n    pass")
+        sandbox._spawn = spawn  # type: ignore[method-assign]
+        # The dead worker is replaced on the next request instead of hanging the pool.
+        failed = await asyncio.wait_for(sandbox.execute("print(1)"), 10)
+        assert failed.error is not None
+        assert (await sandbox.execute("print(2)")).stdout == "2\n"
+
+        task = asyncio.create_task(sandbox.execute("import time\ntime.sleep(5)"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert (await asyncio.wait_for(sandbox.execute("print(3)"), 10)).stdout == "3\n"
+    finally:
+        await sandbox.close()
+
+
+def test_execute_snippet_restores_standard_streams() -> None:
+    before = (sys.stdout, sys.stderr)
+    assert execute_snippet("print('captured')").stdout == "captured\n"
+    assert (sys.stdout, sys.stderr) == before
+
+
+async def test_session_namespace_persists_with_preload_and_reset() -> None:
+    tool = PythonTool(session_id="analyst", sessions=SessionConfig(preload=("json",)))
+    await tool.run("rows = [1, 2, 3]")
+    assert await tool.run("print(json.dumps(sum(rows)))") == "6"
+
+    await tool.reset_session()
+    assert "NameError" in await tool.run("print(rows)")
+
+
+async def test_session_namespace_is_reset_when_over_memory_cap() -> None:
+    tool = PythonTool(session_id="big", sessions=SessionConfig(max_bytes=10_000))
+    output = await tool.run("blob = 'x' * 50_000")
+    assert "was reset" in output
+    assert "NameError" in await tool.run("print(len(blob))")
+
+
+async def test_sandbox_sessions_stick_to_their_worker() -> None:
+    sandbox = ProcessSandbox(workers=2, timeout_s=5)
+    first = PythonTool(sandbox=sandbox, session_id="a")
+    second = PythonTool(sandbox=sandbox, session_id="b")
+    try:
+        await asyncio.gather(first.run("value = 'from a'"), second.run("value = 'from b'"))
+        for _ in range(3):
+            assert await first.run("print(value)") == "from a"
+            assert await second.run("print(value)") == "from b"
+    finally:
+        await sandbox.close()
+
+
+async def test_compiled_snippets_are_cached_and_policy_rejects_before_running() -> None:
+    assert await PythonTool().run("import os\nprint(os.sep)") == "/"
+
+    tool = PythonTool(code_cache=CodeCache(policy=CodePolicy()))
+    assert await tool.run("print(6 * 7)") == "42"
+    assert await tool.run("print(6 * 7)") == "42"
+    assert (tool.code_cache.stats.hits, tool.code_cache.stats.misses) == (1, 1)
+
+    assert await tool.run("import subprocess") == (
+        "Code rejected: import of 'subprocess' is not allowed (line 1)"
+    )
+    assert "access to '__subclasses__'" in await tool.run("print(().__class__.__subclasses__())")
+    assert "SyntaxError" in await tool.run("print(")
+    assert tool.code_cache.stats.rejected == 2
+
+
+def test_code_cache_evicts_least_recently_used() -> None:
+    cache = CodeCache(max_entries=2, policy=CodePolicy(blocked_modules=frozenset()))
+    first = cache.compile("import os")
+    cache.compile("b = 2")
+    assert cache.compile("import os") is first
+    cache.compile("c = 3")
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.compile("import os") is first
+
+
+async def test_large_output_is_digested_and_spilled_in_full(tmp_path: Path) -> None:
+    limits = OutputLimits(head_chars=20, tail_chars=10, spill_dir=str(tmp_path))
+    tool = PythonTool(output_limits=limits)
+    output = await tool.run("for i in range(1000):\n    print(f'row {i:04d}')")
+
+    header, _, body = output.partition("\n")
+    assert header.startswith("[output truncated: 9000 chars, 1000 lines; full output saved to ")
+    assert body.startswith("row 0000\nrow 0001\nro\n... [8970 chars omitted]")
+    assert body.endswith("row 0999")
+    assert "chars omitted" in body
+    (spill_file,) = tmp_path.iterdir()
+    assert spill_file.read_text().splitlines()[500] == "row 0500"
+
+
+def test_spill_directory_is_pruned_by_count_and_age(tmp_path: Path) -> None:
+    stale = tmp_path / "forgeai-output-stale.txt"
+    stale.write_text("old")
+    os.utime(stale, (0, 0))
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("keep")
+    limits = OutputLimits(head_chars=2, tail_chars=2, spill_dir=str(tmp_path), spill_max_files=2)
+    for _ in range(3):
+        sink = BoundedOutput(limits)
+        sink.write("x" * 10)
+        sink.close()
+    spills = sorted(path.name for path in tmp_path.glob("forgeai-output-*"))
+    assert len(spills) == 2 and "forgeai-output-stale.txt" not in spills
+    assert unrelated.exists()
+
+
+class SlowTool(BaseTool):
+    def __init__(
+        self,
+        name: str,
+        delay_s: float,
+        timeout_s: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        super().__init__(name, "sleeps", timeout_s=timeout_s, max_concurrency=max_concurrency)
+        self.delay_s = delay_s
+        self.active = 0
+        self.peak = 0
+        self.flags: list[threading.Event | None] = []
+
+    async def run(self, input: str) -> str:
+        self.flags.append(current_cancel_event())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.active -= 1
+        return input
+
+
+async def test_bulkhead_is_shared_across_instances_and_records_queue_wait() -> None:
+    first = SlowTool("bulkhead-shared", 0.02, max_concurrency=1)
+    second = SlowTool("bulkhead-shared", 0.02, max_concurrency=1)
+
+    await asyncio.gather(*(tool.invoke("x") for tool in (first, second, first, second)))
+
+    assert first.peak == second.peak == 1
+    stats = first.stats
+    assert stats is second.stats
+    assert (stats.calls, stats.in_flight, stats.queued) == (4, 0, 0)
+    assert stats.queue_wait_ms_max >= 15
+
+
+async def test_bulkhead_release_after_waiter_cancelled_keeps_cancellation() -> None:
+    bulkhead = Bulkhead(1)
+    await bulkhead.acquire()
+    waiter = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    bulkhead.release()  # pops the cancelled waiter before its task resumes
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert (bulkhead.stats.in_flight, bulkhead.stats.queued) == (0, 0)
+
+
+def test_bulkhead_registry_is_per_event_loop() -> None:
+    tool = SlowTool("bulkhead-loops", 0.0, max_concurrency=1)
+
+    async def abandon() -> None:
+        # Hold the slot and leave a queued waiter behind when this loop is thrown away.
+        await get_bulkhead(tool.name, 1).acquire()
+        asyncio.get_running_loop().create_task(tool.invoke("queued"))
+        await asyncio.sleep(0)
+
+    old_loop = asyncio.new_event_loop()
+    old_loop.run_until_complete(abandon())
+    old_loop.close()
+
+    result = asyncio.run(asyncio.wait_for(tool.invoke("fresh"), timeout=1.0))
+
+    assert result == "fresh"
+    assert tool.stats.calls == 2
+
+
+async def test_invoke_timeout_returns_error_and_sets_cancel_flag() -> None:
+    tool = SlowTool("timeout-tool", 1.0, timeout_s=0.05)
+
+    assert await tool.invoke("x") == "Tool 'timeout-tool' timed out after 0.05s."
+    assert tool.stats.timeouts == 1
+    (flag,) = tool.flags
+    assert flag is not None and flag.is_set()
+
+    untimed = SlowTool("untimed-tool", 0.0)
+    await untimed.invoke("x")
+    assert untimed.flags == [None]
+
+
+async def test_python_thread_execution_stops_when_invoke_times_out() -> None:
+    tool = PythonTool(timeout_s=0.1)
+    tool.name = "python-timeout"
+
+    assert "timed out" in await tool.invoke("while True:\n    pass")
+    await asyncio.sleep(0.05)
+    assert await tool.invoke("print('free')") == "free"
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from forgeai.agent.base import Agent
+from forgeai.engine.job_queue import Job, SQLiteJobQueue
+from forgeai.engine.workers import JobFailed, WorkerPool
+from forgeai.memory.short_term import ShortTermMemory
+from forgeai.providers.base import BaseProvider
+
+
+class PidProvider(BaseProvider):
+    async def generate(self, prompt: str) -> str:
+        _ = prompt
+        return f'{{"final":"FINAL: pid {os.getpid()}"}}'
+
+
+def build_agent(name: str = "pooled") -> Agent:
+    if name == "broken":
+        raise ValueError("cannot build agent")
+    return Agent(
+        name=name,
+        role="tester",
+        goal="run in a worker",
+        tools=[],
+        memory=ShortTermMemory(),
+        provider=PidProvider(),
+    )
+
+
+async def test_worker_pool_runs_jobs_in_other_processes(tmp_path: Path) -> None:
+    pool = WorkerPool(queue=SQLiteJobQueue(tmp_path / "jobs.db"), workers=2)
+    await pool.start()
+    try:
+        job_ids = [await pool.submit(f"{__name__}:build_agent", "go") for _ in range(4)]
+        results = [await pool.result(job_id, timeout_s=30) for job_id in job_ids]
+        with pytest.raises(JobFailed):
+            await pool.run(f"{__name__}:build_agent", "go", name="broken")
+    finally:
+        await pool.stop(timeout_s=30)
+
+    assert all(result.startswith("FINAL: pid ") for result in results)
+    assert str(os.getpid()) not in {result.split()[-1] for result in results}
+
+
+def test_expired_leases_are_requeued(tmp_path: Path) -> None:
+    queue = SQLiteJobQueue(tmp_path / "jobs.db")
+    job_id = queue.put(Job(factory="mod:fn"))
+    claimed = queue.claim("dead-worker", lease_s=-1.0)
+    assert claimed is not None and claimed.id == job_id
+
+    assert queue.requeue_expired(max_attempts=2) == 1
+    assert queue.counts()["queued"] == 1
+
+
+def test_only_the_current_lease_holder_can_finish_a_job(tmp_path: Path) -> None:
+    queue = SQLiteJobQueue(tmp_path / "jobs.db")
+    job_id = queue.put(Job(factory="mod:fn"))
+    assert queue.claim("slow-worker", lease_s=-1.0) is not None
+    assert queue.complete(job_id, "slow-worker", "late") is False
+
+    queue.requeue_expired(max_attempts=3)
+    assert queue.claim("new-worker", lease_s=60.0) is not None
+    assert queue.complete(job_id, "slow-worker", "stale") is False
+    assert queue.fail(job_id, "slow-worker", "stale error") is False
+    assert queue.complete(job_id, "new-worker", "fresh") is True
+
+    job = queue.get(job_id)
+    assert job is not None and job.status == "done" and job.result == "fresh"
+    assert job.error is None